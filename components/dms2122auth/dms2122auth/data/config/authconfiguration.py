@@ -3,6 +3,7 @@
 
 from typing import Dict
 from dms2122common.data.config import ServiceConfiguration
+from dms2122common.data.db import StorageProfile
 
 
 class AuthConfiguration(ServiceConfiguration):
@@ -32,6 +33,9 @@ class AuthConfiguration(ServiceConfiguration):
         self.set_jws_secret('This JWS secret should be changed ASAP')
         self.set_jws_ttl(3600)
         self.set_authorized_api_keys([])
+        self.set_hash_workers(1)
+        self.set_provision_batch_size(500)
+        self.set_storage({})
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -49,6 +53,12 @@ class AuthConfiguration(ServiceConfiguration):
             self.set_jws_secret(values['jws_secret'])
         if 'jws_ttl' in values:
             self.set_jws_ttl(values['jws_ttl'])
+        if 'hash_workers' in values:
+            self.set_hash_workers(values['hash_workers'])
+        if 'provision_batch_size' in values:
+            self.set_provision_batch_size(values['provision_batch_size'])
+        if 'storage' in values:
+            self.set_storage(values['storage'])
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -70,6 +80,27 @@ class AuthConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_storage(self, storage: Dict) -> None:
+        """ Sets the storage profile configuration value.
+
+        Args:
+            - storage: A dictionary with the SQLite pragmas and connection pool sizing (see
+              `StorageProfile`). Missing values take their defaults.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['storage'] = StorageProfile.validate(storage or {})
+
+    def get_storage(self) -> Dict:
+        """ Gets the storage profile configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of storage.
+        """
+
+        return self._values['storage']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
@@ -129,3 +160,51 @@ class AuthConfiguration(ServiceConfiguration):
         """
 
         return int(self._values['jws_ttl'])
+
+    def set_hash_workers(self, hash_workers: int) -> None:
+        """ Sets the hash_workers configuration value.
+
+        Args:
+            - hash_workers: An integer with the number of processes hashing the passwords of
+              the bulk user provisioning (`1` hashes them in the calling process).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        hash_workers = int(hash_workers)
+        if hash_workers < 1:
+            raise ValueError('The number of hash workers must be a positive integer.')
+        self._values['hash_workers'] = hash_workers
+
+    def get_hash_workers(self) -> int:
+        """ Gets the hash_workers configuration value.
+
+        Returns:
+            - int: An integer with the value of hash_workers.
+        """
+
+        return int(self._values['hash_workers'])
+
+    def set_provision_batch_size(self, provision_batch_size: int) -> None:
+        """ Sets the provision_batch_size configuration value.
+
+        Args:
+            - provision_batch_size: An integer with the number of users inserted in each
+              transaction by the bulk user provisioning.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        provision_batch_size = int(provision_batch_size)
+        if provision_batch_size < 1:
+            raise ValueError('The provision batch size must be a positive integer.')
+        self._values['provision_batch_size'] = provision_batch_size
+
+    def get_provision_batch_size(self) -> int:
+        """ Gets the provision_batch_size configuration value.
+
+        Returns:
+            - int: An integer with the value of provision_batch_size.
+        """
+
+        return int(self._values['provision_batch_size'])
@@ -3,3 +3,4 @@
 
 from .user import User
 from .userrole import UserRole
+from .schemaversion import SchemaVersion
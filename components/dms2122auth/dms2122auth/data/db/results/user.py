@@ -2,7 +2,7 @@
 """
 
 from typing import Dict
-from sqlalchemy import Table, MetaData, Column, String  # type: ignore
+from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
 from sqlalchemy.orm import relationship  # type: ignore
 from dms2122auth.data.db.results.resultbase import ResultBase
 from dms2122auth.data.db.results.userrole import UserRole
@@ -10,6 +10,9 @@ from dms2122auth.data.db.results.userrole import UserRole
 
 class User(ResultBase):
     """ Definition and storage of user ORM records.
+
+    The role version of a user is increased whenever its roles change, so the role claims of
+    the tokens issued before can be told apart.
     """
 
     def __init__(self, username: str, password: str):
@@ -23,6 +26,7 @@ class User(ResultBase):
         """
         self.username: str = username
         self.password: str = password
+        self.role_version: int = 0
 
     @staticmethod
     def _table_definition(metadata: MetaData) -> Table:
@@ -39,7 +43,8 @@ class User(ResultBase):
             'users',
             metadata,
             Column('username', String(32), primary_key=True),
-            Column('password', String(64), nullable=False)
+            Column('password', String(64), nullable=False),
+            Column('role_version', Integer, nullable=False, default=0, server_default='0')
         )
 
     @staticmethod
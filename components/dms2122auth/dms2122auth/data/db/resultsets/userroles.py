@@ -1,17 +1,19 @@
 """ UserRoles class module.
 """
 
-from typing import Optional, List
+from typing import Dict, Optional, List, Set, Tuple
 from sqlalchemy.orm import Session  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
 from dms2122common.data import Role
-from dms2122auth.data.db.results import UserRole
+from dms2122auth.data.db.results import User, UserRole
 from dms2122auth.data.db.exc import UserNotFoundError
 
 
 class UserRoles():
     """ Class responsible of table-level user rights operations.
+
+    Every change of the roles of a user increases its role version in the same transaction.
     """
     @staticmethod
     def grant(session: Session, username: str, role: Role) -> UserRole:
@@ -40,6 +42,7 @@ class UserRoles():
         try:
             new_user_role = UserRole(username, role)
             session.add(new_user_role)
+            UserRoles.__increase_role_version(session, username)
             session.commit()
             return new_user_role
         except IntegrityError as ex:
@@ -71,10 +74,78 @@ class UserRoles():
             return
         try:
             session.delete(user_role)
+            UserRoles.__increase_role_version(session, username)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def set_roles(session: Session, roles: Dict[str, Set[Role]]) -> Dict[str, List[Role]]:
+        """ Sets the roles of several users at once, in a single transaction.
+
+        The current roles of every user are read with a single query, and only the differences
+        are written: a deletion per revoked role, an insertion of every granted role and an
+        increase of the role version of the users whose roles changed.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - roles (Dict[str, Set[Role]]): The new set of roles of each user.
+
+        Raises:
+            - ValueError: If any username is missing.
+            - UserNotFoundError: If any user does not exist (no role is then changed).
+
+        Returns:
+            - Dict[str, List[Role]]: The roles of each user after the update.
+        """
+        if any(not username for username in roles):
+            raise ValueError('A username is required.')
+        try:
+            current: Dict[str, Set[Role]] = {}
+            query = session.query(User.username, UserRole.role).outerjoin(  # type: ignore
+                UserRole, UserRole.username == User.username  # type: ignore
+            ).filter(User.username.in_(list(roles)))  # type: ignore
+            for username, role in query:
+                current.setdefault(username, set())
+                if role is not None:
+                    current[username].add(role)
+            missing: List[str] = sorted(set(roles) - set(current))
+            if missing:
+                raise UserNotFoundError('Unknown user(s): ' + ', '.join(missing))
+
+            revoked: Dict[Role, List[str]] = {}
+            granted: List[Dict] = []
+            changed: List[str] = []
+            for username, new_roles in roles.items():
+                for role in current[username] - new_roles:
+                    revoked.setdefault(role, []).append(username)
+                granted.extend(
+                    {'username': username, 'role': role} for role in new_roles - current[username]
+                )
+                if new_roles != current[username]:
+                    changed.append(username)
+            for role, usernames in revoked.items():
+                session.query(UserRole).filter(
+                    UserRole.role == role, UserRole.username.in_(usernames)  # type: ignore
+                ).delete(synchronize_session=False)
+            session.bulk_insert_mappings(UserRole, granted)
+            if changed:
+                session.query(User).filter(User.username.in_(changed)).update(  # type: ignore
+                    {User.role_version: User.role_version + 1},  # type: ignore
+                    synchronize_session=False
+                )
             session.commit()
         except:
             session.rollback()
             raise
+        return {
+            username: [role for role in Role if role in new_roles]
+            for username, new_roles in roles.items()
+        }
 
     @staticmethod
     def find_role(session: Session, username: str, role: Role) -> Optional[UserRole]:
@@ -123,3 +194,49 @@ class UserRoles():
             username=username
         )
         return query.all()
+
+    @staticmethod
+    def list_claims_for_user(session: Session, username: str) -> Tuple[List[Role], int]:
+        """Lists the roles assigned to a certain user along with its role version.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - Tuple[List[Role], int]: A tuple with the user roles and the role version.
+        """
+        if not username:
+            raise ValueError('A username is required.')
+        query = session.query(User.role_version, UserRole.role).outerjoin(  # type: ignore
+            UserRole, UserRole.username == User.username  # type: ignore
+        ).filter(User.username == username)  # type: ignore
+        rows = query.all()
+        if not rows:
+            raise UserNotFoundError()
+        return ([role for _, role in rows if role is not None], rows[0][0])
+
+    @staticmethod
+    def get_role_version(session: Session, username: str) -> Optional[int]:
+        """Gets the role version of a user.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+
+        Returns:
+            - Optional[int]: The role version, or `None` if the user does not exist.
+        """
+        query = session.query(User.role_version).filter_by(username=username)  # type: ignore
+        return query.scalar()
+
+    @staticmethod
+    def __increase_role_version(session: Session, username: str) -> None:
+        session.query(User).filter_by(username=username).update(
+            {User.role_version: User.role_version + 1},  # type: ignore
+            synchronize_session=False
+        )
@@ -2,11 +2,13 @@
 """
 
 import hashlib
-from typing import List
-from sqlalchemy.exc import IntegrityError  # type: ignore
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Set, Tuple
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122auth.data.db.results import User
+from dms2122common.data import Role
+from dms2122auth.data.db.results import User, UserRole
 from dms2122auth.data.db.exc import UserExistsError
 
 
@@ -45,17 +47,106 @@ class Users():
                 ) from ex
 
     @staticmethod
-    def list_all(session: Session) -> List[User]:
+    def create_many(session: Session, users: List[Tuple[str, str, List[Role]]],
+                    batch_size: int) -> List[Optional[Exception]]:
+        """ Creates many user records, along with their roles, at once.
+
+        The users are processed in batches, each one in its own transaction: the existing
+        users are detected with a single query per batch and the rest (and their roles) are
+        inserted with a single `executemany` per table. If a batch fails (e.g., because one of
+        its users was created concurrently), its users are retried one at a time, so only the
+        failing ones are reported.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - users (List[Tuple[str, str, List[Role]]]): The user name, password hash and
+              granted roles of each user.
+            - batch_size (int): The number of users inserted in each transaction.
+
+        Raises:
+            - ValueError: If the batch size is not positive.
+
+        Returns:
+            - List[Optional[Exception]]: The result of each user, in the same order: `None` if
+              it was created, or the error that prevented it (`ValueError` if the username or
+              the password hash is empty, `UserExistsError` if a user with the same username
+              already exists or appears earlier in the list, or the `SQLAlchemyError` raised
+              when inserting it).
+        """
+        if batch_size < 1:
+            raise ValueError('The batch size must be a positive integer.')
+        results: List[Optional[Exception]] = []
+        usernames: Set[str] = set()
+        for start in range(0, len(users), batch_size):
+            batch: List[Tuple[str, str, List[Role]]] = users[start:start + batch_size]
+            try:
+                results.extend(Users.__create_batch(session, batch, usernames))
+            except SQLAlchemyError:
+                for user in batch:
+                    try:
+                        results.extend(Users.__create_batch(session, [user], usernames))
+                    except IntegrityError:
+                        results.append(UserExistsError(
+                            'A user with name ' + user[0] + ' already exists.'
+                        ))
+                    except SQLAlchemyError as ex:
+                        results.append(ex)
+        return results
+
+    @staticmethod
+    def list_all(session: Session, after: Optional[str] = None,
+                 limit: Optional[int] = None, prefix: Optional[str] = None) -> List[User]:
         """Lists every user.
 
         Args:
             - session (Session): The session object.
+            - after (Optional[str]): If given, only the users sorted after this user name are
+              listed.
+            - limit (Optional[int]): If given, the maximum number of users listed.
+            - prefix (Optional[str]): If given, only the users whose name starts with it are
+              listed.
 
         Returns:
-            - List[User]: A list of `User` registers.
+            - List[User]: A list of `User` registers, ordered by user name.
         """
-        query = session.query(User)
-        return query.all()
+        return Users.__page_query(session, after, limit, prefix).all()
+
+    @staticmethod
+    def list_all_with_roles(session: Session, after: Optional[str] = None,
+                            limit: Optional[int] = None,
+                            prefix: Optional[str] = None) -> List[Tuple[str, List[Role]]]:
+        """Lists every user along with their roles, with a single query.
+
+        Args:
+            - session (Session): The session object.
+            - after (Optional[str]): If given, only the users sorted after this user name are
+              listed.
+            - limit (Optional[int]): If given, the maximum number of users listed.
+            - prefix (Optional[str]): If given, only the users whose name starts with it are
+              listed.
+
+        Returns:
+            - List[Tuple[str, List[Role]]]: A list of tuples with the user name and the roles of
+              each user, ordered by user name.
+        """
+        page = Users.__page_query(session, after, limit, prefix).with_entities(
+            User.username  # type: ignore
+        ).subquery()
+        query = session.query(page.c.username, UserRole.role).outerjoin(  # type: ignore
+            UserRole, UserRole.username == page.c.username  # type: ignore
+        ).order_by(page.c.username)
+        out: Dict[str, List[Role]] = {}
+        for username, role in query:
+            roles: List[Role] = out.setdefault(username, [])
+            if role is not None:
+                roles.append(role)
+        return [
+            (username, sorted(roles, key=lambda role: role.value))
+            for username, roles in out.items()
+        ]
 
     @staticmethod
     def user_exists(session: Session, username: str, password_hash: str) -> bool:
@@ -89,3 +180,93 @@ class Users():
             - str: A string with the hashed password.
         """
         return hashlib.sha256(bytes(password + suffix + salt, 'utf-8')).hexdigest()
+
+    @staticmethod
+    def hash_passwords(credentials: List[Tuple[str, str]], salt: str = '',
+                       workers: int = 1) -> List[str]:
+        """ Hashes many passwords at once with `hash_password`.
+
+        Args:
+            - credentials (List[Tuple[str, str]]): The password and the suffix (usually the
+              user name) of each password.
+            - salt (str): An optional salt string.
+            - workers (int): The number of processes hashing the passwords in parallel. With
+              `1` they are hashed in the calling process.
+
+        Returns:
+            - List[str]: The hashed passwords, in the same order.
+        """
+        passwords: List[str] = [password for password, _ in credentials]
+        suffixes: List[str] = [suffix for _, suffix in credentials]
+        salts: List[str] = [salt] * len(credentials)
+        if workers <= 1 or len(credentials) <= 1:
+            return list(map(Users.hash_password, passwords, suffixes, salts))
+        with ProcessPoolExecutor(workers) as executor:
+            return list(executor.map(
+                Users.hash_password, passwords, suffixes, salts,
+                chunksize=max(1, len(credentials) // (workers * 4))
+            ))
+
+    @staticmethod
+    def __create_batch(session: Session, batch: List[Tuple[str, str, List[Role]]],
+                       usernames: Set[str]) -> List[Optional[Exception]]:
+        results: List[Optional[Exception]] = []
+        created: Set[str] = set()
+        try:
+            existing: Set[str] = {
+                username for (username,) in session.query(User.username).filter(  # type: ignore
+                    User.username.in_({username for username, _, _ in batch})  # type: ignore
+                )
+            }
+            new_users: List[Dict] = []
+            new_roles: List[Dict] = []
+            for username, password_hash, roles in batch:
+                if not username or not password_hash:
+                    results.append(ValueError('A username and a password hash are required.'))
+                elif username in usernames or username in existing or username in created:
+                    results.append(UserExistsError(
+                        'A user with name ' + username + ' already exists.'
+                    ))
+                else:
+                    created.add(username)
+                    new_users.append({'username': username, 'password': password_hash})
+                    new_roles.extend(
+                        {'username': username, 'role': role} for role in dict.fromkeys(roles)
+                    )
+                    results.append(None)
+            session.bulk_insert_mappings(User, new_users)
+            session.bulk_insert_mappings(UserRole, new_roles)
+            session.commit()
+        except:
+            session.rollback()
+            raise
+        # The names are only taken once their batch is committed
+        usernames.update(existing | created)
+        return results
+
+    @staticmethod
+    def __page_query(session: Session, after: Optional[str], limit: Optional[int],
+                     prefix: Optional[str]):
+        query = session.query(User)
+        if after is not None:
+            query = query.filter(User.username > after)  # type: ignore
+        if prefix:
+            # A range (instead of `LIKE`) can be resolved with the primary key index
+            query = query.filter(User.username >= prefix)  # type: ignore
+            upper_bound: Optional[str] = Users.__prefix_upper_bound(prefix)
+            if upper_bound is not None:
+                query = query.filter(User.username < upper_bound)  # type: ignore
+        return query.order_by(User.username).limit(limit)  # type: ignore
+
+    @staticmethod
+    def __prefix_upper_bound(prefix: str) -> Optional[str]:
+        # The first string sorted after every one starting with the prefix
+        while prefix and prefix[-1] == chr(0x10FFFF):
+            prefix = prefix[:-1]
+        if not prefix:
+            return None
+        successor: int = ord(prefix[-1]) + 1
+        if 0xD800 <= successor <= 0xDFFF:
+            # Surrogates cannot be encoded
+            successor = 0xE000
+        return prefix[:-1] + chr(successor)
@@ -0,0 +1,4 @@
+""" Authentication service presentation-layer classes.
+"""
+
+from .wsgiapp import WSGIApp
@@ -5,7 +5,7 @@ from typing import Dict, Optional
 from flask import current_app
 from itsdangerous import TimedJSONWebSignatureSerializer
 from connexion.exceptions import Unauthorized  # type: ignore
-from dms2122auth.service import UserServices
+from dms2122auth.service import RoleServices, UserServices
 from dms2122auth.data.config import AuthConfiguration
 
 
@@ -51,9 +51,37 @@ def verify_credentials(username: str, password: str) -> Optional[Dict]:
     return None
 
 
+def issue_token(user: str) -> str:
+    """Generates a JWS user token.
+
+    Besides the user name, the token claims the user's roles (key `roles`) and their version
+    (key `role_version`), so other services can authorize the user without asking for them.
+
+    Args:
+        - user (str): The user name.
+
+    Raises:
+        - UserNotFoundError: If the user does not exist.
+
+    Returns:
+        - str: The JWS user token.
+    """
+    with current_app.app_context():
+        jws: TimedJSONWebSignatureSerializer = current_app.jws
+        claims: Dict = {
+            'user': user,
+            'sub': user
+        }
+        claims.update(RoleServices.get_role_claims(user, current_app.db))
+        return jws.dumps(claims).decode('ascii')
+
+
 def verify_token(token: str) -> Dict:
     """Callback testing a JWS user token.
 
+    Tokens claiming roles are only valid while the user's roles remain unchanged (i.e., while
+    their role version is the current one).
+
     Args:
         - token (str): The JWS user token received.
 
@@ -72,6 +100,9 @@ def verify_token(token: str) -> Dict:
             raise Unauthorized from ex
         if 'user' not in data:
             return Unauthorized('Invalid token')
+        if ('role_version' in data and data['role_version']
+                != RoleServices.get_role_version(data['user'], current_app.db)):
+            raise Unauthorized('Outdated token roles')
         return {
             'sub': data['sub'],
             'user': data['user']
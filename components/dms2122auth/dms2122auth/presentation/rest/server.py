@@ -4,7 +4,7 @@
 from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
-from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122auth.presentation.rest.security import issue_token
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -26,14 +26,9 @@ def login(token_info: Dict) -> Tuple[str, Optional[int]]:
         - Tuple[str, Optional[int]]: A tuple with the JWS token and code 200 OK.
     """
     with current_app.app_context():
-        jws: TimedJSONWebSignatureSerializer = current_app.jws
         user: str = ''
         if 'user_token' in token_info:
             user = token_info['user_token']['user']
         elif 'user_credentials' in token_info:
             user = token_info['user_credentials']['user']
-        token = jws.dumps({
-            'user': user,
-            'sub': user
-        })
-        return (token.decode('ascii'), HTTPStatus.OK.value)
+        return (issue_token(user), HTTPStatus.OK.value)
@@ -7,18 +7,35 @@ from flask import current_app
 from dms2122auth.data.db.exc import UserExistsError
 from dms2122auth.service import UserServices, RoleServices
 from dms2122common.data.role import Role
+from dms2122common.data.rest import Cursor
 
 
-def list_users() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing users.
+def list_users(limit: Optional[int] = None, cursor: Optional[str] = None, roles: bool = False,
+               prefix: Optional[str] = None) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Lists a page of the existing users.
+
+    Args:
+        - limit (Optional[int]): The maximum number of users in the page.
+        - cursor (Optional[str]): The cursor of the page, as given by the previous one.
+        - roles (bool): Whether the roles of each user are listed too.
+        - prefix (Optional[str]): If given, only the users whose name starts with it are listed.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the users' data
-          and a code 200 OK.
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: On success, a tuple with a list of
+          dictionaries for the users' data, a code 200 OK and the headers with the cursor of the
+          next page, if any. On error, a description message and code:
+            - 400 BAD REQUEST when the cursor is malformed.
     """
     with current_app.app_context():
-        users: List[Dict] = UserServices.list_users(current_app.db)
-    return (users, HTTPStatus.OK.value)
+        try:
+            after: Optional[List] = Cursor.decode(cursor, (str,))
+            users, next_key = UserServices.list_users(
+                current_app.db, current_app.cfg.get_page_limit(limit),
+                after[0] if after is not None else None, roles, prefix
+            )
+        except ValueError:
+            return ('The cursor is malformed', HTTPStatus.BAD_REQUEST.value, {})
+    return (users, HTTPStatus.OK.value, Cursor.headers(next_key))
 
 
 def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
@@ -50,3 +67,41 @@ def create_user(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optiona
         except UserExistsError:
             return ('A user with the given username already exists', HTTPStatus.CONFLICT.value)
     return (user, HTTPStatus.OK.value)
+
+
+def create_users(body: List[Dict], token_info: Dict) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Creates many users, along with their roles, if the requestor has the Admin role.
+
+    Args:
+        - body (List[Dict]): A list of dictionaries with the new users' data.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with a list of
+          dictionaries with the data and the result (`status` and, on error, `message`) of each
+          user and a code 200 OK. Each user status is one of:
+            - 200 OK when the user was created.
+            - 400 BAD REQUEST when a mandatory argument is missing or a role does not exist.
+            - 409 CONFLICT if the username is already taken.
+          On error, a description message and code:
+            - 403 FORBIDDEN when the requestor does not have the rights to create users.
+    """
+    with current_app.app_context():
+        if not RoleServices.has_role(token_info['user_token']['user'], Role.Admin, current_app.db):
+            return (
+                'Current user has not enough privileges to create users',
+                HTTPStatus.FORBIDDEN.value
+            )
+        results = UserServices.create_users(body, current_app.db, current_app.cfg)
+    out: List[Dict] = []
+    for user_data, error in results:
+        if error is None:
+            user_data['status'] = HTTPStatus.OK.value
+        elif isinstance(error, UserExistsError):
+            user_data['status'] = HTTPStatus.CONFLICT.value
+            user_data['message'] = 'A user with the given username already exists'
+        else:
+            user_data['status'] = HTTPStatus.BAD_REQUEST.value
+            user_data['message'] = str(error)
+        out.append(user_data)
+    return (out, HTTPStatus.OK.value)
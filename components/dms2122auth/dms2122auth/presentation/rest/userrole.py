@@ -6,6 +6,7 @@ from http import HTTPStatus
 from flask import current_app
 from dms2122auth.data.db.exc import UserNotFoundError
 from dms2122auth.service import RoleServices
+from dms2122auth.presentation.rest.security import issue_token
 from dms2122common.data import Role
 
 
@@ -57,6 +58,88 @@ def list_user_roles(username: str, token_info: Dict) -> Tuple[Union[List[str], s
         return (user_roles, HTTPStatus.OK.value)
 
 
+def set_user_roles(
+    username: str, body: List[str], token_info: Dict
+) -> Tuple[Union[List[str], str], Optional[int], Dict]:
+    """Sets the roles of a user, granting the given ones and revoking the rest.
+
+    Args:
+        - username (str): The user name.
+        - body (List[str]): The list of role names of the user.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[str], str], Optional[int], Dict]: A tuple with the resulting list of
+          user roles, a code 200 OK and the headers (with a new token for the requesting user in
+          `X-Session-Token` if they changed their own roles, as the change invalidates the
+          previous one), or a description message and codes:
+            - 400 BAD REQUEST if a role does not exist.
+            - 403 FORBIDDEN if the requesting user has no rights to set roles.
+            - 404 NOT FOUND if the user does not exist.
+    """
+    result, code, headers = set_users_roles(
+        [{'username': username, 'roles': body}], token_info
+    )
+    if isinstance(result, list):
+        return (result[0]['roles'], code, headers)
+    return (result, code, headers)
+
+
+def set_users_roles(
+    body: List[Dict], token_info: Dict
+) -> Tuple[Union[List[Dict], str], Optional[int], Dict]:
+    """Sets the roles of several users at once, in a single transaction.
+
+    Args:
+        - body (List[Dict]): A list of dictionaries with the `username` and the list of `roles`
+          of each user.
+        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int], Dict]: A tuple with a list of
+          dictionaries with the resulting roles of each user, a code 200 OK and the headers
+          (with a new token for the requesting user in `X-Session-Token` if they changed their
+          own roles, as the change invalidates the previous one), or a description message and
+          codes (no role is then changed):
+            - 400 BAD REQUEST if a username is missing or repeated, or a role does not exist.
+            - 403 FORBIDDEN if the requesting user has no rights to set roles.
+            - 404 NOT FOUND if any user does not exist.
+    """
+    with current_app.app_context():
+        requestor: str = token_info['user_token']['user']
+        if not RoleServices.has_role(requestor, Role.Admin, current_app.db):
+            return (
+                'Current user has not enough privileges to set roles',
+                HTTPStatus.FORBIDDEN.value, {}
+            )
+        roles: Dict[str, List] = {}
+        for user_roles in body:
+            if user_roles['username'] in roles:
+                return (
+                    f'User {user_roles["username"]} is given more than once',
+                    HTTPStatus.BAD_REQUEST.value, {}
+                )
+            roles[user_roles['username']] = user_roles['roles']
+        if requestor in roles and Role.Admin.name not in roles[requestor]:
+            return (
+                'Current user cannot revoke the Admin role from oneself',
+                HTTPStatus.FORBIDDEN.value, {}
+            )
+        try:
+            result: Dict[str, List[str]] = RoleServices.set_roles(roles, current_app.db)
+        except ValueError as ex:
+            return (str(ex), HTTPStatus.BAD_REQUEST.value, {})
+        except UserNotFoundError as ex:
+            return (str(ex), HTTPStatus.NOT_FOUND.value, {})
+        headers: Dict = {}
+        if requestor in result:
+            headers['X-Session-Token'] = issue_token(requestor)
+        return (
+            [{'username': name, 'roles': user_roles} for name, user_roles in result.items()],
+            HTTPStatus.OK.value, headers
+        )
+
+
 def grant_role(
     username: str, rolename: str, token_info: Dict
 ) -> Tuple[Optional[str], Optional[int]]:
@@ -68,8 +151,9 @@ def grant_role(
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
-        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 200 OK if granted, or
-          a description message and codes:
+        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 200 OK if granted
+          (or a new token for the requesting user, if granted to oneself, as the change
+          invalidates the previous one), or a description message and codes:
             - 400 BAD REQUEST if a mandatory parameter is missing.
             - 403 FORBIDDEN if the requesting user has no rights to grant a role.
             - 404 NOT FOUND if the user does not exist.
@@ -89,6 +173,8 @@ def grant_role(
             )
         except UserNotFoundError:
             return (f'User {username} was not found', HTTPStatus.NOT_FOUND.value)
+        if token_info['user_token']['user'] == username:
+            return (issue_token(username), HTTPStatus.OK.value)
         return (None, HTTPStatus.OK.value)
 
 
@@ -103,8 +189,9 @@ def revoke_role(
         - token_info (Dict): A dictionary of information provided by the security schema handlers.
 
     Returns:
-        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 200 OK if revoked, or
-          a description message and codes:
+        - Tuple[Optional[str], Optional[int]]: A tuple of no content and code 200 OK if revoked
+          (or a new token for the requesting user, if revoked from oneself, as the change
+          invalidates the previous one), or a description message and codes:
             - 400 BAD REQUEST if a mandatory parameter is missing.
             - 403 FORBIDDEN if the requesting user has no rights to revoke a role.
     """
@@ -123,4 +210,6 @@ def revoke_role(
             RoleServices.revoke_role(username, rolename, current_app.db)
         except ValueError:
             return 'Both a username and a role name must be given', HTTPStatus.BAD_REQUEST.value
+        if token_info['user_token']['user'] == username:
+            return (issue_token(username), HTTPStatus.OK.value)
         return (None, HTTPStatus.OK.value)
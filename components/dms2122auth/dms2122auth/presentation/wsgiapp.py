@@ -0,0 +1,88 @@
+""" WSGIApp class module.
+"""
+
+import os
+import inspect
+import logging
+import connexion  # type: ignore
+from connexion.apis.flask_api import FlaskApi  # type: ignore
+from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
+from connexion.jsonifier import Jsonifier  # type: ignore
+from flask import Flask, current_app, request
+from flask.logging import default_handler
+from itsdangerous import TimedJSONWebSignatureSerializer
+import dms2122auth
+from dms2122common.data.rest import Compression, JSONCodec
+from dms2122auth.data.config import AuthConfiguration
+from dms2122auth.data.db import Schema
+
+
+class WSGIApp():
+    """ Monostate class creating the WSGI application of the service.
+    """
+
+    @staticmethod
+    def create(cfg: AuthConfiguration) -> Flask:
+        """ Creates the application, initializing the database schema.
+
+        Args:
+            - cfg (AuthConfiguration): The service configuration.
+
+        Returns:
+            - Flask: The WSGI application.
+        """
+        db: Schema = Schema(cfg)
+        jws: TimedJSONWebSignatureSerializer = TimedJSONWebSignatureSerializer(
+            cfg.get_jws_secret(), expires_in=cfg.get_jws_ttl()
+        )
+
+        specification_dir = os.path.dirname(
+            inspect.getfile(dms2122auth)) + '/openapi'
+        app = connexion.FlaskApp(
+            __name__,
+            specification_dir=specification_dir,
+            options={
+                "swagger_ui": True,
+                "serve_spec": True
+            }
+        )
+        app.add_api("spec.yml", strict_validation=True)
+        flask_app = app.app
+        flask_app.json_encoder = FlaskJSONEncoder
+
+        # Serialize the responses compactly, with the fastest JSON library available
+        JSONCodec.configure(cfg.get_json_backend())
+        FlaskApi.jsonifier = Jsonifier(JSONCodec)
+
+        @flask_app.after_request
+        def compress_response(response):
+            return Compression.compress_response(
+                response, request.headers.get('Accept-Encoding'),
+                cfg.get_compression_min_size(), cfg.get_compression_level()
+            )
+
+        with flask_app.app_context():
+            current_app.db = db
+            current_app.cfg = cfg
+            current_app.jws = jws
+
+        root_logger = logging.getLogger()
+        root_logger.addHandler(default_handler)
+
+        # Report the effective storage profile, which may differ from the configured one
+        storage_logger = logging.getLogger('dms2122auth.storage')
+        storage_logger.setLevel(logging.INFO)
+        storage_logger.info('Storage settings: %s', ', '.join(
+            name + '=' + str(value) for name, value in db.storage_settings().items()
+        ))
+
+        return flask_app
+
+    @staticmethod
+    def post_fork(app: Flask) -> None:
+        """ Prepares the application for a new worker process.
+
+        Args:
+            - app (Flask): The application, created by the parent process.
+        """
+        app.db.dispose()  # type: ignore
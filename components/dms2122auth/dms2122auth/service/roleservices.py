@@ -1,7 +1,7 @@
 """ RoleServices class module.
 """
 
-from typing import Union, List
+from typing import Dict, List, Optional, Set, Union
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122common.data import Role
 from dms2122auth.data.db import Schema
@@ -66,6 +66,49 @@ class RoleServices():
             schema.remove_session()
         return out
 
+    @staticmethod
+    def get_role_claims(username: str, schema: Schema) -> Dict:
+        """Gets the role claims of a user, to be embedded in its tokens.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If the username is missing.
+            - UserNotFoundError: If the user does not exist.
+
+        Returns:
+            - Dict: A dictionary with the list of role names (key `roles`) and the role version
+              (key `role_version`).
+        """
+        session: Session = schema.new_session()
+        try:
+            roles, role_version = UserRoles.list_claims_for_user(session, username)
+        finally:
+            schema.remove_session()
+        return {
+            'roles': [role.name for role in roles],
+            'role_version': role_version
+        }
+
+    @staticmethod
+    def get_role_version(username: str, schema: Schema) -> Optional[int]:
+        """Gets the current role version of a user.
+
+        Args:
+            - username (str): The username of the user queried.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Returns:
+            - Optional[int]: The role version, or `None` if the user does not exist.
+        """
+        session: Session = schema.new_session()
+        try:
+            return UserRoles.get_role_version(session, username)
+        finally:
+            schema.remove_session()
+
     @staticmethod
     def grant_role(username: str, role: Union[Role, str], schema: Schema) -> None:
         """Grants a role to a user.
@@ -89,6 +132,45 @@ class RoleServices():
         finally:
             schema.remove_session()
 
+    @staticmethod
+    def set_roles(roles: Dict[str, List[Union[Role, str]]], schema: Schema) -> Dict[str, List[str]]:
+        """Sets the roles of several users at once.
+
+        Every role not given is revoked, and the changes of every user are applied in a single
+        transaction, so either all of them take effect or none does.
+
+        Args:
+            - roles (Dict[str, List[Union[Role, str]]]): The new roles of each user.
+            - schema (Schema): A database handler where users and roles are mapped into.
+
+        Raises:
+            - ValueError: If any username is missing or any role does not exist.
+            - UserNotFoundError: If any user does not exist.
+
+        Returns:
+            - Dict[str, List[str]]: The role names of each user after the update.
+        """
+        new_roles: Dict[str, Set[Role]] = {}
+        for username, user_roles in roles.items():
+            unknown: List[str] = [
+                str(role) for role in user_roles
+                if not isinstance(role, Role) and role not in Role.__members__
+            ]
+            if len(unknown) > 0:
+                raise ValueError('Unknown role(s): ' + ', '.join(unknown))
+            new_roles[username] = {
+                role if isinstance(role, Role) else Role[role] for role in user_roles
+            }
+        session: Session = schema.new_session()
+        try:
+            result = UserRoles.set_roles(session, new_roles)
+        finally:
+            schema.remove_session()
+        return {
+            username: [role.name for role in user_roles]
+            for username, user_roles in result.items()
+        }
+
     @staticmethod
     def revoke_role(username: str, role: Union[Role, str], schema: Schema) -> None:
         """Revokes a role from a user.
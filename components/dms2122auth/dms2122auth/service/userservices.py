@@ -1,8 +1,9 @@
 """ UserServices class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data import Role
 from dms2122auth.data.config import AuthConfiguration
 from dms2122auth.data.db import Schema
 from dms2122auth.data.db.results import User
@@ -34,24 +35,49 @@ class UserServices():
         return user_exists
 
     @staticmethod
-    def list_users(schema: Schema) -> List[Dict]:
-        """Lists the existing users.
+    def list_users(schema: Schema, limit: Optional[int] = None, after: Optional[str] = None,
+                   roles: bool = False,
+                   prefix: Optional[str] = None) -> Tuple[List[Dict], Optional[List]]:
+        """Lists a page of the existing users.
 
         Args:
             - schema (Schema): A database handler where the users are mapped into.
+            - limit (Optional[int]): If given, the maximum number of users listed.
+            - after (Optional[str]): If given, only the users sorted after this user name are
+              listed.
+            - roles (bool): Whether the roles of each user are listed too (read in the same
+              query as the users).
+            - prefix (Optional[str]): If given, only the users whose name starts with it are
+              listed.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the users' data.
+            - Tuple[List[Dict], Optional[List]]: A tuple with a list of dictionaries with the
+              users' data (and their list of `roles` names, if requested) and, if there are
+              more users, the sorting key (`[username]`) of the last one listed.
         """
         out: List[Dict] = []
+        next_key: Optional[List] = None
         session: Session = schema.new_session()
-        users: List[User] = Users.list_all(session)
-        for user in users:
-            out.append({
-                'username': user.username
-            })
-        schema.remove_session()
-        return out
+        try:
+            page_limit: Optional[int] = limit + 1 if limit is not None else None
+            if roles:
+                out = [
+                    {'username': username, 'roles': [role.name for role in user_roles]}
+                    for username, user_roles in Users.list_all_with_roles(
+                        session, after, page_limit, prefix
+                    )
+                ]
+            else:
+                out = [
+                    {'username': user.username}
+                    for user in Users.list_all(session, after, page_limit, prefix)
+                ]
+        finally:
+            schema.remove_session()
+        if limit is not None and len(out) > limit:
+            out = out[:limit]
+            next_key = [out[-1]['username']]
+        return out, next_key
 
     @staticmethod
     def create_user(username: str, password: str, schema: Schema, cfg: AuthConfiguration) -> Dict:
@@ -83,3 +109,62 @@ class UserServices():
         finally:
             schema.remove_session()
         return out
+
+    @staticmethod
+    def create_users(users: List[Dict], schema: Schema,
+                     cfg: AuthConfiguration) -> List[Tuple[Dict, Optional[Exception]]]:
+        """Creates many users, along with their roles, at once.
+
+        The passwords are hashed by `hash_workers` processes and the users are inserted in
+        batches of `provision_batch_size`, each one in its own transaction.
+
+        Args:
+            - users (List[Dict]): A list of dictionaries with the `username`, `password` and
+              (optionally) the list of `roles` names of each user.
+            - schema (Schema): A database handler where the users are mapped into.
+            - cfg (AuthConfiguration): The application configuration.
+
+        Returns:
+            - List[Tuple[Dict, Optional[Exception]]]: For each user, in the same order, a tuple
+              with a dictionary with the user's data and `None` if it was created, or the error
+              that prevented it otherwise (`ValueError` if a field is missing or a role does not
+              exist, or `UserExistsError` if the username is already taken).
+        """
+        out: List[Tuple[Dict, Optional[Exception]]] = []
+        granted: List[Tuple[str, List[Role]]] = []
+        credentials: List[Tuple[str, str]] = []
+        for user in users:
+            username: str = str(user.get('username') or '')
+            password: str = str(user.get('password') or '')
+            role_names: List[str] = [str(role) for role in user.get('roles') or []]
+            data: Dict = {'username': username, 'roles': role_names}
+            if not username or not password:
+                out.append((data, ValueError('A username and a password are required.')))
+                continue
+            unknown: List[str] = [name for name in role_names if name not in Role.__members__]
+            if len(unknown) > 0:
+                out.append((data, ValueError('Unknown role(s): ' + ', '.join(unknown))))
+                continue
+            out.append((data, None))
+            granted.append((username, [Role[name] for name in role_names]))
+            credentials.append((password, username))
+
+        password_hashes: List[str] = Users.hash_passwords(
+            credentials, cfg.get_password_salt(), cfg.get_hash_workers()
+        )
+        records: List[Tuple[str, str, List[Role]]] = [
+            (username, password_hash, roles)
+            for (username, roles), password_hash in zip(granted, password_hashes)
+        ]
+        session: Session = schema.new_session()
+        try:
+            results: List[Optional[Exception]] = Users.create_many(
+                session, records, cfg.get_provision_batch_size()
+            )
+        finally:
+            schema.remove_session()
+        pending = iter(results)
+        return [
+            (data, next(pending) if error is None else error)
+            for data, error in out
+        ]
@@ -3,6 +3,7 @@
 
 from typing import Dict
 from dms2122common.data.config import ServiceConfiguration
+from dms2122common.data.db import StorageProfile
 
 
 class BackendConfiguration(ServiceConfiguration):
@@ -35,6 +36,14 @@ class BackendConfiguration(ServiceConfiguration):
             'port': 4000,
             'apikey_secret': 'This should be the backend API key'
         })
+        self.set_stream_batch_size(1000)
+        self.set_import_chunk_size(500)
+        self.set_storage({})
+        self.set_question_cache_size(1024)
+        self.set_question_cache_check_interval(1.0)
+        self.set_role_cache_size(4096)
+        self.set_role_cache_ttl(30.0)
+        self.set_role_cache_negative_ttl(5.0)
 
 
     def _set_values(self, values: Dict) -> None:
@@ -51,6 +60,22 @@ class BackendConfiguration(ServiceConfiguration):
             self.set_password_salt(values['salt'])
         if 'auth_service' in values:
             self.set_auth_service(values['auth_service'])
+        if 'stream_batch_size' in values:
+            self.set_stream_batch_size(values['stream_batch_size'])
+        if 'import_chunk_size' in values:
+            self.set_import_chunk_size(values['import_chunk_size'])
+        if 'storage' in values:
+            self.set_storage(values['storage'])
+        if 'question_cache_size' in values:
+            self.set_question_cache_size(values['question_cache_size'])
+        if 'question_cache_check_interval' in values:
+            self.set_question_cache_check_interval(values['question_cache_check_interval'])
+        if 'role_cache_size' in values:
+            self.set_role_cache_size(values['role_cache_size'])
+        if 'role_cache_ttl' in values:
+            self.set_role_cache_ttl(values['role_cache_ttl'])
+        if 'role_cache_negative_ttl' in values:
+            self.set_role_cache_negative_ttl(values['role_cache_negative_ttl'])
 
     def set_db_connection_string(self, db_connection_string: str) -> None:
         """ Sets the db_connection_string configuration value.
@@ -72,6 +97,27 @@ class BackendConfiguration(ServiceConfiguration):
 
         return str(self._values['db_connection_string'])
 
+    def set_storage(self, storage: Dict) -> None:
+        """ Sets the storage profile configuration value.
+
+        Args:
+            - storage: A dictionary with the SQLite pragmas and connection pool sizing (see
+              `StorageProfile`). Missing values take their defaults.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['storage'] = StorageProfile.validate(storage or {})
+
+    def get_storage(self) -> Dict:
+        """ Gets the storage profile configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of storage.
+        """
+
+        return self._values['storage']
+
     def set_password_salt(self, salt: str) -> None:
         """ Sets the password salt configuration value.
 
@@ -112,3 +158,169 @@ class BackendConfiguration(ServiceConfiguration):
 
         return self._values['auth_service']
 
+    def set_stream_batch_size(self, stream_batch_size: int) -> None:
+        """ Sets the stream_batch_size configuration value.
+
+        Args:
+            - stream_batch_size: An integer with the number of rows fetched from the database at
+              a time by the streamed listings.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        stream_batch_size = int(stream_batch_size)
+        if stream_batch_size < 1:
+            raise ValueError('The stream batch size must be a positive integer.')
+        self._values['stream_batch_size'] = stream_batch_size
+
+    def get_stream_batch_size(self) -> int:
+        """ Gets the stream_batch_size configuration value.
+
+        Returns:
+            - int: An integer with the value of stream_batch_size.
+        """
+
+        return int(self._values['stream_batch_size'])
+
+    def set_import_chunk_size(self, import_chunk_size: int) -> None:
+        """ Sets the import_chunk_size configuration value.
+
+        Args:
+            - import_chunk_size: An integer with the number of questions inserted in each
+              transaction by the question bank imports.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        import_chunk_size = int(import_chunk_size)
+        if import_chunk_size < 1:
+            raise ValueError('The import chunk size must be a positive integer.')
+        self._values['import_chunk_size'] = import_chunk_size
+
+    def get_import_chunk_size(self) -> int:
+        """ Gets the import_chunk_size configuration value.
+
+        Returns:
+            - int: An integer with the value of import_chunk_size.
+        """
+
+        return int(self._values['import_chunk_size'])
+
+    def set_question_cache_size(self, question_cache_size: int) -> None:
+        """ Sets the question_cache_size configuration value.
+
+        Args:
+            - question_cache_size: An integer with the maximum number of questions kept in the
+              in-process question cache (`0` disables it).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        question_cache_size = int(question_cache_size)
+        if question_cache_size < 0:
+            raise ValueError('The question cache size cannot be negative.')
+        self._values['question_cache_size'] = question_cache_size
+
+    def get_question_cache_size(self) -> int:
+        """ Gets the question_cache_size configuration value.
+
+        Returns:
+            - int: An integer with the value of question_cache_size.
+        """
+
+        return int(self._values['question_cache_size'])
+
+    def set_question_cache_check_interval(self, question_cache_check_interval: float) -> None:
+        """ Sets the question_cache_check_interval configuration value.
+
+        Args:
+            - question_cache_check_interval: A float with the seconds between checks for
+              questions modified by other processes (`0` checks on every lookup).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        question_cache_check_interval = float(question_cache_check_interval)
+        if question_cache_check_interval < 0:
+            raise ValueError('The question cache check interval cannot be negative.')
+        self._values['question_cache_check_interval'] = question_cache_check_interval
+
+    def get_question_cache_check_interval(self) -> float:
+        """ Gets the question_cache_check_interval configuration value.
+
+        Returns:
+            - float: A float with the value of question_cache_check_interval.
+        """
+
+        return float(self._values['question_cache_check_interval'])
+
+    def set_role_cache_size(self, role_cache_size: int) -> None:
+        """ Sets the role_cache_size configuration value.
+
+        Args:
+            - role_cache_size: An integer with the maximum number of role decisions of the
+              authentication service kept in the in-process role cache (`0` disables it).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        role_cache_size = int(role_cache_size)
+        if role_cache_size < 0:
+            raise ValueError('The role cache size cannot be negative.')
+        self._values['role_cache_size'] = role_cache_size
+
+    def get_role_cache_size(self) -> int:
+        """ Gets the role_cache_size configuration value.
+
+        Returns:
+            - int: An integer with the value of role_cache_size.
+        """
+
+        return int(self._values['role_cache_size'])
+
+    def set_role_cache_ttl(self, role_cache_ttl: float) -> None:
+        """ Sets the role_cache_ttl configuration value.
+
+        Args:
+            - role_cache_ttl: A float with the seconds a positive role decision is cached.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        role_cache_ttl = float(role_cache_ttl)
+        if role_cache_ttl < 0:
+            raise ValueError('The role cache TTL cannot be negative.')
+        self._values['role_cache_ttl'] = role_cache_ttl
+
+    def get_role_cache_ttl(self) -> float:
+        """ Gets the role_cache_ttl configuration value.
+
+        Returns:
+            - float: A float with the value of role_cache_ttl.
+        """
+
+        return float(self._values['role_cache_ttl'])
+
+    def set_role_cache_negative_ttl(self, role_cache_negative_ttl: float) -> None:
+        """ Sets the role_cache_negative_ttl configuration value.
+
+        Args:
+            - role_cache_negative_ttl: A float with the seconds a negative role decision is
+              cached (`0` does not cache them).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        role_cache_negative_ttl = float(role_cache_negative_ttl)
+        if role_cache_negative_ttl < 0:
+            raise ValueError('The role cache negative TTL cannot be negative.')
+        self._values['role_cache_negative_ttl'] = role_cache_negative_ttl
+
+    def get_role_cache_negative_ttl(self) -> float:
+        """ Gets the role_cache_negative_ttl configuration value.
+
+        Returns:
+            - float: A float with the value of role_cache_negative_ttl.
+        """
+
+        return float(self._values['role_cache_negative_ttl'])
@@ -4,3 +4,4 @@
 from .qustionexistserror import QuestionExistsError
 from .usernotfounderror import UserNotFoundError
 from .questionorusernotfounderror import QuestionOrUserNotFoundError
+from .answerexistserror import AnswerExistsError
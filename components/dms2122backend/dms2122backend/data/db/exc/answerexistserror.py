@@ -0,0 +1,7 @@
+""" AnswerExistsError class module.
+"""
+
+
+class AnswerExistsError(Exception):
+    """ Error raised when an attempt to answer an already answered question occurs.
+    """
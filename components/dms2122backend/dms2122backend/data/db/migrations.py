@@ -0,0 +1,33 @@
+""" Migrations class module.
+"""
+
+from typing import Callable, List, Tuple
+from sqlalchemy import MetaData  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data.db import MigrationRunner
+
+
+class Migrations():
+    """ Monostate class holding the versioned upgrades of the database schema, which are
+    applied by a `MigrationRunner`.
+    """
+
+    @staticmethod
+    def steps() -> List[Tuple[int, str, Callable[[Session, MetaData], None]]]:
+        """ Gets every migration step.
+
+        Returns:
+            - List[Tuple[int, str, Callable[[Session, MetaData], None]]]: A list of tuples with
+              the version, the description and the function applying each step, sorted by
+              version.
+        """
+        return [
+            (1, 'Index the answers by question id',
+             lambda session, metadata: MigrationRunner.create_index(
+                 session, metadata, 'ix_answers_id', 'answers', ['id']
+             )),
+            (2, 'Index the questions by title',
+             lambda session, metadata: MigrationRunner.create_index(
+                 session, metadata, 'ix_questions_title', 'questions', ['title']
+             )),
+        ]
@@ -3,3 +3,9 @@
 
 from .question import Question
 from .answer import Answer
+from .userstat import UserStat
+from .questionstat import QuestionStat
+from .cataloguestat import CatalogueStat
+from .schemaversion import SchemaVersion
+from .dataversion import DataVersion
+from .questionsnapshot import QuestionSnapshot
@@ -0,0 +1,46 @@
+""" CatalogueStat Class Module
+"""
+
+from sqlalchemy import Table, MetaData, Column, Integer, Float  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class CatalogueStat(ResultBase):
+    """ Definition and storage of the question catalogue statistics ORM record.
+
+    The table holds a single row, identified by `CatalogueStat.ROW_ID`.
+    """
+
+    ROW_ID: int = 1
+
+    def __init__(self, n_questions: int = 0, total_punctuation: float = 0):
+        """ Constructor method.
+
+        Initializes the statistics record of the question catalogue.
+
+        Args:
+            - n_questions (int): The number of questions in the catalogue.
+            - total_punctuation (float): The sum of the punctuations of every question.
+        """
+        self.id: int = CatalogueStat.ROW_ID
+        self.n_questions: int = n_questions
+        self.total_punctuation: float = total_punctuation
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'catalogue_stats',
+            metadata,
+            Column('id', Integer, primary_key=True),
+            Column('n_questions', Integer, nullable=False),
+            Column('total_punctuation', Float, nullable=False)
+        )
@@ -0,0 +1,43 @@
+""" DataVersion class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class DataVersion(ResultBase):
+    """ Definition and storage of the data version stamps ORM records.
+
+    Each stamp is increased whenever the data it names is modified, so other processes can
+    detect that their cached copies are stale.
+    """
+
+    def __init__(self, name: str, version: int = 0):
+        """ Constructor method.
+
+        Initializes a data version stamp record.
+
+        Args:
+            - name (str): A string naming the versioned data.
+            - version (int): The version number.
+        """
+        self.name: str = name
+        self.version: int = version
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'data_versions',
+            metadata,
+            Column('name', String(32), primary_key=True),
+            Column('version', Integer, nullable=False)
+        )
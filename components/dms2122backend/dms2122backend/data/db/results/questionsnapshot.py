@@ -0,0 +1,35 @@
+""" QuestionSnapshot class module.
+"""
+
+from typing import NamedTuple
+from dms2122backend.data.db.results.question import Question
+
+
+class QuestionSnapshot(NamedTuple):
+    """ Immutable copy of a question record, detached from any session.
+    """
+    id: int
+    title: str
+    body: str
+    option1: str
+    option2: str
+    option3: str
+    correct_answer: int
+    punctuation: float
+    penalty: float
+
+    @staticmethod
+    def of(question: Question) -> 'QuestionSnapshot':
+        """ Copies a question record.
+
+        Args:
+            - question (Question): The question record.
+
+        Returns:
+            - QuestionSnapshot: The copy of the question.
+        """
+        return QuestionSnapshot(
+            question.id, question.title, question.body,  # type: ignore
+            question.option1, question.option2, question.option3, question.correct_answer,
+            float(question.punctuation), float(question.penalty)
+        )
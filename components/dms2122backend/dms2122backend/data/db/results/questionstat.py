@@ -0,0 +1,53 @@
+""" QuestionStat Class Module
+"""
+
+from sqlalchemy import Table, MetaData, ForeignKey, Column, Integer, Float  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class QuestionStat(ResultBase):
+    """ Definition and storage of the per-question statistics ORM records.
+    """
+
+    def __init__(self, id: int, n_answers: int = 0, n_option1: int = 0, n_option2: int = 0,
+                 n_option3: int = 0, punctuation: float = 0):
+        """ Constructor method.
+
+        Initializes the statistics record of a question.
+
+        Args:
+            - id (int): The question id.
+            - n_answers (int): The number of answers to the question.
+            - n_option1 (int): The number of answers selecting the first option.
+            - n_option2 (int): The number of answers selecting the second option.
+            - n_option3 (int): The number of answers selecting any other option.
+            - punctuation (float): The sum of the punctuations obtained by the answers.
+        """
+        self.id: int = id
+        self.n_answers: int = n_answers
+        self.n_option1: int = n_option1
+        self.n_option2: int = n_option2
+        self.n_option3: int = n_option3
+        self.punctuation: float = punctuation
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'question_stats',
+            metadata,
+            Column('id', Integer, ForeignKey('questions.id'), primary_key=True),
+            Column('n_answers', Integer, nullable=False),
+            Column('n_option1', Integer, nullable=False),
+            Column('n_option2', Integer, nullable=False),
+            Column('n_option3', Integer, nullable=False),
+            Column('punctuation', Float, nullable=False)
+        )
@@ -0,0 +1,40 @@
+""" SchemaVersion class module.
+"""
+
+from sqlalchemy import Table, MetaData, Column, Integer, String  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class SchemaVersion(ResultBase):
+    """ Definition and storage of the applied schema migrations ORM records.
+    """
+
+    def __init__(self, version: int, description: str):
+        """ Constructor method.
+
+        Initializes an applied schema migration record.
+
+        Args:
+            - version (int): The version number the migration upgrades the schema to.
+            - description (str): A string describing the migration.
+        """
+        self.version: int = version
+        self.description: str = description
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'schema_version',
+            metadata,
+            Column('version', Integer, primary_key=True, autoincrement=False),
+            Column('description', String(256), nullable=False)
+        )
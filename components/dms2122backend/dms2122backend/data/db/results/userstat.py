@@ -0,0 +1,47 @@
+""" UserStat Class Module
+"""
+
+from sqlalchemy import Table, MetaData, Column, String, Integer, Float  # type: ignore
+from dms2122backend.data.db.results.resultbase import ResultBase
+
+
+class UserStat(ResultBase):
+    """ Definition and storage of the per-user statistics ORM records.
+    """
+
+    def __init__(self, user: str, n_answers: int = 0, user_punctuation: float = 0,
+                 answered_punctuation: float = 0):
+        """ Constructor method.
+
+        Initializes the statistics record of a user.
+
+        Args:
+            - user (str): A string with the student's name.
+            - n_answers (int): The number of answers made by the user.
+            - user_punctuation (float): The punctuation obtained by the user.
+            - answered_punctuation (float): The sum of the punctuations of the answered questions.
+        """
+        self.user: str = user
+        self.n_answers: int = n_answers
+        self.user_punctuation: float = user_punctuation
+        self.answered_punctuation: float = answered_punctuation
+
+    @staticmethod
+    def _table_definition(metadata: MetaData) -> Table:
+        """ Gets the table definition.
+
+        Args:
+            - metadata (MetaData): The database schema metadata
+                        (used to gather the entities' definitions and mapping)
+
+        Returns:
+            - Table: A `Table` object with the table definition.
+        """
+        return Table(
+            'user_stats',
+            metadata,
+            Column('user', String(32), primary_key=True),
+            Column('n_answers', Integer, nullable=False),
+            Column('user_punctuation', Float, nullable=False),
+            Column('answered_punctuation', Float, nullable=False)
+        )
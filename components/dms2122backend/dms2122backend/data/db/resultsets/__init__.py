@@ -3,3 +3,7 @@
 
 from .questions import Questions
 from .answers import Answers
+from .stats import Stats
+from .aggregates import Aggregates
+from .dataversions import DataVersions
+from .questioncache import QuestionCache
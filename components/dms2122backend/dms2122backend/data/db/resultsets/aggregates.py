@@ -0,0 +1,245 @@
+""" Aggregates class module.
+"""
+
+from typing import Dict, List, Set, Tuple
+from sqlalchemy import and_, bindparam, exists, insert, literal, select, update  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db.results import (
+    Answer, Question, UserStat, QuestionStat, CatalogueStat
+)
+
+
+class Aggregates():
+    """ Class responsible of keeping the statistics tables up to date.
+
+    The statistics tables are updated incrementally in the same transaction that modifies the
+    questions or answers tables, so none of these operations commit.
+    """
+    @staticmethod
+    def record_question(session: Session, question: Question) -> None:
+        """ Accounts a newly created question.
+
+        Args:
+            - session (Session): The session object.
+            - question (Question): The created question (already flushed, so it has an id).
+        """
+        session.add(QuestionStat(question.id))  # type: ignore
+        updated: int = session.query(CatalogueStat).filter_by(
+            id=CatalogueStat.ROW_ID
+        ).update({
+            CatalogueStat.n_questions: CatalogueStat.n_questions + 1,  # type: ignore
+            CatalogueStat.total_punctuation:  # type: ignore
+                CatalogueStat.total_punctuation + float(question.punctuation)  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            session.add(CatalogueStat(1, float(question.punctuation)))
+
+    @staticmethod
+    def record_questions(session: Session, after_id: int, n_questions: int,
+                         total_punctuation: float) -> None:
+        """ Accounts several newly created questions at once.
+
+        The questions are identified by id instead of by record, so they can be inserted in
+        bulk without fetching their generated ids.
+
+        Args:
+            - session (Session): The session object.
+            - after_id (int): Every question with a greater id and without statistics is
+              accounted as new.
+            - n_questions (int): The number of created questions.
+            - total_punctuation (float): The sum of the punctuations of the created questions.
+        """
+        if n_questions == 0:
+            return
+        new_questions = select([
+            Question.id, literal(0), literal(0), literal(0), literal(0), literal(0)  # type: ignore
+        ]).where(and_(
+            Question.id > after_id,  # type: ignore
+            ~exists().where(QuestionStat.id == Question.id)  # type: ignore
+        ))
+        session.execute(insert(QuestionStat).from_select([
+            'id', 'n_answers', 'n_option1', 'n_option2', 'n_option3', 'punctuation'
+        ], new_questions))
+        updated: int = session.query(CatalogueStat).filter_by(
+            id=CatalogueStat.ROW_ID
+        ).update({
+            CatalogueStat.n_questions: CatalogueStat.n_questions + n_questions,  # type: ignore
+            CatalogueStat.total_punctuation:  # type: ignore
+                CatalogueStat.total_punctuation + total_punctuation  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            session.add(CatalogueStat(n_questions, total_punctuation))
+
+    @staticmethod
+    def record_answer(session: Session, answer: Answer, question: Question) -> None:
+        """ Accounts a newly created answer.
+
+        Args:
+            - session (Session): The session object.
+            - answer (Answer): The created answer.
+            - question (Question): The answered question.
+        """
+        score: float = Aggregates.score(
+            answer.number, question.correct_answer, question.punctuation, question.penalty
+        )
+        updated: int = session.query(UserStat).filter_by(user=answer.user).update({
+            UserStat.n_answers: UserStat.n_answers + 1,  # type: ignore
+            UserStat.user_punctuation: UserStat.user_punctuation + score,  # type: ignore
+            UserStat.answered_punctuation:  # type: ignore
+                UserStat.answered_punctuation + float(question.punctuation)  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            session.add(UserStat(answer.user, 1, score, float(question.punctuation)))
+
+        option_column = {
+            1: QuestionStat.n_option1,  # type: ignore
+            2: QuestionStat.n_option2  # type: ignore
+        }.get(answer.number, QuestionStat.n_option3)  # type: ignore
+        updated = session.query(QuestionStat).filter_by(id=question.id).update({  # type: ignore
+            QuestionStat.n_answers: QuestionStat.n_answers + 1,  # type: ignore
+            option_column: option_column + 1,
+            QuestionStat.punctuation: QuestionStat.punctuation + score  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            new_stat = QuestionStat(question.id, 1, punctuation=score)  # type: ignore
+            setattr(new_stat, option_column.key, 1)  # type: ignore
+            session.add(new_stat)
+
+    @staticmethod
+    def record_answers(session: Session, user: str,
+                       answers: List[Tuple[int, Question]]) -> None:
+        """ Accounts several newly created answers of the same user.
+
+        The user statistics are updated once with the accumulated values, and the questions'
+        statistics with a single statement executed for every question (`executemany`).
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - answers (List[Tuple[int, Question]]): The selected option and the answered
+              question of each answer. Every question must appear only once.
+        """
+        if not answers:
+            return
+        params: List[Dict] = []
+        user_punctuation: float = 0
+        answered_punctuation: float = 0
+        for number, question in answers:
+            score: float = Aggregates.score(
+                number, question.correct_answer, question.punctuation, question.penalty
+            )
+            user_punctuation += score
+            answered_punctuation += float(question.punctuation)
+            params.append({
+                'stat_id': question.id,  # type: ignore
+                'option1': 1 if number == 1 else 0,
+                'option2': 1 if number == 2 else 0,
+                'option3': 0 if number in (1, 2) else 1,
+                'score': score
+            })
+
+        updated: int = session.query(UserStat).filter_by(user=user).update({
+            UserStat.n_answers: UserStat.n_answers + len(answers),  # type: ignore
+            UserStat.user_punctuation: UserStat.user_punctuation + user_punctuation,  # type: ignore
+            UserStat.answered_punctuation:  # type: ignore
+                UserStat.answered_punctuation + answered_punctuation  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            session.add(UserStat(user, len(answers), user_punctuation, answered_punctuation))
+
+        statement = update(QuestionStat).where(
+            QuestionStat.id == bindparam('stat_id')  # type: ignore
+        ).values({
+            QuestionStat.n_answers: QuestionStat.n_answers + 1,  # type: ignore
+            QuestionStat.n_option1: QuestionStat.n_option1 + bindparam('option1'),  # type: ignore
+            QuestionStat.n_option2: QuestionStat.n_option2 + bindparam('option2'),  # type: ignore
+            QuestionStat.n_option3: QuestionStat.n_option3 + bindparam('option3'),  # type: ignore
+            QuestionStat.punctuation: QuestionStat.punctuation + bindparam('score')  # type: ignore
+        }).execution_options(synchronize_session=False)
+        result = session.execute(statement, params)
+        if result.rowcount != len(params):
+            stored: Set[int] = {
+                id for (id,) in session.query(QuestionStat.id).filter(  # type: ignore
+                    QuestionStat.id.in_([param['stat_id'] for param in params])  # type: ignore
+                )
+            }
+            for param in params:
+                if param['stat_id'] not in stored:
+                    session.add(QuestionStat(
+                        param['stat_id'], 1, param['option1'], param['option2'],
+                        param['option3'], param['score']
+                    ))
+
+    @staticmethod
+    def rescore_question(session: Session, question: Question, old_correct_answer: int,
+                         old_punctuation: float, old_penalty: float) -> None:
+        """ Rescores the statistics affected by the edition of a question.
+
+        The users' punctuations are adjusted with one bulk update per distinct option selected
+        in the answers to the question, so the cost does not depend on the number of users.
+
+        Args:
+            - session (Session): The session object.
+            - question (Question): The question, already holding the new values.
+            - old_correct_answer (int): The correct option before the edition.
+            - old_punctuation (float): The punctuation before the edition.
+            - old_penalty (float): The penalty before the edition.
+        """
+        if (question.correct_answer == old_correct_answer
+                and question.punctuation == old_punctuation
+                and question.penalty == old_penalty):
+            return
+        punctuation_delta: float = float(question.punctuation) - float(old_punctuation)
+        if punctuation_delta != 0:
+            session.query(CatalogueStat).filter_by(id=CatalogueStat.ROW_ID).update({
+                CatalogueStat.total_punctuation:  # type: ignore
+                    CatalogueStat.total_punctuation + punctuation_delta  # type: ignore
+            }, synchronize_session=False)
+
+        numbers = session.query(Answer.number).filter(  # type: ignore
+            Answer.id == question.id  # type: ignore
+        ).distinct().all()
+        for (number,) in numbers:
+            score_delta: float = Aggregates.score(
+                number, question.correct_answer, question.punctuation, question.penalty
+            ) - Aggregates.score(number, old_correct_answer, old_punctuation, old_penalty)
+            if score_delta == 0 and punctuation_delta == 0:
+                continue
+            users = session.query(Answer.user).filter(  # type: ignore
+                Answer.id == question.id, Answer.number == number  # type: ignore
+            )
+            session.query(UserStat).filter(
+                UserStat.user.in_(users)  # type: ignore
+            ).update({
+                UserStat.user_punctuation: UserStat.user_punctuation + score_delta,  # type: ignore
+                UserStat.answered_punctuation:  # type: ignore
+                    UserStat.answered_punctuation + punctuation_delta  # type: ignore
+            }, synchronize_session=False)
+
+        question_stat = session.query(QuestionStat).filter_by(id=question.id).one_or_none()  # type: ignore
+        if question_stat is not None:
+            n_correct: int = {
+                1: question_stat.n_option1,
+                2: question_stat.n_option2,
+                3: question_stat.n_option3
+            }.get(question.correct_answer, 0)
+            question_stat.punctuation = n_correct * float(question.punctuation) \
+                - (question_stat.n_answers - n_correct) * float(question.penalty)
+
+    @staticmethod
+    def score(number: int, correct_answer: int, punctuation: float, penalty: float) -> float:
+        """ Computes the punctuation obtained by an answer.
+
+        Args:
+            - number (int): The selected option.
+            - correct_answer (int): The correct option of the question.
+            - punctuation (float): The punctuation of the question.
+            - penalty (float): The penalty of the question.
+
+        Returns:
+            - float: The question punctuation if the selected option is the correct one, or the
+              negated penalty otherwise.
+        """
+        if number == correct_answer:
+            return float(punctuation)
+        return -float(penalty)
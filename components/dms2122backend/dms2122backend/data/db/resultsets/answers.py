@@ -2,20 +2,33 @@
 """
 
 import hashlib
-from typing import List
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+from sqlalchemy import and_, case, exists, or_, select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122backend.data.db.results import Answer
+from dms2122backend.data.db.results import Answer, Question
+from dms2122backend.data.db.resultsets.aggregates import Aggregates
+from dms2122backend.data.db.resultsets.dataversions import DataVersions
 from dms2122backend.data.db.exc.questionorusernotfounderror import QuestionOrUserNotFoundError
+from dms2122backend.data.db.exc.answerexistserror import AnswerExistsError
 
 class Answers():
     """ Class responsible of table-level answers operations.
+
+    The read-only listings are issued as Core `select` statements with explicit columns, so
+    their rows are plain tuples with the columns in the order of `FIELDS` instead of `Answer`
+    records tracked by the session.
     """
+
+    FIELDS: List[str] = ['id', 'user', 'number']
     @staticmethod
     def answer(session: Session, username: str, number: int, questionId: int) -> Answer:
         """ Answers a question.
 
+        The statistics tables and the `answers` data version stamp are updated in the same
+        transaction.
+
         Note:
             Any existing transaction will be committed.
 
@@ -37,6 +50,12 @@ class Answers():
         try:
             new_answer = Answer(username, number, questionId)
             session.add(new_answer)
+            session.flush()
+            question = session.query(Question).filter_by(id=questionId).one_or_none()
+            if question is None:
+                raise QuestionOrUserNotFoundError()
+            Aggregates.record_answer(session, new_answer, question)
+            DataVersions.bump(session, DataVersions.ANSWERS)
             session.commit()
             return new_answer
         except IntegrityError as ex:
@@ -47,46 +66,131 @@ class Answers():
             raise
         
     @staticmethod
-    def list_all_for_user(session: Session, user: str) -> List[Answer]:
+    def answer_many(session: Session, username: str,
+                    answers: List[Tuple[int, int]]) -> List[Optional[Exception]]:
+        """ Answers several questions at once.
+
+        The answers are validated together (one query for the answered questions and another
+        one for the user's previous answers), and the valid ones are inserted with a single
+        `executemany` in one transaction, along with the statistics tables updates. Invalid
+        answers are skipped without affecting the rest.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - username (str): The user name string.
+            - answers (List[Tuple[int, int]]): The question id and the answer's selection
+              number of each answer.
+
+        Raises:
+            - ValueError: If the username or the list of answers is empty.
+            - QuestionOrUserNotFoundError: If the answers could not be stored.
+
+        Returns:
+            - List[Optional[Exception]]: The result of each answer, in the same order: `None`
+              if it was created, or the error that prevented it (`ValueError` if a field is
+              empty, `QuestionOrUserNotFoundError` if the question does not exist or
+              `AnswerExistsError` if the question was already answered by the user).
+        """
+        if not username or not answers:
+            raise ValueError('All fields are required.')
+        ids: List[int] = list({id for id, _ in answers if id})
+        try:
+            questions: Dict[int, Question] = {
+                question.id: question
+                for question in session.query(Question).filter(
+                    Question.id.in_(ids)  # type: ignore
+                )
+            }
+            answered: Set[int] = {
+                id for (id,) in session.query(Answer.id).filter(  # type: ignore
+                    Answer.user == username, Answer.id.in_(ids)  # type: ignore
+                )
+            }
+            results: List[Optional[Exception]] = []
+            new_answers: List[Tuple[int, Question]] = []
+            for id, number in answers:
+                if not id or not number:
+                    results.append(ValueError('All fields are required.'))
+                elif id not in questions:
+                    results.append(QuestionOrUserNotFoundError())
+                elif id in answered:
+                    results.append(AnswerExistsError())
+                else:
+                    answered.add(id)
+                    new_answers.append((number, questions[id]))
+                    results.append(None)
+            if new_answers:
+                session.bulk_insert_mappings(Answer, [
+                    {'user': username, 'id': question.id, 'number': number}  # type: ignore
+                    for number, question in new_answers
+                ])
+                Aggregates.record_answers(session, username, new_answers)
+                DataVersions.bump(session, DataVersions.ANSWERS)
+            session.commit()
+            return results
+        except IntegrityError as ex:
+            session.rollback()
+            raise QuestionOrUserNotFoundError() from ex
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def list_all_for_user(session: Session, user: str, after: Optional[int] = None,
+                          limit: Optional[int] = None) -> List[Tuple]:
         """Lists the `answers made by a certain user.
 
         Args:
             - session (Session): The session object.
             - user (str): The user name string.
+            - after (Optional[int]): If given, only the answers to questions with a greater id
+              are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Raises:
             - ValueError: If the username is missing.
 
         Returns:
-            - List[Answer]: A list of answer registers with the user answers.
+            - List[Tuple]: A list of rows with the answer columns (see `FIELDS`) of the user
+              answers, ordered by question id.
         """
         if not user:
             raise ValueError('A username is required.')
-        query = session.query(Answer).filter_by(
-            user=user
-        )
-        return query.all()
+        statement = select(Answers.__columns()).where(Answer.user == user)  # type: ignore
+        if after is not None:
+            statement = statement.where(Answer.id > after)  # type: ignore
+        statement = statement.order_by(Answer.id).limit(limit)  # type: ignore
+        return session.execute(statement).all()
 
     @staticmethod
-    def list_all_for_question(session: Session, id: int) -> List[Answer]:
+    def list_all_for_question(session: Session, id: int, after: Optional[str] = None,
+                              limit: Optional[int] = None) -> List[Tuple]:
         """Lists the `answers made to a certain question.
 
         Args:
             - session (Session): The session object.
             - id (int): The question id.
+            - after (Optional[str]): If given, only the answers of users sorted after this user
+              name are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Raises:
             - ValueError: If the question id is missing.
 
         Returns:
-            - List[Answer]: A list of answer registers with the question answers.
+            - List[Tuple]: A list of rows with the answer columns (see `FIELDS`) of the question
+              answers, ordered by user name.
         """
         if not id:
             raise ValueError('A question id is required.')
-        query = session.query(Answer).filter_by(
-            id=id
-        )
-        return query.all()
+        statement = select(Answers.__columns()).where(Answer.id == id)  # type: ignore
+        if after is not None:
+            statement = statement.where(Answer.user > after)  # type: ignore
+        statement = statement.order_by(Answer.user).limit(limit)  # type: ignore
+        return session.execute(statement).all()
 
     @staticmethod
     def question_has_answers(session: Session, id: int) -> bool:
@@ -104,9 +208,8 @@ class Answers():
         """
         if not id:
             raise ValueError('A question id is required.')
-        questions = Answers.list_all_for_question(session, id)
-
-        return len(questions) != 0
+        query = session.query(exists().where(Answer.id == id))  # type: ignore
+        return bool(query.scalar())
 
     @staticmethod
     def get_answer(session: Session, user: str, id: int) -> Answer:
@@ -131,14 +234,73 @@ class Answers():
         return query.one_or_none()
 
     @staticmethod
-    def list_all(session: Session) -> List[Answer]:
+    def list_all(session: Session, after: Optional[Tuple[str, int]] = None,
+                 limit: Optional[int] = None) -> List[Tuple]:
         """Lists every answer.
 
         Args:
             - session (Session): The session object.
+            - after (Optional[Tuple[str, int]]): If given, a pair with a user name and a
+              question id; only the answers sorted after it are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Returns:
-            - List[Answer]: A list of `Answer` registers.
+            - List[Tuple]: A list of rows with the answer columns (see `FIELDS`), ordered by user
+              name and question id.
         """
-        query = session.query(Answer)
-        return query.all()
\ No newline at end of file
+        statement = select(Answers.__columns())
+        if after is not None:
+            statement = statement.where(or_(
+                Answer.user > after[0],  # type: ignore
+                and_(Answer.user == after[0], Answer.id > after[1])  # type: ignore
+            ))
+        statement = statement.order_by(Answer.user, Answer.id).limit(limit)  # type: ignore
+        return session.execute(statement).all()
+
+    @staticmethod
+    def stream(session: Session, batch_size: int, user: Optional[str] = None,
+               id: Optional[int] = None) -> Iterator[Tuple[str, int, int]]:
+        """Iterates over the answers, optionally of a certain user and/or question.
+
+        The rows are fetched from the database in batches and are not loaded as `Answer`
+        records, so memory usage does not depend on the number of answers.
+
+        Args:
+            - session (Session): The session object.
+            - batch_size (int): The number of rows fetched at a time.
+            - user (Optional[str]): If given, only the answers of this user are iterated.
+            - id (Optional[int]): If given, only the answers to this question are iterated.
+
+        Returns:
+            - Iterator[Tuple[str, int, int]]: An iterator of tuples with the user name, question
+              id and selected option of each answer, ordered by user name and question id.
+        """
+        query = session.query(Answer.user, Answer.id, Answer.number)  # type: ignore
+        if user is not None:
+            query = query.filter(Answer.user == user)  # type: ignore
+        if id is not None:
+            query = query.filter(Answer.id == id)  # type: ignore
+        query = query.order_by(Answer.user, Answer.id).yield_per(batch_size)  # type: ignore
+        for row in query:
+            yield (row.user, row.id, row.number)
+
+    @staticmethod
+    def score_clause():
+        """Builds the SQL expression with the punctuation obtained by an answer.
+
+        The expression must be evaluated in a query where both the `answers` and the
+        `questions` tables are joined. It mirrors `AnswerLogic.answer_punctuation`: the
+        question punctuation if the selected option is the correct one, or the negated
+        penalty otherwise.
+
+        Returns:
+            - ColumnElement: A SQL expression with the answer punctuation.
+        """
+        return case(
+            [(Answer.number == Question.correct_answer, Question.punctuation)],
+            else_=-Question.penalty
+        )
+
+    @staticmethod
+    def __columns() -> List:
+        return [getattr(Answer, field) for field in Answers.FIELDS]
@@ -0,0 +1,70 @@
+""" DataVersions class module.
+"""
+
+from typing import Dict, List
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db.results import DataVersion
+
+
+class DataVersions():
+    """ Class responsible of the data version stamps.
+
+    Stamps are increased in the same transaction that modifies the data they name, so none of
+    these operations commit.
+    """
+
+    QUESTIONS: str = 'questions'
+    ANSWERS: str = 'answers'
+    STATS: str = 'stats'
+
+    @staticmethod
+    def get(session: Session, name: str) -> int:
+        """ Gets the current version of some data.
+
+        Args:
+            - session (Session): The session object.
+            - name (str): The name of the versioned data.
+
+        Returns:
+            - int: The version number (`0` if the data was never modified).
+        """
+        query = session.query(DataVersion.version).filter_by(name=name)  # type: ignore
+        return query.scalar() or 0
+
+    @staticmethod
+    def get_many(session: Session, names: List[str]) -> List[int]:
+        """ Gets the current versions of several data at once.
+
+        Args:
+            - session (Session): The session object.
+            - names (List[str]): The names of the versioned data.
+
+        Returns:
+            - List[int]: The version number of each data, in the same order (`0` if the data
+              was never modified).
+        """
+        versions: Dict[str, int] = dict(
+            session.query(DataVersion.name, DataVersion.version).filter(  # type: ignore
+                DataVersion.name.in_(names)  # type: ignore
+            ).all()
+        )
+        return [versions.get(name, 0) for name in names]
+
+    @staticmethod
+    def bump(session: Session, name: str) -> int:
+        """ Increases the version of some data.
+
+        Args:
+            - session (Session): The session object.
+            - name (str): The name of the versioned data.
+
+        Returns:
+            - int: The new version number.
+        """
+        updated: int = session.query(DataVersion).filter_by(name=name).update({
+            DataVersion.version: DataVersion.version + 1  # type: ignore
+        }, synchronize_session=False)
+        if updated == 0:
+            session.add(DataVersion(name, 1))
+            return 1
+        return DataVersions.get(session, name)
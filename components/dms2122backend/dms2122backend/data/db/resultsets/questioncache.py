@@ -0,0 +1,162 @@
+""" QuestionCache class module.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db.results import Question, QuestionSnapshot
+from dms2122backend.data.db.resultsets.dataversions import DataVersions
+
+
+class QuestionCache():
+    """ Monostate class keeping an in-process, size-bounded LRU cache of question snapshots.
+
+    Questions edited by this process are invalidated right after the edition is committed.
+    Editions made by other processes are detected through the `questions` data version stamp,
+    checked at most once every `check_interval` seconds; a new stamp clears the whole cache.
+    Missing questions are not cached, so creating questions requires no invalidation (only
+    recording the new stamp with `advance`).
+
+    The cached snapshots are meant for read paths only: operations writing data derived from
+    a question must read it in their own transaction.
+    """
+
+    __lock = threading.Lock()
+    __entries: 'OrderedDict[int, QuestionSnapshot]' = OrderedDict()
+    __max_size: int = 1024
+    __check_interval: float = 1.0
+    __version: Optional[int] = None
+    __checked_at: float = 0
+    __generation: int = 0
+    __hits: int = 0
+    __misses: int = 0
+
+    @staticmethod
+    def configure(max_size: int, check_interval: float) -> None:
+        """ Sets the cache parameters, emptying it.
+
+        Args:
+            - max_size (int): The maximum number of cached questions (`0` disables the cache).
+            - check_interval (float): The seconds between checks of the data version stamp
+              (`0` checks it on every lookup).
+        """
+        with QuestionCache.__lock:
+            QuestionCache.__max_size = max(0, int(max_size))
+            QuestionCache.__check_interval = max(0.0, float(check_interval))
+            QuestionCache.__clear()
+
+    @staticmethod
+    def get(session: Session, id: int) -> Optional[QuestionSnapshot]:
+        """ Obtains a question given an id, from the cache if possible.
+
+        Args:
+            - session (Session): The session object.
+            - id (int): The question id.
+
+        Raises:
+            - ValueError: If the question id is missing.
+
+        Returns:
+            - Optional[QuestionSnapshot]: The question snapshot, or `None` if there is no
+              question with that id.
+        """
+        if not id:
+            raise ValueError('A question id is required.')
+        if QuestionCache.__max_size == 0:
+            question = session.query(Question).filter_by(id=id).one_or_none()
+            return QuestionSnapshot.of(question) if question is not None else None
+        QuestionCache.__check_version(session)
+        with QuestionCache.__lock:
+            snapshot: Optional[QuestionSnapshot] = QuestionCache.__entries.get(id)
+            if snapshot is not None:
+                QuestionCache.__entries.move_to_end(id)
+                QuestionCache.__hits += 1
+                return snapshot
+            QuestionCache.__misses += 1
+            generation: int = QuestionCache.__generation
+        question = session.query(Question).filter_by(id=id).one_or_none()
+        if question is None:
+            return None
+        snapshot = QuestionSnapshot.of(question)
+        with QuestionCache.__lock:
+            # Skipped if invalidated meanwhile, since the read may predate the invalidation
+            if generation == QuestionCache.__generation:
+                QuestionCache.__entries[id] = snapshot
+                if len(QuestionCache.__entries) > QuestionCache.__max_size:
+                    QuestionCache.__entries.popitem(last=False)
+        return snapshot
+
+    @staticmethod
+    def invalidate(id: Optional[int] = None, version: Optional[int] = None) -> None:
+        """ Discards a cached question.
+
+        Args:
+            - id (Optional[int]): The question id. If not given, every question is discarded.
+            - version (Optional[int]): The `questions` data version stamp set by the
+              modification. If it directly follows the known one, no other process modified
+              the questions meanwhile, so the rest of the cache is kept valid.
+        """
+        with QuestionCache.__lock:
+            QuestionCache.__generation += 1
+            if id is None:
+                QuestionCache.__entries.clear()
+            else:
+                QuestionCache.__entries.pop(id, None)
+            if version is not None and QuestionCache.__version is not None \
+                    and version == QuestionCache.__version + 1:
+                QuestionCache.__version = version
+
+    @staticmethod
+    def advance(version: int) -> None:
+        """ Records the `questions` data version stamp set by a modification that did not
+        affect the cached questions (e.g., creating questions).
+
+        Args:
+            - version (int): The new data version stamp. If it does not directly follow the
+              known one, another process modified the questions meanwhile, and the cache will
+              be emptied on the next check.
+        """
+        with QuestionCache.__lock:
+            if QuestionCache.__version is not None and version == QuestionCache.__version + 1:
+                QuestionCache.__version = version
+
+    @staticmethod
+    def stats() -> Dict:
+        """ Gets the cache counters.
+
+        Returns:
+            - Dict: A dictionary with the number of `hits` and `misses` of the lookups, the
+              fraction of lookups answered from the cache (`hit_rate`), the number of cached
+              questions (`size`) and the `max_size`.
+        """
+        with QuestionCache.__lock:
+            lookups: int = QuestionCache.__hits + QuestionCache.__misses
+            return {
+                'hits': QuestionCache.__hits,
+                'misses': QuestionCache.__misses,
+                'hit_rate': QuestionCache.__hits / lookups if lookups else 0.0,
+                'size': len(QuestionCache.__entries),
+                'max_size': QuestionCache.__max_size
+            }
+
+    @staticmethod
+    def __check_version(session: Session) -> None:
+        now: float = time.monotonic()
+        if QuestionCache.__version is not None \
+                and now - QuestionCache.__checked_at < QuestionCache.__check_interval:
+            return
+        version: int = DataVersions.get(session, DataVersions.QUESTIONS)
+        with QuestionCache.__lock:
+            if version != QuestionCache.__version:
+                QuestionCache.__clear()
+                QuestionCache.__version = version
+            QuestionCache.__checked_at = now
+
+    @staticmethod
+    def __clear() -> None:
+        QuestionCache.__generation += 1
+        QuestionCache.__entries.clear()
+        QuestionCache.__version = None
+        QuestionCache.__checked_at = 0
@@ -2,23 +2,40 @@
 """
 
 import hashlib
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+from sqlalchemy import and_, case, exists, func, select  # type: ignore
 from sqlalchemy.exc import IntegrityError  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
 from sqlalchemy.orm.exc import NoResultFound  # type: ignore
-from dms2122backend.data.db.results import Question
+from dms2122backend.data.file import QuestionFile
+from dms2122backend.data.db.results import Question, Answer
+from dms2122backend.data.db.resultsets.answers import Answers
+from dms2122backend.data.db.resultsets.aggregates import Aggregates
+from dms2122backend.data.db.resultsets.dataversions import DataVersions
+from dms2122backend.data.db.resultsets.questioncache import QuestionCache
 from dms2122backend.data.db.exc import QuestionExistsError
 from dms2122backend.data.db.exc.questionorusernotfounderror import QuestionOrUserNotFoundError
 
 
 class Questions():
     """ Class responsible of table-level questions operations.
+
+    The read-only listings are issued as Core `select` statements with explicit columns, so
+    their rows are plain tuples (with the requested columns, every one in `FIELDS` by default,
+    followed by any extra ones) instead of `Question` records tracked by the session. As only
+    the requested columns are read, a listing that does not need the question bodies and
+    options does not load them at all.
     """
+
+    FIELDS: List[str] = ['id'] + QuestionFile.FIELDS
     @staticmethod
     def create(session: Session, title: str,  body: str, option1: str, option2: str, 
             option3: str, correct_answer: int, punctuation: float, penalty: float) -> Question:
         """ Creates a new question record.
 
+        The statistics tables and the `questions` data version stamp are updated in the same
+        transaction.
+
         Note:
             Any existing transaction will be committed.
 
@@ -45,13 +62,134 @@ class Questions():
         try:
             new_question = Question(title, body, option1, option2, option3, correct_answer, punctuation, penalty)
             session.add(new_question)
+            session.flush()
+            Aggregates.record_question(session, new_question)
+            version: int = DataVersions.bump(session, DataVersions.QUESTIONS)
             session.commit()
+            QuestionCache.advance(version)
             return new_question
         except IntegrityError as ex:
             raise QuestionExistsError(
                 'A question with title ' + title + ' already exists.'
                 ) from ex
         
+    @staticmethod
+    def create_many(session: Session, questions: Iterable[Tuple[Any, Optional[Dict]]],
+                    chunk_size: int) -> Dict:
+        """ Creates many question records at once.
+
+        The questions are processed in chunks, each one in its own transaction: the duplicates
+        are detected with a single query per chunk and the rest are inserted with a single
+        `executemany`, along with the statistics tables and data version stamp updates.
+
+        A question is a duplicate if its title is already in the catalogue or in a previous
+        question of the same call. A question is invalid if it lacks any field or any numeric
+        field cannot be converted.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - questions (Iterable[Tuple[Any, Optional[Dict]]]): The questions, as pairs with a
+              key identifying each question (e.g., the line of a file) and a dictionary with its
+              fields (or `None` if it could not be read).
+            - chunk_size (int): The number of questions processed in each transaction.
+
+        Raises:
+            - ValueError: If the chunk size is not positive.
+
+        Returns:
+            - Dict: A dictionary with the number of questions `created`, and the lists of keys
+              of the `duplicated` and `invalid` questions.
+        """
+        if chunk_size < 1:
+            raise ValueError('The chunk size must be a positive integer.')
+        result: Dict = {'created': 0, 'duplicated': [], 'invalid': []}
+        titles: Set[str] = set()
+        chunk: List[Tuple[Any, Dict]] = []
+        for key, fields in questions:
+            row: Optional[Dict] = Questions.__row(fields)
+            if row is None:
+                result['invalid'].append(key)
+                continue
+            chunk.append((key, row))
+            if len(chunk) >= chunk_size:
+                Questions.__create_chunk(session, chunk, titles, result)
+                chunk = []
+        if len(chunk) > 0:
+            Questions.__create_chunk(session, chunk, titles, result)
+        return result
+
+    @staticmethod
+    def __row(fields: Optional[Dict]) -> Optional[Dict]:
+        if fields is None or not all(fields.get(field) for field in QuestionFile.FIELDS):
+            return None
+        try:
+            row: Dict = {field: str(fields[field]) for field in QuestionFile.FIELDS[:5]}
+            row['correct_answer'] = int(fields['correct_answer'])
+            row['punctuation'] = float(fields['punctuation'])
+            row['penalty'] = float(fields['penalty'])
+        except (TypeError, ValueError):
+            return None
+        if not row['correct_answer'] or not row['punctuation'] or not row['penalty']:
+            return None
+        return row
+
+    @staticmethod
+    def __create_chunk(session: Session, chunk: List[Tuple[Any, Dict]], titles: Set[str],
+                       result: Dict) -> None:
+        try:
+            titles.update(
+                title for (title,) in session.query(Question.title).filter(  # type: ignore
+                    Question.title.in_({row['title'] for _, row in chunk})  # type: ignore
+                )
+            )
+            rows: List[Dict] = []
+            for key, row in chunk:
+                if row['title'] in titles:
+                    result['duplicated'].append(key)
+                    continue
+                titles.add(row['title'])
+                rows.append(row)
+            if len(rows) > 0:
+                last_id: int = session.query(func.max(Question.id)).scalar() or 0  # type: ignore
+                session.bulk_insert_mappings(Question, rows)
+                Aggregates.record_questions(
+                    session, last_id, len(rows), sum(row['punctuation'] for row in rows)
+                )
+                version: int = DataVersions.bump(session, DataVersions.QUESTIONS)
+            session.commit()
+            if len(rows) > 0:
+                QuestionCache.advance(version)
+            result['created'] += len(rows)
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def stream(session: Session, batch_size: int) -> Iterator[Dict]:
+        """Iterates over every question.
+
+        The rows are fetched from the database in batches and are not loaded as `Question`
+        records, so memory usage does not depend on the number of questions.
+
+        Args:
+            - session (Session): The session object.
+            - batch_size (int): The number of rows fetched at a time.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with the `id` and the fields of each
+              question, ordered by id.
+        """
+        columns = Questions.__columns()
+        query = session.query(*columns).order_by(Question.id).yield_per(batch_size)  # type: ignore
+        for row in query:
+            question: Dict = row._asdict()
+            question['punctuation'] = float(question['punctuation'])
+            question['penalty'] = float(question['penalty'])
+            yield question
+
     @staticmethod
     def list_all(session: Session) -> List[Question]:
         """Lists every question.
@@ -65,6 +203,99 @@ class Questions():
         query = session.query(Question)
         return query.all()
 
+    @staticmethod
+    def list_all_with_answered(session: Session, after: Optional[int] = None,
+                               limit: Optional[int] = None,
+                               fields: Optional[Sequence[str]] = None) -> List[Tuple]:
+        """Lists every question along with whether it has been answered or not.
+
+        The answered flag is computed by the database with a correlated EXISTS, so a single
+        query is issued and no answer is loaded.
+
+        Args:
+            - session (Session): The session object.
+            - after (Optional[int]): If given, only the questions with a greater id are listed.
+            - limit (Optional[int]): If given, the maximum number of questions listed.
+            - fields (Optional[Sequence[str]]): If given, the question columns read (any of
+              `FIELDS`), in this order.
+
+        Raises:
+            - ValueError: If any field is unknown.
+
+        Returns:
+            - List[Tuple]: A list of rows with the question columns and `answered` (`1` if the
+              question has any answer, `0` otherwise), ordered by question id.
+        """
+        answered = exists().where(Answer.id == Question.id)  # type: ignore
+        statement = select(
+            Questions.__columns(fields) + [case([(answered, 1)], else_=0).label('answered')]
+        )
+        if after is not None:
+            statement = statement.where(Question.id > after)  # type: ignore
+        statement = statement.order_by(Question.id).limit(limit)  # type: ignore
+        return session.execute(statement).all()
+
+    @staticmethod
+    def list_pending_for_user(session: Session, user: str,
+                              fields: Optional[Sequence[str]] = None) -> List[Tuple]:
+        """Lists the questions not yet answered by a certain user.
+
+        The filtering is done by the database with an anti-join, so a single query is issued
+        regardless of the number of questions.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - fields (Optional[Sequence[str]]): If given, the question columns read (any of
+              `FIELDS`), in this order.
+
+        Raises:
+            - ValueError: If the username is missing or any field is unknown.
+
+        Returns:
+            - List[Tuple]: A list of rows with the question columns, ordered by question id.
+        """
+        if not user:
+            raise ValueError('A username is required.')
+        answered = exists().where(
+            and_(Answer.id == Question.id, Answer.user == user)  # type: ignore
+        )
+        statement = select(Questions.__columns(fields)).where(~answered).order_by(  # type: ignore
+            Question.id  # type: ignore
+        )
+        return session.execute(statement).all()
+
+    @staticmethod
+    def list_answered_for_user(session: Session, user: str,
+                               fields: Optional[Sequence[str]] = None) -> List[Tuple]:
+        """Lists the questions answered by a certain user along with the punctuation obtained.
+
+        The punctuation of each answer is computed by the database in the same query.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - fields (Optional[Sequence[str]]): If given, the question columns read (any of
+              `FIELDS`), in this order.
+
+        Raises:
+            - ValueError: If the username is missing or any field is unknown.
+
+        Returns:
+            - List[Tuple]: A list of rows with the question columns and `answer_result` (the
+              punctuation of the user's answer), ordered by question id.
+        """
+        if not user:
+            raise ValueError('A username is required.')
+        statement = select(
+            Questions.__columns(fields) + [Answers.score_clause().label('answer_result')]
+        ).join_from(
+            Question, Answer, Answer.id == Question.id  # type: ignore
+        ).where(
+            Answer.user == user  # type: ignore
+        ).order_by(Question.id)  # type: ignore
+        return session.execute(statement).all()
+
     @staticmethod
     def get_question_by_id(session: Session, id: int,) -> Optional[Question]:
         """ Obtains a question given an id.
@@ -90,6 +321,11 @@ class Questions():
                 option3: str, correct_answer: int, punctuation: float, penalty: float) -> Question:
         """ Edit an exist question.
 
+        The statistics affected by the changes in the correct answer, punctuation or penalty
+        are rescored in the same transaction. The question is then discarded from the
+        `QuestionCache`, and the `questions` data version stamp is increased so other processes
+        discard it too.
+
         Args:
             - id (int): A question id.
             - title: (str): A string with the question title.
@@ -109,6 +345,9 @@ class Questions():
         edit_question = Questions.get_question_by_id(session, id)
 
         if edit_question is not None:
+            old_correct_answer: int = edit_question.correct_answer
+            old_punctuation: float = edit_question.punctuation
+            old_penalty: float = edit_question.penalty
             edit_question.title = title
             edit_question.body = body
             edit_question.option1 = option1
@@ -117,10 +356,23 @@ class Questions():
             edit_question.correct_answer = correct_answer
             edit_question.punctuation = punctuation
             edit_question.penalty = penalty
+            Aggregates.rescore_question(
+                session, edit_question, old_correct_answer, old_punctuation, old_penalty
+            )
+            version: int = DataVersions.bump(session, DataVersions.QUESTIONS)
 
             session.commit()
+            QuestionCache.invalidate(id, version)
 
             return edit_question
         
         raise QuestionOrUserNotFoundError()
 
+    @staticmethod
+    def __columns(fields: Optional[Sequence[str]] = None) -> List:
+        if fields is None:
+            fields = Questions.FIELDS
+        for field in fields:
+            if field not in Questions.FIELDS:
+                raise ValueError('Unknown question field: ' + str(field))
+        return [getattr(Question, field) for field in fields]
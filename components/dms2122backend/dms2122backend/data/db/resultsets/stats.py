@@ -0,0 +1,212 @@
+""" Stats class module.
+"""
+
+import math
+from decimal import Decimal
+from typing import Callable, Dict, List, Optional
+from sqlalchemy import case, func, select  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db.results import (
+    Answer, Question, UserStat, QuestionStat, CatalogueStat
+)
+from dms2122backend.data.db.resultsets.answers import Answers
+from dms2122backend.data.db.resultsets.dataversions import DataVersions
+
+
+class Stats():
+    """ Class responsible of the statistics tables.
+
+    The statistics tables are kept up to date incrementally (see `Aggregates`), so reading
+    them costs one row per question or user, read as a plain tuple with a Core `select`.
+    `rebuild` regenerates them from scratch.
+    """
+    @staticmethod
+    def questions_stats(session: Session) -> List:
+        """Gets the answer statistics of every question.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - List: A list of rows, one per question ordered by id, with the columns `title`,
+              `n_answers`, `n_option1`, `n_option2`, `n_option3` and `avg_punctuation` (which
+              is `0` if the question has no answers), in this order.
+        """
+        statement = select([
+            Question.title,  # type: ignore
+            func.coalesce(QuestionStat.n_answers, 0).label('n_answers'),  # type: ignore
+            func.coalesce(QuestionStat.n_option1, 0).label('n_option1'),  # type: ignore
+            func.coalesce(QuestionStat.n_option2, 0).label('n_option2'),  # type: ignore
+            func.coalesce(QuestionStat.n_option3, 0).label('n_option3'),  # type: ignore
+            case([(
+                QuestionStat.n_answers > 0,  # type: ignore
+                QuestionStat.punctuation / QuestionStat.n_answers  # type: ignore
+            )], else_=0).label('avg_punctuation')
+        ]).join_from(
+            Question, QuestionStat, QuestionStat.id == Question.id, isouter=True  # type: ignore
+        ).order_by(Question.id)  # type: ignore
+        return session.execute(statement).all()
+
+    @staticmethod
+    def users_stats(session: Session, user: Optional[str] = None, after: Optional[str] = None,
+                    limit: Optional[int] = None) -> List:
+        """Gets the answer statistics of every user (or a single one).
+
+        Args:
+            - session (Session): The session object.
+            - user (Optional[str]): If given, only the statistics of this user are returned.
+            - after (Optional[str]): If given, only the users sorted after this user name are
+              listed.
+            - limit (Optional[int]): If given, the maximum number of users listed.
+
+        Returns:
+            - List: A list of rows, one per user that answered any question ordered by user
+              name, with the columns `user`, `n_answers`, `user_punctuation` (the punctuation
+              obtained) and `answered_punctuation` (the maximum punctuation of the answered
+              questions).
+        """
+        statement = select([
+            UserStat.user,  # type: ignore
+            UserStat.n_answers,  # type: ignore
+            UserStat.user_punctuation,  # type: ignore
+            UserStat.answered_punctuation  # type: ignore
+        ]).where(UserStat.n_answers > 0)  # type: ignore
+        if user is not None:
+            statement = statement.where(UserStat.user == user)  # type: ignore
+        if after is not None:
+            statement = statement.where(UserStat.user > after)  # type: ignore
+        statement = statement.order_by(UserStat.user).limit(limit)  # type: ignore
+        return session.execute(statement).all()
+
+    @staticmethod
+    def total_punctuation(session: Session) -> float:
+        """Gets the sum of the punctuations of every question in the catalogue.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - float: The total punctuation (`0` if there are no questions).
+        """
+        query = session.query(CatalogueStat.total_punctuation).filter_by(  # type: ignore
+            id=CatalogueStat.ROW_ID
+        )
+        return float(query.scalar() or 0)
+
+    @staticmethod
+    def is_built(session: Session) -> bool:
+        """Finds out whether the statistics tables have ever been built.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - bool: Whether the catalogue statistics row exists.
+        """
+        query = session.query(CatalogueStat).filter_by(id=CatalogueStat.ROW_ID)
+        return query.one_or_none() is not None
+
+    @staticmethod
+    def rebuild(session: Session) -> Dict[str, int]:
+        """Regenerates the statistics tables from the questions and answers tables.
+
+        If any drift is fixed, the `stats` data version stamp is increased, so the entity tags
+        of the statistics change too.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - Dict[str, int]: The number of rows (`questions`, `users` and `catalogue`) whose
+              stored statistics differed from the regenerated ones (i.e., the drift).
+        """
+        try:
+            drift: Dict[str, int] = {}
+            drift['questions'] = Stats.__sync(
+                session,
+                {row.id: row for row in Stats.__compute_questions_stats(session)},
+                {stat.id: stat for stat in session.query(QuestionStat).all()},
+                QuestionStat,
+                ['n_answers', 'n_option1', 'n_option2', 'n_option3', 'punctuation']
+            )
+            drift['users'] = Stats.__sync(
+                session,
+                {row.user: row for row in Stats.__compute_users_stats(session)},
+                {stat.user: stat for stat in session.query(UserStat).all()},
+                UserStat,
+                ['n_answers', 'user_punctuation', 'answered_punctuation']
+            )
+            catalogue = session.query(
+                func.count(Question.id).label('n_questions'),  # type: ignore
+                func.coalesce(
+                    func.sum(Question.punctuation), 0  # type: ignore
+                ).label('total_punctuation')
+            ).one()
+            drift['catalogue'] = Stats.__sync(
+                session,
+                {CatalogueStat.ROW_ID: catalogue},
+                {stat.id: stat for stat in session.query(CatalogueStat).all()},
+                lambda _: CatalogueStat(),
+                ['n_questions', 'total_punctuation']
+            )
+            if any(drift.values()):
+                DataVersions.bump(session, DataVersions.STATS)
+            session.commit()
+            return drift
+        except:
+            session.rollback()
+            raise
+
+    @staticmethod
+    def __compute_questions_stats(session: Session) -> List:
+        score = case([(Answer.user.isnot(None), Answers.score_clause())], else_=0)  # type: ignore
+        query = session.query(
+            Question.id,  # type: ignore
+            func.count(Answer.user).label('n_answers'),  # type: ignore
+            func.sum(case([(Answer.number == 1, 1)], else_=0)).label('n_option1'),  # type: ignore
+            func.sum(case([(Answer.number == 2, 1)], else_=0)).label('n_option2'),  # type: ignore
+            func.sum(
+                case([(Answer.number.notin_([1, 2]), 1)], else_=0)  # type: ignore
+            ).label('n_option3'),
+            func.sum(score).label('punctuation')
+        ).outerjoin(
+            Answer, Answer.id == Question.id  # type: ignore
+        ).group_by(Question.id)  # type: ignore
+        return query.all()
+
+    @staticmethod
+    def __compute_users_stats(session: Session) -> List:
+        query = session.query(
+            Answer.user,  # type: ignore
+            func.count(Answer.id).label('n_answers'),  # type: ignore
+            func.sum(Answers.score_clause()).label('user_punctuation'),
+            func.sum(Question.punctuation).label('answered_punctuation')  # type: ignore
+        ).join(
+            Question, Question.id == Answer.id  # type: ignore
+        ).group_by(Answer.user)  # type: ignore
+        return query.all()
+
+    @staticmethod
+    def __sync(session: Session, computed: Dict, stored: Dict, new_stat: Callable,
+               columns: List[str]) -> int:
+        drift: int = 0
+        for key, row in computed.items():
+            stat = stored.pop(key, None)
+            drifted: bool = stat is None
+            if stat is None:
+                stat = new_stat(key)
+                session.add(stat)
+            for column in columns:
+                value = getattr(row, column)
+                if not math.isclose(float(getattr(stat, column)), float(value), abs_tol=1e-9):
+                    setattr(stat, column, float(value) if isinstance(value, Decimal) else value)
+                    drifted = True
+            if drifted:
+                drift += 1
+        for stat in stored.values():
+            session.delete(stat)
+            drift += 1
+        return drift
@@ -1,39 +1,31 @@
 """ Schema class module.
 """
 
-from sqlalchemy import create_engine, event  # type: ignore
-from sqlalchemy.engine import Engine  # type: ignore
+from typing import Dict, List, Tuple
 from sqlalchemy.ext.declarative import declarative_base  # type: ignore
 from sqlalchemy.orm import sessionmaker, scoped_session  # type: ignore
 from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122common.data.db import EngineFactory, MigrationRunner, StorageProfile
 from dms2122backend.data.config import BackendConfiguration
+from dms2122backend.data.db.migrations import Migrations
 from dms2122backend.data.db.results import Answer, Question
-
-
-# Required for SQLite to enforce FK integrity when supported
-@event.listens_for(Engine, 'connect')
-def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
-    """ Sets the SQLite foreign keys enforcement pragma on connection.
-
-    Args:
-        - dbapi_connection: The connection to the database API.
-    """
-    cursor = dbapi_connection.cursor()
-    cursor.execute('PRAGMA foreign_keys = ON;')
-    cursor.close()
+from dms2122backend.data.db.results import UserStat, QuestionStat, CatalogueStat, SchemaVersion
+from dms2122backend.data.db.results import DataVersion
+from dms2122backend.data.db.resultsets import Stats, QuestionCache
 
 
 class Schema():
     """ Class responsible of the schema initialization and session generation.
     """
 
-    def __init__(self, config: BackendConfiguration):
+    def __init__(self, config: BackendConfiguration, migrate: bool = True):
         """ Constructor method.
 
         Initializes the schema, deploying it if necessary.
 
         Args:
             - config (BackendConfiguration): The instance with the schema connection parameters.
+            - migrate (bool): Whether the pending migrations are applied.
 
         Raises:
             - RuntimeError: When the connection cannot be created/established.
@@ -44,12 +36,89 @@ class Schema():
                 'A value for the configuration parameter `db_connection_string` is needed.'
             )
         db_connection_string: str = config.get_db_connection_string() or ''
-        self.__create_engine = create_engine(db_connection_string)
+        self.__create_engine = EngineFactory.new_engine(
+            db_connection_string, config.get_storage()
+        )
         self.__session_maker = scoped_session(sessionmaker(bind=self.__create_engine))
+        self.__migrations: MigrationRunner = MigrationRunner(Migrations.steps(), SchemaVersion)
 
         Question.map(self.__declarative_base.metadata)
         Answer.map(self.__declarative_base.metadata)
+        UserStat.map(self.__declarative_base.metadata)
+        QuestionStat.map(self.__declarative_base.metadata)
+        CatalogueStat.map(self.__declarative_base.metadata)
+        SchemaVersion.map(self.__declarative_base.metadata)
+        DataVersion.map(self.__declarative_base.metadata)
         self.__declarative_base.metadata.create_all(self.__create_engine)
+        if migrate:
+            self.migrate()
+        self.__build_stats()
+        QuestionCache.configure(
+            config.get_question_cache_size(), config.get_question_cache_check_interval()
+        )
+
+    def __build_stats(self) -> None:
+        """ Builds the statistics tables if they were never built (e.g., a new database or one
+        created before they existed).
+        """
+        session: Session = self.new_session()
+        try:
+            if not Stats.is_built(session):
+                Stats.rebuild(session)
+        finally:
+            self.remove_session()
+
+    def storage_settings(self) -> Dict:
+        """ Reads the effective storage settings of the database.
+
+        Returns:
+            - Dict: A dictionary with the effective SQLite pragmas (empty for other databases)
+              and the connection pool status.
+        """
+        settings: Dict = {}
+        if self.__create_engine.dialect.name == 'sqlite':
+            connection = self.__create_engine.raw_connection()
+            try:
+                settings.update(StorageProfile.report(connection))
+            finally:
+                connection.close()
+        settings['pool'] = self.__create_engine.pool.status()
+        return settings
+
+    def migrate(self) -> List[Tuple[int, str]]:
+        """ Applies the pending migrations.
+
+        Returns:
+            - List[Tuple[int, str]]: A list of pairs with the version and description of each
+              applied migration.
+        """
+        session: Session = self.new_session()
+        try:
+            return self.__migrations.upgrade(session, self.__declarative_base.metadata)
+        finally:
+            self.remove_session()
+
+    def pending_migrations(self) -> List[Tuple[int, str]]:
+        """ Lists the migrations not yet applied.
+
+        Returns:
+            - List[Tuple[int, str]]: A list of pairs with the version and description of each
+              pending migration.
+        """
+        session: Session = self.new_session()
+        try:
+            return self.__migrations.pending(session)
+        finally:
+            self.remove_session()
+
+    def dispose(self) -> None:
+        """ Discards the pooled connections without closing them.
+
+        Meant to be called in a process forked after the schema was initialized, so it opens
+        its own connections instead of sharing the ones of its parent (which keeps using
+        them).
+        """
+        self.__create_engine.dispose(close=False)
 
     def new_session(self) -> Session:
         """ Constructs a new session.
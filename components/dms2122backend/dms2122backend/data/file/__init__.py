@@ -0,0 +1,4 @@
+""" Data layer file readers and writers.
+"""
+
+from .questionfile import QuestionFile
@@ -0,0 +1,109 @@
+""" QuestionFile class module.
+"""
+
+import csv
+import io
+import json
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+
+class QuestionFile():
+    """ Monostate class responsible of reading and writing question bank files.
+
+    Two formats are supported: JSON Lines (`jsonl`, one JSON object per line) and CSV (`csv`,
+    with a header row). Both hold the fields listed in `FIELDS`; any other field is ignored on
+    reading.
+    """
+
+    FORMATS: Tuple[str, ...] = ('jsonl', 'csv')
+    FIELDS: List[str] = [
+        'title', 'body', 'option1', 'option2', 'option3', 'correct_answer', 'punctuation',
+        'penalty'
+    ]
+
+    @staticmethod
+    def read(lines: Iterable[str], file_format: str) -> Iterator[Tuple[int, Optional[Dict]]]:
+        """ Reads the questions of a file.
+
+        Args:
+            - lines (Iterable[str]): The lines of the file (e.g., an open text file).
+            - file_format (str): The file format (one of `FORMATS`).
+
+        Raises:
+            - ValueError: If the format is not supported.
+
+        Returns:
+            - Iterator[Tuple[int, Optional[Dict]]]: An iterator of pairs with the line number and
+              a dictionary with the question fields, or `None` if the record is malformed. Blank
+              lines are skipped.
+        """
+        if file_format == 'jsonl':
+            return QuestionFile.__read_jsonl(lines)
+        if file_format == 'csv':
+            return QuestionFile.__read_csv(lines)
+        raise ValueError('Unsupported question file format: ' + str(file_format))
+
+    @staticmethod
+    def write(questions: Iterable[Dict], file_format: str, chunk_size: int = 1000) -> Iterator[str]:
+        """ Writes the questions to a file incrementally.
+
+        Args:
+            - questions (Iterable[Dict]): The questions data. Fields other than `id` and the
+              ones in `FIELDS` are not written.
+            - file_format (str): The file format (one of `FORMATS`).
+            - chunk_size (int): The number of questions written in each chunk.
+
+        Raises:
+            - ValueError: If the format is not supported.
+
+        Returns:
+            - Iterator[str]: An iterator of text chunks that, concatenated, make the file.
+        """
+        if file_format not in QuestionFile.FORMATS:
+            raise ValueError('Unsupported question file format: ' + str(file_format))
+        return QuestionFile.__write(questions, file_format, chunk_size)
+
+    @staticmethod
+    def __read_jsonl(lines: Iterable[str]) -> Iterator[Tuple[int, Optional[Dict]]]:
+        for number, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError:
+                yield (number, None)
+                continue
+            yield (number, record if isinstance(record, dict) else None)
+
+    @staticmethod
+    def __read_csv(lines: Iterable[str]) -> Iterator[Tuple[int, Optional[Dict]]]:
+        reader = csv.DictReader(lines)
+        try:
+            for record in reader:
+                if not any(record.values()):
+                    continue
+                yield (reader.line_num, None if None in record else dict(record))
+        except csv.Error:
+            yield (reader.line_num, None)
+
+    @staticmethod
+    def __write(questions: Iterable[Dict], file_format: str, chunk_size: int) -> Iterator[str]:
+        fields: List[str] = ['id'] + QuestionFile.FIELDS
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fields, extrasaction='ignore', lineterminator='\n')
+        if file_format == 'csv':
+            writer.writeheader()
+        count: int = 0
+        for question in questions:
+            if file_format == 'csv':
+                writer.writerow(question)
+            else:
+                buffer.write(json.dumps({field: question.get(field) for field in fields}) + '\n')
+            count += 1
+            if count >= chunk_size:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+                count = 0
+        if buffer.tell() > 0:
+            yield buffer.getvalue()
@@ -1,4 +1,5 @@
 """ Data layer REST clients.
 """
 
-from .authservice import AuthService
\ No newline at end of file
+from .authservice import AuthService
+from .roledecisioncache import RoleDecisionCache
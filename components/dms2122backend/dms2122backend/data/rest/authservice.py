@@ -1,10 +1,15 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+import base64
+import binascii
+import json
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple, Union
 import requests
 from dms2122common.data import Role
-from dms2122common.data.rest import ResponseData
+from dms2122common.data.rest import HTTPSession, ResponseData, TokenVerifier
+from dms2122backend.data.rest.roledecisioncache import RoleDecisionCache
 
 
 class AuthService():
@@ -15,7 +20,10 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 http_session: Optional[HTTPSession] = None,
+                 token_verifier: Optional[TokenVerifier] = None,
+                 role_cache: Optional[RoleDecisionCache] = None
                  ):
         """ Constructor method.
 
@@ -27,12 +35,22 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - http_session (Optional[HTTPSession]): The pooled HTTP client used to send the
+              requests, which may be shared with other clients (a new one by default).
+            - token_verifier (Optional[TokenVerifier]): The verifier of the user session tokens,
+              if they can be verified locally. Requests with tokens that do not pass the
+              verification are then rejected without being sent.
+            - role_cache (Optional[RoleDecisionCache]): The cache of the role decisions
+              requested to the service, if any.
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__http: HTTPSession = http_session or HTTPSession()
+        self.__token_verifier: Optional[TokenVerifier] = token_verifier
+        self.__role_cache: Optional[RoleDecisionCache] = role_cache
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -42,20 +60,86 @@ class AuthService():
         """
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
-    def get_user_has_role(self, token: Optional[str], username: str, rolename: str) -> ResponseData:
-        """ Requests the list of roles assigned to a user.
+    def __rejected(self, token: Optional[str]) -> Optional[ResponseData]:
+        """ Verifies a user session token locally, if possible.
 
         Args:
             - token (Optional[str]): The user session token.
+
+        Returns:
+            - Optional[ResponseData]: An unsuccessful response if the token is not valid, or
+              `None` if it is (or it cannot be verified locally).
+        """
+        if self.__token_verifier is None or self.__token_verifier.verify(token) is not None:
+            return None
+        return self.__rejection()
+
+    def __rejection(self) -> ResponseData:
+        """ Builds the response to a request with an invalid user session token.
+
+        Returns:
+            - ResponseData: An unsuccessful response.
+        """
+        response_data: ResponseData = ResponseData()
+        response_data.set_successful(False)
+        response_data.add_message('Invalid or expired session token')
+        response_data.set_content([])
+        return response_data
+
+    def __unverified_user(self, token: str) -> Optional[str]:
+        """ Reads the user name from the claims of a user session token without verifying it.
+
+        Args:
+            - token (str): The user session token.
+
+        Returns:
+            - Optional[str]: The user name, or `None` if the token is malformed.
+        """
+        parts: List[str] = token.split('.')
+        if len(parts) != 3:
+            return None
+        try:
+            padding: str = '=' * (-len(parts[1]) % 4)
+            claims = json.loads(base64.urlsafe_b64decode(parts[1] + padding).decode('utf-8'))
+        except (binascii.Error, UnicodeError, ValueError):
+            return None
+        if not isinstance(claims, dict) or not isinstance(claims.get('user'), str):
+            return None
+        return claims['user']
+
+    def __decision(self, username: str, rolename: str, has_role: bool) -> ResponseData:
+        """ Builds the response to a role query answered without a request.
+
+        Args:
             - username (str): The name of the queried user.
-            - rolename (str): The role of the user.
+            - rolename (str): The role name.
+            - has_role (bool): Whether the user has the role.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of role names. Otherwise an
-              empty list.
+            - ResponseData: A response successful if the user has the role.
+        """
+        response_data: ResponseData = ResponseData()
+        response_data.set_successful(has_role)
+        if not has_role:
+            response_data.add_message(f'User {username} does not have the role {rolename}')
+            response_data.set_content([])
+        return response_data
+
+    def __request_has_role(self, token: Optional[str], username: str,
+                           rolename: str) -> Tuple[ResponseData, Optional[bool]]:
+        """ Requests whether a user has a role to the service.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - username (str): The name of the queried user.
+            - rolename (str): The role name.
+
+        Returns:
+            - Tuple[ResponseData, Optional[bool]]: The response, and the decision of the
+              service (`None` if it did not decide, e.g., because the token was rejected).
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__http.get(
             self.__base_url() + f'/user/{username}/role/{rolename}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -64,11 +148,114 @@ class AuthService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            # The service answers with no content
+            response_data.set_content(response.json() if response.content else None)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
-        return response_data
+        decision: Optional[bool] = None
+        if response.status_code == HTTPStatus.OK.value:
+            decision = True
+        elif response.status_code == HTTPStatus.NOT_FOUND.value:
+            decision = False
+        return response_data, decision
+
+    def verify_token(self, token: Optional[str]) -> Optional[Dict]:
+        """ Verifies a user session token locally.
+
+        Args:
+            - token (Optional[str]): The user session token.
+
+        Returns:
+            - Optional[Dict]: The claims of the token (see `TokenVerifier`) or `None` if it is
+              not valid or there is no token verifier.
+        """
+        if self.__token_verifier is None:
+            return None
+        return self.__token_verifier.verify(token)
+
+    def get_token_user(self, token: Optional[str]) -> Optional[str]:
+        """ Gets the name of the user a session token was issued to.
+
+        With a token verifier, the token is verified first. Otherwise, the name is read as given
+        in the token, so the token must still be verified by the service (e.g., by querying the
+        roles of that same user with `get_user_has_role`).
+
+        Args:
+            - token (Optional[str]): The user session token.
+
+        Returns:
+            - Optional[str]: The user name, or `None` if there is no token or it is not valid.
+        """
+        if not token:
+            return None
+        if self.__token_verifier is None:
+            return self.__unverified_user(token)
+        claims: Optional[Dict] = self.__token_verifier.verify(token)
+        if claims is None:
+            return None
+        return claims['user']
+
+    def get_user_has_role(self, token: Optional[str], username: str, rolename: str) -> ResponseData:
+        """ Requests whether a user has a role.
+
+        When the token is verified locally and claims the roles of the same user, they are
+        answered from those claims without sending the request. Otherwise, the decision is
+        taken from the role cache, if any, and only requested on a miss.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - username (str): The name of the queried user.
+            - rolename (str): The role of the user.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list of role names. Otherwise an
+              empty list.
+        """
+        if self.__token_verifier is not None:
+            claims: Optional[Dict] = self.__token_verifier.verify(token)
+            if claims is None:
+                return self.__rejection()
+            if claims['user'] == username and isinstance(claims.get('roles'), list):
+                return self.__decision(username, rolename, rolename in claims['roles'])
+        if self.__role_cache is None or not token:
+            return self.__request_has_role(token, username, rolename)[0]
+
+        requested: List[ResponseData] = []
+
+        def load() -> Optional[bool]:
+            response_data, decision = self.__request_has_role(token, username, rolename)
+            requested.append(response_data)
+            return decision
+
+        has_role: Optional[bool] = self.__role_cache.get(token, username, rolename, load)
+        if requested:
+            return requested[0]
+        if has_role is None:
+            # The concurrent request got no decision to share
+            return self.__request_has_role(token, username, rolename)[0]
+        return self.__decision(username, rolename, has_role)
+
+    def invalidate_role_decisions(self, username: Optional[str] = None) -> None:
+        """ Discards the cached role decisions, e.g., after the roles of a user change.
+
+        Args:
+            - username (Optional[str]): The user whose decisions are discarded. If not given,
+              every decision is discarded.
+        """
+        if self.__role_cache is not None:
+            self.__role_cache.invalidate(username)
+
+    def role_cache_stats(self) -> Optional[Dict]:
+        """ Gets the counters of the role decision cache.
+
+        Returns:
+            - Optional[Dict]: The counters (see `RoleDecisionCache.stats`), or `None` if there
+              is no cache.
+        """
+        if self.__role_cache is None:
+            return None
+        return self.__role_cache.stats()
 
     def list_users(self, token: Optional[str]) -> ResponseData:
         """ Requests a list of registered users.
@@ -80,8 +267,11 @@ class AuthService():
             - ResponseData: If successful, the contents hold a list of user data dictionaries.
               Otherwise, the contents will be an empty list.
         """
+        rejected: Optional[ResponseData] = self.__rejected(token)
+        if rejected is not None:
+            return rejected
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__http.get(
             self.__base_url() + '/users',
             headers={
                 'Authorization': f'Bearer {token}',
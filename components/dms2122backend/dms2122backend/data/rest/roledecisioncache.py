@@ -0,0 +1,146 @@
+""" RoleDecisionCache class module.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, Dict, Optional, Tuple
+
+
+class RoleDecisionCache():
+    """ In-process, size-bounded LRU cache of the decisions of the authentication service on
+    whether a user has a role.
+
+    Decisions are cached per user session token, as the service only answers to valid tokens:
+    a token never answered by the service cannot be authorized from the cache. Positive
+    decisions are kept for `ttl` seconds and negative ones for `negative_ttl` seconds, so
+    granted and revoked roles are noticed after those intervals at most (or right away, when
+    `invalidate` is called).
+
+    Concurrent lookups of the same decision are coalesced: only the first one requests it,
+    and the rest wait for its answer. Answers that are not a decision (e.g., errors) are never
+    cached nor shared.
+    """
+
+    def __init__(self, max_size: int = 4096, ttl: float = 30.0, negative_ttl: float = 5.0):
+        """ Constructor method.
+
+        Args:
+            - max_size (int): The maximum number of cached decisions (`0` disables the cache).
+            - ttl (float): The seconds a positive decision is kept.
+            - negative_ttl (float): The seconds a negative decision is kept (`0` does not
+              cache them).
+        """
+        self.__lock = threading.Lock()
+        self.__entries: 'OrderedDict[Tuple[str, str, str], Tuple[bool, float]]' = OrderedDict()
+        self.__flights: Dict[Tuple[str, str, str], Future] = {}
+        self.__max_size: int = max(0, int(max_size))
+        self.__ttl: float = max(0.0, float(ttl))
+        self.__negative_ttl: float = max(0.0, float(negative_ttl))
+        self.__generation: int = 0
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__coalesced: int = 0
+        self.__invalidations: int = 0
+
+    def get(self, token: str, username: str, rolename: str,
+            load: Callable[[], Optional[bool]]) -> Optional[bool]:
+        """ Obtains a decision, from the cache if possible.
+
+        Args:
+            - token (str): The user session token the decision is requested with.
+            - username (str): The name of the queried user.
+            - rolename (str): The role name.
+            - load (Callable[[], Optional[bool]]): A function requesting the decision, that
+              returns `None` if the request did not yield one.
+
+        Returns:
+            - Optional[bool]: Whether the user has the role, or `None` if there is no decision
+              (when the decision was requested by a concurrent lookup, the caller must then
+              request it by itself).
+        """
+        if self.__max_size == 0:
+            return load()
+        key: Tuple[str, str, str] = (token, username, rolename)
+        leader: bool = False
+        with self.__lock:
+            generation: int = self.__generation
+            entry: Optional[Tuple[bool, float]] = self.__entries.get(key)
+            if entry is not None:
+                if entry[1] > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.__hits += 1
+                    return entry[0]
+                del self.__entries[key]
+            flight: Optional[Future] = self.__flights.get(key)
+            if flight is None:
+                flight = Future()
+                self.__flights[key] = flight
+                leader = True
+                self.__misses += 1
+            else:
+                self.__coalesced += 1
+        if not leader:
+            return flight.result()
+
+        decision: Optional[bool] = None
+        try:
+            decision = load()
+        finally:
+            with self.__lock:
+                del self.__flights[key]
+                # Skipped if invalidated meanwhile, since the answer may predate it
+                if decision is not None and generation == self.__generation:
+                    self.__store(key, decision)
+            flight.set_result(decision)
+        return decision
+
+    def invalidate(self, username: Optional[str] = None) -> None:
+        """ Discards the cached decisions.
+
+        Args:
+            - username (Optional[str]): The user whose decisions are discarded. If not given,
+              every decision is discarded.
+        """
+        with self.__lock:
+            self.__generation += 1
+            self.__invalidations += 1
+            if username is None:
+                self.__entries.clear()
+                return
+            for key in [key for key in self.__entries if key[1] == username]:
+                del self.__entries[key]
+
+    def stats(self) -> Dict:
+        """ Gets the cache counters.
+
+        Returns:
+            - Dict: A dictionary with the number of lookups answered from the cache (`hits`),
+              requested to the service (`misses`) and answered by a concurrent request
+              (`coalesced`), the fraction of lookups that required no request (`hit_rate`),
+              the number of `invalidations`, the number of cached decisions (`size`) and the
+              cache settings (`max_size`, `ttl` and `negative_ttl`).
+        """
+        with self.__lock:
+            lookups: int = self.__hits + self.__misses + self.__coalesced
+            return {
+                'hits': self.__hits,
+                'misses': self.__misses,
+                'coalesced': self.__coalesced,
+                'hit_rate': (self.__hits + self.__coalesced) / lookups if lookups else 0.0,
+                'invalidations': self.__invalidations,
+                'size': len(self.__entries),
+                'max_size': self.__max_size,
+                'ttl': self.__ttl,
+                'negative_ttl': self.__negative_ttl
+            }
+
+    def __store(self, key: Tuple[str, str, str], decision: bool) -> None:
+        ttl: float = self.__ttl if decision else self.__negative_ttl
+        if ttl <= 0:
+            return
+        self.__entries[key] = (decision, time.monotonic() + ttl)
+        self.__entries.move_to_end(key)
+        if len(self.__entries) > self.__max_size:
+            self.__entries.popitem(last=False)
@@ -1,15 +1,16 @@
 """ AnswerLogic class module.
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.db import Schema 
 from dms2122backend.data.rest import AuthService
 from dms2122backend.data.db.results import Answer
 from dms2122backend.data.db.resultsets import Answers
 from dms2122backend.logic.exc.forbiddenoperationerror import ForbiddenOperationError
+from dms2122common.data import Role
 from dms2122common.data.rest import ResponseData
-from dms2122backend.data.db.results import Question
-from dms2122backend.data.db.resultsets import Questions
+from dms2122backend.data.db.results import QuestionSnapshot
+from dms2122backend.data.db.resultsets import QuestionCache
 
 
 class AnswerLogic():
@@ -42,73 +43,123 @@ class AnswerLogic():
         except Exception as ex:
             raise ex
         return new_answer
-    
+
+    @staticmethod
+    def create_many(session: Session, user: str,
+                    answers: List[Tuple[int, int]]) -> List[Optional[Exception]]:
+        """ Creates several answer records of the same user in one transaction.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - session (Session): The session object.
+            - user (str): The user name string.
+            - answers (List[Tuple[int, int]]): The question id and the answer's selection
+              number of each answer.
+
+        Returns:
+            - List[Optional[Exception]]: The result of each answer, in the same order: `None`
+              if it was created, or the error that prevented it.
+        """
+        return Answers.answer_many(session, user, answers)
+
     @staticmethod
-    def list_all(session: Session) -> List[Answer]:
-        """Lists every question.
+    def list_all(session: Session, after: Optional[Tuple[str, int]] = None,
+                 limit: Optional[int] = None) -> List[Tuple]:
+        """Lists every answer.
 
         Args:
             - session (Session): The session object.
+            - after (Optional[Tuple[str, int]]): If given, a pair with a user name and a
+              question id; only the answers sorted after it are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Returns:
-            - List[Question]: A list of `Question` registers.
+            - List[Tuple]: A list of rows with the question id, user name and selected option
+              of each answer.
         """
-        return Answers.list_all(session)
+        return Answers.list_all(session, after, limit)
 
     @staticmethod
-    def list_all_for_user(session: Session,user: str) -> List[Answer]:
+    def list_all_for_user(session: Session,user: str, after: Optional[int] = None,
+                          limit: Optional[int] = None) -> List[Tuple]:
         """Lists the existing questions.
 
         Args:
             - session (Session): The session object.
             - user (str): The user name string.
+            - after (Optional[int]): If given, only the answers to questions with a greater id
+              are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Returns:
-            - List[Answer]: A list of Answer with the answers' data.
+            - List[Tuple]: A list of rows with the question id, user name and selected option
+              of each answer.
         """
         try:
-            return Answers.list_all_for_user(session, user)
+            return Answers.list_all_for_user(session, user, after, limit)
         except Exception as ex:
             raise ex
 
     @staticmethod
-    def list_all_for_question(session: Session, id: int) -> List[Answer]:
+    def list_all_for_question(session: Session, id: int, after: Optional[str] = None,
+                              limit: Optional[int] = None) -> List[Tuple]:
         """Lists the existing questions.
 
         Args:
             - session (Session): The session object.
             - questionId (int): Id of the question.
+            - after (Optional[str]): If given, only the answers of users sorted after this user
+              name are listed.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
 
         Returns:
-            - List[Answer]: A list of Answer with the answers' data.
+            - List[Tuple]: A list of rows with the question id, user name and selected option
+              of each answer.
         """
         try:
-            return Answers.list_all_for_question(session, id)
+            return Answers.list_all_for_question(session, id, after, limit)
         except Exception as ex:
             raise ex        
 
     @staticmethod
-    def question_has_answers(auth_service: AuthService, token_info: Dict, session: Session,id: int) -> bool:
-        """Return True or False if a certain question has answers.
+    def stream(session: Session, batch_size: int, user: Optional[str] = None,
+               id: Optional[int] = None) -> Iterator[Tuple[str, int, int]]:
+        """Iterates over the answers, optionally of a certain user and/or question.
+
+        Args:
+            - session (Session): The session object.
+            - batch_size (int): The number of rows fetched from the database at a time.
+            - user (Optional[str]): If given, only the answers of this user are iterated.
+            - id (Optional[int]): If given, only the answers to this question are iterated.
+
+        Returns:
+            - Iterator[Tuple[str, int, int]]: An iterator of tuples with the user name, question
+              id and selected option of each answer.
+        """
+        return Answers.stream(session, batch_size, user, id)
+
+    @staticmethod
+    def question_has_answers(auth_service: AuthService, token: Optional[str], session: Session,
+                             id: int) -> bool:
+        """Return True or False if a certain question has answers, if the requestor has the
+        Teacher role.
 
         Args:
             - auth_service (AuthService): the authentication service
-            - token_info (Dict): A dictionary of information provided by the security schema handlers.
+            - token (Optional[str]): The requestor's user session token.
             - session (Session): The session object.
-            - questionId (int): Id of the question.
+            - id (int): Id of the question.
+
+        Raises:
+            - ForbiddenOperationError: If the requestor does not have the Teacher role.
 
         Returns:
             - bool: True if question has answers, False if not
         """
-        response: ResponseData = auth_service.get_user_has_role(session.get('token'), 
-                                                token_info['user_token']['user'], "Teacher")
-        if response.is_successful() == False:
-            raise ForbiddenOperationError
-        try:
-            return Answers.question_has_answers(session,id)
-        except Exception as ex:
-            raise ex        
-
+        AnswerLogic.__check_teacher(auth_service, token)
+        return Answers.question_has_answers(session, id)
 
     @staticmethod
     def get_answer(session: Session ,user: str, id: int) -> Answer:
@@ -131,7 +182,7 @@ class AnswerLogic():
     @staticmethod
     def answer_punctuation(session: Session,answer:Answer)->Optional[float]:
         try:
-            question: Optional[Question] = Questions.get_question_by_id(session,answer.id)
+            question: Optional[QuestionSnapshot] = QuestionCache.get(session, answer.id)
             if question is not None:
                 if question.correct_answer==answer.number:
                     return question.punctuation
@@ -140,3 +191,14 @@ class AnswerLogic():
         except Exception as ex:
             raise ex
 
+    @staticmethod
+    def __check_teacher(auth_service: AuthService, token: Optional[str]) -> None:
+        # The requestor is the user the token was issued to, so their roles are claimed by it
+        username: Optional[str] = auth_service.get_token_user(token)
+        if username is None:
+            raise ForbiddenOperationError()
+        response: ResponseData = auth_service.get_user_has_role(
+            token, username, Role.Teacher.name
+        )
+        if not response.is_successful():
+            raise ForbiddenOperationError()
@@ -1,15 +1,14 @@
 """ QuestionLogic class module.
 """
-from typing import List, Dict, Optional
+from typing import Any, Iterable, Iterator, List, Dict, Optional, Sequence, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.db import Schema 
 from dms2122backend.data.rest import AuthService
-from dms2122backend.data.db.results import Question, answer
-from dms2122backend.data.db.resultsets import Questions
+from dms2122backend.data.db.results import Question, QuestionSnapshot, answer
+from dms2122backend.data.db.resultsets import Questions, QuestionCache
 from dms2122backend.data.db.results import Answer
-from dms2122backend.data.db.resultsets import Answers
-from dms2122backend.logic.answerlogic import AnswerLogic
 from dms2122backend.logic.exc.forbiddenoperationerror import ForbiddenOperationError
+from dms2122common.data import Role
 from dms2122common.data.rest import ResponseData
 
 class QuestionLogic():
@@ -58,38 +57,40 @@ class QuestionLogic():
         return new_question
 
     @staticmethod
-    def list_all(session: Session) -> List[List]:
+    def list_all(session: Session, after: Optional[int] = None,
+                 limit: Optional[int] = None,
+                 fields: Optional[Sequence[str]] = None) -> List[Tuple]:
         """Lists every question.
 
         Args:
             - session (Session): The session object.
+            - after (Optional[int]): If given, only the questions with a greater id are listed.
+            - limit (Optional[int]): If given, the maximum number of questions listed.
+            - fields (Optional[Sequence[str]]): If given, the question fields listed, in this
+              order.
 
         Returns:
-            - List[Question]: A list of `Question` registers.
+            - List[Tuple]: A list of rows with the question columns and whether the question
+              has been answered (`1`) or not (`0`).
         """
-        questions = Questions.list_all(session)
-        list_of_questions : List[List] = []
-        for question in questions:
-            if (Answers.question_has_answers(session, question.id)):     # type: ignore
-                list_of_questions.append([question, 1])
-            else:
-                list_of_questions.append([question, 0])
-        return list_of_questions
+        return Questions.list_all_with_answered(session, after, limit, fields)
 
     @staticmethod
-    def get_question_by_id(session: Session, id: int,) -> Optional[Question]:
+    def get_question_by_id(session: Session, id: int,) -> Optional[QuestionSnapshot]:
         """ Determines whether a question exists or not.
 
+        The question is looked up in the `QuestionCache`.
+
         Args:
             - session (Session): The session object.
             - id (int): A integer for the id question.
 
 
         Returns:
-            - Optional[Question]: The requested `Question` result.
+            - Optional[QuestionSnapshot]: A snapshot of the requested question.
         """
         try:
-            question = Questions.get_question_by_id(session, id)
+            question = QuestionCache.get(session, id)
         except Exception as ex:
             raise ex
         return question
@@ -128,46 +129,116 @@ class QuestionLogic():
 
 
     @staticmethod
-    def list_pending_for_user(session: Session, user: str) -> List[Question]:
+    def list_pending_for_user(session: Session, user: str,
+                              fields: Optional[Sequence[str]] = None) -> List[Tuple]:
         """Lists the pending questions for a user.
 
         Args:
             - session (Session): The session object.
             - user (str): The user name string.
+            - fields (Optional[Sequence[str]]): If given, the question fields listed, in this
+              order.
 
         Returns:
-            - List[Question]: A list of questions.
+            - List[Tuple]: A list of rows with the question columns.
         """
         try:
-            questions = Questions.list_all(session)
-            pending = []
-            for question in questions:
-                if Answers.get_answer(session, user, question.id) is None:     # type: ignore
-                    pending.append(question)
+            pending: List[Tuple] = Questions.list_pending_for_user(session, user, fields)
         except Exception as ex:
             raise ex
         return pending
 
     @staticmethod
-    def list_answered_for_user(session: Session, user: str) -> List[List]:
+    def list_answered_for_user(session: Session, user: str,
+                               fields: Optional[Sequence[str]] = None) -> List[Tuple]:
         """Lists the answered questions for a user.
 
         Args:
             - session (Session): The session object.
             - user (str): The user name string.
+            - fields (Optional[Sequence[str]]): If given, the question fields listed, in this
+              order.
 
         Returns:
-            - List[Question]: A list of questions.
+            - List[Tuple]: A list of rows with the question columns and the punctuation
+              obtained.
         """
         try:
-            questions = Questions.list_all(session)
-            answered: List[List] = []
-            for question in questions:
-                ans = Answers.get_answer(session, user, question.id)    # type: ignore
-                if ans is not None: 
-                    punctuation = AnswerLogic.answer_punctuation(session, ans)
-                    answered.append([question,punctuation])
+            answered: List[Tuple] = Questions.list_answered_for_user(session, user, fields)
         except Exception as ex:
             raise ex
         return answered
 
+    @staticmethod
+    def import_questions(auth_service: AuthService, token: Optional[str], username: str,
+                         session: Session, questions: Iterable[Tuple[Any, Optional[Dict]]],
+                         chunk_size: int) -> Dict:
+        """ Creates many questions at once if the requestor has the Teacher role.
+
+        Note:
+            Any existing transaction will be committed.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (Optional[str]): The requestor's user session token.
+            - username (str): The requestor's user name.
+            - session (Session): The session object.
+            - questions (Iterable[Tuple[Any, Optional[Dict]]]): The questions, as pairs with a
+              key identifying each question and a dictionary with its fields (or `None` if it
+              could not be read).
+            - chunk_size (int): The number of questions inserted in each transaction.
+
+        Raises:
+            - ForbiddenOperationError: If the token was not issued to the requestor or they do
+              not have the Teacher role.
+
+        Returns:
+            - Dict: A dictionary with the number of questions `created`, and the lists of keys
+              of the `duplicated` and `invalid` questions.
+        """
+        QuestionLogic.__check_teacher(auth_service, token, username)
+        return Questions.create_many(session, questions, chunk_size)
+
+    @staticmethod
+    def export_questions(auth_service: AuthService, token: Optional[str], username: str,
+                         session: Session, batch_size: int) -> Iterator[Dict]:
+        """ Iterates over every question if the requestor has the Teacher role.
+
+        The role is checked before the iterator is returned.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (Optional[str]): The requestor's user session token.
+            - username (str): The requestor's user name.
+            - session (Session): The session object.
+            - batch_size (int): The number of rows fetched from the database at a time.
+
+        Raises:
+            - ForbiddenOperationError: If the token was not issued to the requestor or they do
+              not have the Teacher role.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with the questions' data.
+        """
+        QuestionLogic.__check_teacher(auth_service, token, username)
+        return Questions.stream(session, batch_size)
+
+    @staticmethod
+    def question_cache_stats() -> Dict:
+        """ Gets the counters of the question cache of this process.
+
+        Returns:
+            - Dict: The counters (see `QuestionCache.stats`).
+        """
+        return QuestionCache.stats()
+
+    @staticmethod
+    def __check_teacher(auth_service: AuthService, token: Optional[str], username: str) -> None:
+        # The requestor's name is not trusted unless the token was issued to them
+        if auth_service.get_token_user(token) != username:
+            raise ForbiddenOperationError()
+        response: ResponseData = auth_service.get_user_has_role(
+            token, username, Role.Teacher.name
+        )
+        if not response.is_successful():
+            raise ForbiddenOperationError()
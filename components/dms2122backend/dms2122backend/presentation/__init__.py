@@ -1,2 +1,4 @@
 """ Backend presentation-layer classes.
 """
+
+from .wsgiapp import WSGIApp
@@ -1,17 +1,18 @@
 """ REST API controllers responsible of handling the question operations.
 """
 
-from typing import Tuple, Union, Optional, List, Dict
+from typing import Iterator, Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
-from flask import current_app, session
-from dms2122backend.data.db.exc import QuestionExistsError
+from flask import current_app, session, Response
+from dms2122backend.data.db.exc import QuestionExistsError, AnswerExistsError
 from dms2122backend.service import AnswersServices
 from dms2122backend.data.db.results.answer import Answer
 from dms2122backend.data.rest.authservice import AuthService
 from dms2122common.data.role import Role
-from dms2122common.data.rest import ResponseData
+from dms2122common.data.rest import Cursor, JSONStream, ResponseData
 from dms2122backend.data.db.exc.questionorusernotfounderror import QuestionOrUserNotFoundError
 from dms2122backend.logic.exc.forbiddenoperationerror import ForbiddenOperationError
+from dms2122backend.presentation.rest.requestor import bearer_token
 
 def answer(id: int, username: str, body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Answer a question if the requestor has the Student role.
@@ -44,83 +45,188 @@ def answer(id: int, username: str, body: Dict, token_info: Dict) -> Tuple[Union[
     return (answer, HTTPStatus.OK.value)
 
 
-def list_all_for_user(username: str) -> Tuple[Union[List[Dict], str], Optional[int]]:
-    """List all question of an specific user if the requestor has the Student role.
+def answer_many(username: str, body: List[Dict]) -> Tuple[Union[List[Dict], str], Optional[int]]:
+    """Answers several questions at once if the requestor is the user answering them.
+
+    Args:
+        - username (str): The user answering the questions.
+        - body (List[Dict]): A list of dictionaries with the question id and the selected
+          option of each answer.
+
+    Returns:
+        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with a list of
+          dictionaries with the data and the result (`status` and, on error, `message`) of each
+          answer and a code 200 OK. Each answer status is one of:
+            - 200 OK when the answer was created.
+            - 400 BAD REQUEST when a mandatory argument of the answer is missing.
+            - 404 NOT FOUND if the question does not exist.
+            - 409 CONFLICT if the question was already answered by the user.
+          On error, a description message and code:
+            - 400 BAD REQUEST when no answers are given.
+            - 403 FORBIDDEN when the requestor is not the user answering the questions.
+            - 404 NOT FOUND if the answers could not be stored.
+    """
+    with current_app.app_context():
+        if current_app.authservice.get_token_user(bearer_token()) != username:
+            return (
+                'Current user cannot answer questions on behalf of another user',
+                HTTPStatus.FORBIDDEN.value
+            )
+        try:
+            results = AnswersServices.answer_many(username, body, current_app.db)
+        except ValueError:
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
+        except QuestionOrUserNotFoundError:
+            return ('Question or User does not exist', HTTPStatus.NOT_FOUND.value)
+    out: List[Dict] = []
+    for answer_data, error in results:
+        if error is None:
+            answer_data['status'] = HTTPStatus.OK.value
+        elif isinstance(error, ValueError):
+            answer_data['status'] = HTTPStatus.BAD_REQUEST.value
+            answer_data['message'] = 'A mandatory argument is missing'
+        elif isinstance(error, AnswerExistsError):
+            answer_data['status'] = HTTPStatus.CONFLICT.value
+            answer_data['message'] = 'The question was already answered'
+        else:
+            answer_data['status'] = HTTPStatus.NOT_FOUND.value
+            answer_data['message'] = 'Question does not exist'
+        out.append(answer_data)
+    return (out, HTTPStatus.OK.value)
+
+
+def list_all_for_user(username: str, limit: Optional[int] = None, cursor: Optional[str] = None,
+                      stream: bool = False) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
+    """List a page of the answers of an specific user if the requestor has the Student role.
 
     Args:
         - username: A string with the Students' name
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - cursor (Optional[str]): The cursor of the page, as given by the previous one.
+        - stream (bool): Whether every answer is streamed in a single response instead.
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with the dictionary of the
-          new question data and a code 200 OK. On error, a description message and code:
-            - 400 BAD REQUEST when a mandatory argument is missing.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: On success, a tuple
+          with the list of answers' data, a code 200 OK and the headers with the cursor of the
+          next page, if any (or the streamed response). On error, a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing or the cursor is malformed.
     """
     with current_app.app_context():
+        if stream:
+            return _stream_response(
+                AnswersServices.stream_answers(
+                    current_app.db, current_app.cfg.get_stream_batch_size(), username=username
+                )
+            )
         try:
-            answers: List[Dict] = AnswersServices.list_all_for_user(username, current_app.db)
+            after: Optional[List] = Cursor.decode(cursor, (int,))
+            answers, next_key = AnswersServices.list_all_for_user(
+                username, current_app.db, current_app.cfg.get_page_limit(limit),
+                after[0] if after is not None else None
+            )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
-    return (answers, HTTPStatus.OK.value)
+            return ('A mandatory argument is missing or the cursor is malformed',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (answers, HTTPStatus.OK.value, Cursor.headers(next_key))
 
-def list_answers() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing questions.
+def list_answers(limit: Optional[int] = None, cursor: Optional[str] = None,
+                 stream: bool = False) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
+    """Lists a page of the existing answers.
+
+    Args:
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - cursor (Optional[str]): The cursor of the page, as given by the previous one.
+        - stream (bool): Whether every answer is streamed in a single response instead.
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the questions' data
-          and a code 200 OK.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: On success, a tuple
+          with a list of dictionaries for the answers' data, a code 200 OK and the headers with
+          the cursor of the next page, if any (or the streamed response). On error, a
+          description message and code:
+            - 400 BAD REQUEST when the cursor is malformed.
     """
     with current_app.app_context():
-        answers: List[Dict] = AnswersServices.list_answers(current_app.db)
-    return (answers, HTTPStatus.OK.value)
+        if stream:
+            return _stream_response(
+                AnswersServices.stream_answers(
+                    current_app.db, current_app.cfg.get_stream_batch_size()
+                )
+            )
+        try:
+            after: Optional[List] = Cursor.decode(cursor, (str, int))
+            answers, next_key = AnswersServices.list_answers(
+                current_app.db, current_app.cfg.get_page_limit(limit),
+                (after[0], after[1]) if after is not None else None
+            )
+        except ValueError:
+            return ('The cursor is malformed', HTTPStatus.BAD_REQUEST.value, {})
+    return (answers, HTTPStatus.OK.value, Cursor.headers(next_key))
 
-def list_all_for_question(id: int) -> Tuple[Union[List[Dict], str], Optional[int]]:
-    """List all answers of an specific question if the requestor has the Teacher role.
+def list_all_for_question(id: int, limit: Optional[int] = None, cursor: Optional[str] = None,
+                          stream: bool = False) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
+    """List a page of the answers of an specific question if the requestor has the Teacher role.
 
     Args:
         - id: Question id
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - limit (Optional[int]): The maximum number of answers in the page.
+        - cursor (Optional[str]): The cursor of the page, as given by the previous one.
+        - stream (bool): Whether every answer is streamed in a single response instead.
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: On success, a tuple with the dictionary of the
-          new question data and a code 200 OK. On error, a description message and code:
-            - 400 BAD REQUEST when a mandatory argument is missing.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: On success, a tuple
+          with the list of answers' data, a code 200 OK and the headers with the cursor of the
+          next page, if any (or the streamed response). On error, a description message and code:
+            - 400 BAD REQUEST when a mandatory argument is missing or the cursor is malformed.
     """
     with current_app.app_context():
+        if stream:
+            if not id:
+                return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+            return _stream_response(
+                AnswersServices.stream_answers(
+                    current_app.db, current_app.cfg.get_stream_batch_size(), questionId=id
+                )
+            )
         try:
-            answers: List[Dict] = AnswersServices.list_all_for_question(
-                id, current_app.db
+            after: Optional[List] = Cursor.decode(cursor, (str,))
+            answers, next_key = AnswersServices.list_all_for_question(
+                id, current_app.db, current_app.cfg.get_page_limit(limit),
+                after[0] if after is not None else None
             )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
-    return (answers, HTTPStatus.OK.value)
+            return ('A mandatory argument is missing or the cursor is malformed',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (answers, HTTPStatus.OK.value, Cursor.headers(next_key))
 
-def question_has_answers( questionId: int, token_info: Dict) -> Tuple[Union[bool,str], Optional[int]]:
-    """List all answers of an specific question if the requestor has the Teacher role.
+def question_has_answers(id: int) -> Tuple[Union[None, str], Optional[int]]:
+    """Determines whether a question has answers, if the requestor has the Teacher role.
 
     Args:
-        - questionId: Question id
-        - token_info (Dict): A dictionary of information provided by the security schema handlers.
+        - id (int): The question id.
 
     Returns:
-        - Tuple[Union[bool, str], Optional[int]]: On success, a tuple with the dictionary of the
-          new question data and a code 200 OK. On error, a description message and code:
+        - Tuple[Union[None, str], Optional[int]]: A tuple with no content and codes:
+            - 200 OK if the question has answers.
+            - 404 NOT FOUND if it has none (or it does not exist).
+          On error, a description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
-            - 403 FORBIDDEN when the requestor does not have the rights to answer the question.
+            - 403 FORBIDDEN when the requestor does not have the rights to check it.
     """
     with current_app.app_context():
         try:
-            answer = AnswersServices.question_has_answers(current_app.authservice, token_info,
-                questionId, current_app.db
+            has_answers: bool = AnswersServices.question_has_answers(
+                current_app.authservice, bearer_token(), id, current_app.db
             )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)  
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)
         except ForbiddenOperationError:
             return (
-                'Current user has not enough privileges to create a question',
+                'Current user has not enough privileges to check the answers of a question',
                 HTTPStatus.FORBIDDEN.value
             )
-    return (answer, HTTPStatus.OK.value)
+    if has_answers:
+        return (None, HTTPStatus.OK.value)
+    return (None, HTTPStatus.NOT_FOUND.value)
 
 def get_answer(username: str, id: int) -> Tuple[Union[Dict, str], Optional[int]]:
     """Return the answer of an specific question and user.
@@ -144,3 +250,17 @@ def get_answer(username: str, id: int) -> Tuple[Union[Dict, str], Optional[int]]
             return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
     return (answer, HTTPStatus.OK.value)
 
+def _stream_response(answers: Iterator[Dict]) -> Response:
+    """Builds a response that streams a JSON array of answers while they are read.
+
+    Args:
+        - answers (Iterator[Dict]): An iterator of dictionaries with the answers' data.
+
+    Returns:
+        - Response: The streamed response, with a code 200 OK.
+    """
+    return Response(
+        JSONStream.array(answers, current_app.cfg.get_stream_batch_size()),
+        status=HTTPStatus.OK.value,
+        mimetype='application/json'
+    )
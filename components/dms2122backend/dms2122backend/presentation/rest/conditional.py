@@ -0,0 +1,33 @@
+""" Helpers of the REST API controllers for the conditional requests.
+"""
+
+from http import HTTPStatus
+from typing import Optional
+from flask import current_app, request, Response
+from dms2122backend.service import DataVersionsServices
+from dms2122common.data.rest import ETag
+
+
+def data_etag() -> str:
+    """Gets the current entity tag of the representations derived from questions and answers.
+
+    It must be obtained before reading the data, so the tag is never newer than the data.
+
+    Returns:
+        - str: The quoted entity tag.
+    """
+    return DataVersionsServices.etag(current_app.db)
+
+def not_modified(etag: str) -> Optional[Response]:
+    """Evaluates the `If-None-Match` condition of the current request.
+
+    Args:
+        - etag (str): The current entity tag.
+
+    Returns:
+        - Optional[Response]: A 304 NOT MODIFIED response if the client copy is current, or
+          `None` if the representation must be sent.
+    """
+    if ETag.matches(request.headers.get(ETag.CONDITION_HEADER), etag):
+        return Response(status=HTTPStatus.NOT_MODIFIED.value, headers=ETag.headers(etag))
+    return None
@@ -1,27 +1,53 @@
 """ REST API controllers responsible of handling the question operations.
 """
 
+import io
 from typing import Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
-from flask import current_app, session
+from flask import current_app, session, request, Response
+from dms2122common.data.rest import Cursor, ETag, ResponseData
 from dms2122backend.data.db.exc import QuestionExistsError
 from dms2122backend.data.db.exc.questionorusernotfounderror import QuestionOrUserNotFoundError
 from dms2122backend.logic.exc.forbiddenoperationerror import ForbiddenOperationError
 from dms2122backend.data.db.results import Question
 from dms2122backend.service import QuestionsServices
 from dms2122backend.data.rest.authservice import AuthService
-from dms2122common.data.rest import ResponseData
+from dms2122backend.presentation.rest.conditional import data_etag, not_modified
+from dms2122backend.presentation.rest.requestor import bearer_token
 
-def list_questions() -> Tuple[List[Dict], Optional[int]]:
-    """Lists the existing questions.
+def list_questions(limit: Optional[int] = None, cursor: Optional[str] = None,
+                   fields: Optional[List[str]] = None
+                   ) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
+    """Lists a page of the existing questions.
+
+    Args:
+        - limit (Optional[int]): The maximum number of questions in the page.
+        - cursor (Optional[str]): The cursor of the page, as given by the previous one.
+        - fields (Optional[List[str]]): The question fields listed (every one by default).
 
     Returns:
-        - Tuple[List[Dict], Optional[int]]: A tuple with a list of dictionaries for the questions' data
-          and a code 200 OK.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: On success, a
+          tuple with a list of dictionaries for the questions' data, a code 200 OK and the
+          headers with the entity tag and the cursor of the next page, if any. If the client
+          copy is current, a 304 NOT MODIFIED response. On error, a description message and
+          code:
+            - 400 BAD REQUEST when the cursor is malformed or a field is unknown.
     """
     with current_app.app_context():
-        questions: List[Dict] = QuestionsServices.list_questions(current_app.db)
-    return (questions, HTTPStatus.OK.value)
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
+        try:
+            after: Optional[List] = Cursor.decode(cursor, (int,))
+            questions, next_key = QuestionsServices.list_questions(
+                current_app.db, current_app.cfg.get_page_limit(limit),
+                after[0] if after is not None else None, fields
+            )
+        except ValueError:
+            return ('The cursor is malformed or a field is unknown',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (questions, HTTPStatus.OK.value, {**Cursor.headers(next_key), **ETag.headers(etag)})
 
 def create_question(body: Dict, token_info: Dict) -> Tuple[Union[Dict, str], Optional[int]]:
     """Creates a question if the requestor has the Teacher role.
@@ -103,38 +129,124 @@ def edit_question(body: Dict, id: int, token_info: Dict) -> Tuple[Union[Dict, st
             )
     return (question, HTTPStatus.OK.value)
 
-def list_pending_for_user(username: str) -> Tuple[Union[List[Dict], str], Optional[int]]:
+def list_pending_for_user(username: str, fields: Optional[List[str]] = None
+                          ) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
     """Lists the pending questions for a user.
 
     Args:
         - username (str): The user name string.
+        - fields (Optional[List[str]]): The question fields listed (every one by default).
 
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of dictionaries for the questions' data
-          and a code 200 OK.
-            - 400 BAD REQUEST when a mandatory argument is missing.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: A tuple with a
+          list of dictionaries for the questions' data, a code 200 OK and the headers with the
+          entity tag. If the client copy is current, a 304 NOT MODIFIED response.
+            - 400 BAD REQUEST when a mandatory argument is missing or a field is unknown.
     """
     with current_app.app_context():
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         try:
-            questions: List[Dict] = QuestionsServices.list_pending_for_user(current_app.db, username)
+            questions: List[Dict] = QuestionsServices.list_pending_for_user(
+                current_app.db, username, fields
+            )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)   
-    return (questions, HTTPStatus.OK.value)
+            return ('A mandatory argument is missing or a field is unknown',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (questions, HTTPStatus.OK.value, ETag.headers(etag))
 
-def list_answered_for_user(username: str) -> Tuple[Union[List[Dict], str], Optional[int]]:
+def list_answered_for_user(username: str, fields: Optional[List[str]] = None
+                           ) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
     """Lists the answered questions for a user.
 
     Args:
         - username (str): The user name string.
+        - fields (Optional[List[str]]): The question fields listed (every one by default).
         
     Returns:
-        - Tuple[Union[List[Dict], str], Optional[int]]: A tuple with a list of dictionaries for the questions' data
-          and a code 200 OK.
-            - 400 BAD REQUEST when a mandatory argument is missing.
+        - Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]: A tuple with a
+          list of dictionaries for the questions' data, a code 200 OK and the headers with the
+          entity tag. If the client copy is current, a 304 NOT MODIFIED response.
+            - 400 BAD REQUEST when a mandatory argument is missing or a field is unknown.
     """
     with current_app.app_context():
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         try:
-            questions: List[Dict] = QuestionsServices.list_answered_for_user(current_app.db, username)
+            questions: List[Dict] = QuestionsServices.list_answered_for_user(
+                current_app.db, username, fields
+            )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)   
-    return (questions, HTTPStatus.OK.value)
\ No newline at end of file
+            return ('A mandatory argument is missing or a field is unknown',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (questions, HTTPStatus.OK.value, ETag.headers(etag))
+
+def import_questions(username: str,
+                     file_format: str = 'jsonl') -> Tuple[Union[Dict, str], Optional[int]]:
+    """Creates the questions of a question bank file if the requestor has the Teacher role.
+
+    Args:
+        - username (str): The requestor's user name.
+        - file_format (str): The format of the file (the request body), `jsonl` (JSON Lines) or
+          `csv`.
+
+    Returns:
+        - Tuple[Union[Dict, str], Optional[int]]: On success, a tuple with a dictionary with the
+          number of questions `created` and the line numbers of the `duplicated` and `invalid`
+          ones, and a code 200 OK. On error, a description message and code:
+            - 403 FORBIDDEN when the requestor does not have the rights to create questions
+              (or the session token was issued to another user).
+    """
+    with current_app.app_context():
+        try:
+            result: Dict = QuestionsServices.import_questions(
+                current_app.authservice, bearer_token(), username,
+                io.StringIO(request.get_data(as_text=True), newline=''), file_format,
+                current_app.db, current_app.cfg.get_import_chunk_size()
+            )
+        except ForbiddenOperationError:
+            return (
+                'Current user has not enough privileges to create questions',
+                HTTPStatus.FORBIDDEN.value
+            )
+    return (result, HTTPStatus.OK.value)
+
+def export_questions(username: str,
+                     file_format: str = 'jsonl') -> Union[Tuple[str, Optional[int]], Response]:
+    """Streams every question as a question bank file if the requestor has the Teacher role.
+
+    Args:
+        - username (str): The requestor's user name.
+        - file_format (str): The file format, `jsonl` (JSON Lines) or `csv`.
+
+    Returns:
+        - Union[Tuple[str, Optional[int]], Response]: On success, the streamed response with a
+          code 200 OK. On error, a description message and code:
+            - 403 FORBIDDEN when the requestor does not have the rights to export questions
+              (or the session token was issued to another user).
+    """
+    with current_app.app_context():
+        try:
+            chunks = QuestionsServices.export_questions(
+                current_app.authservice, bearer_token(), username, file_format, current_app.db,
+                current_app.cfg.get_stream_batch_size()
+            )
+        except ForbiddenOperationError:
+            return (
+                'Current user has not enough privileges to export questions',
+                HTTPStatus.FORBIDDEN.value
+            )
+    return Response(
+        chunks,
+        status=HTTPStatus.OK.value,
+        mimetype=_EXPORT_MIMETYPES[file_format]
+    )
+
+_EXPORT_MIMETYPES: Dict[str, str] = {
+    'jsonl': 'application/x-ndjson',
+    'csv': 'text/csv'
+}
@@ -0,0 +1,17 @@
+""" Helpers of the REST API controllers to identify the requestor.
+"""
+
+from typing import Optional
+from flask import request
+
+
+def bearer_token() -> Optional[str]:
+    """Gets the user session token sent by the requestor.
+
+    Returns:
+        - Optional[str]: The token of the `Authorization: Bearer` header, if any.
+    """
+    authorization: str = request.headers.get('Authorization', '')
+    if not authorization.startswith('Bearer '):
+        return None
+    return authorization[len('Bearer '):]
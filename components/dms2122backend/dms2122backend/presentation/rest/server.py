@@ -5,6 +5,7 @@ from typing import Dict, Tuple, Optional
 from http import HTTPStatus
 from flask import current_app
 from itsdangerous import TimedJSONWebSignatureSerializer
+from dms2122backend.service import QuestionsServices
 
 
 def health_test() -> Tuple[None, Optional[int]]:
@@ -13,4 +14,52 @@ def health_test() -> Tuple[None, Optional[int]]:
     Returns:
         - Tuple[None, Optional[int]]: A tuple of no content and code 204 No Content.
     """
-    return (None, HTTPStatus.NO_CONTENT.value)
\ No newline at end of file
+    return (None, HTTPStatus.NO_CONTENT.value)
+
+
+def http_client_stats() -> Tuple[Dict, Optional[int]]:
+    """Gets the usage statistics of the client of the other services.
+
+    Returns:
+        - Tuple[Dict, Optional[int]]: A tuple with the statistics and code 200 OK.
+    """
+    with current_app.app_context():
+        return (current_app.http.stats(), HTTPStatus.OK.value)
+
+
+def role_cache_stats() -> Tuple[Optional[Dict], Optional[int]]:
+    """Gets the counters of the cache of role decisions of the authentication service.
+
+    Returns:
+        - Tuple[Optional[Dict], Optional[int]]: A tuple with the counters and code 200 OK, or
+          no content and code 404 NOT FOUND if the cache is disabled.
+    """
+    with current_app.app_context():
+        stats: Optional[Dict] = current_app.authservice.role_cache_stats()
+        if stats is None:
+            return (None, HTTPStatus.NOT_FOUND.value)
+        return (stats, HTTPStatus.OK.value)
+
+
+def invalidate_role_cache(username: Optional[str] = None) -> Tuple[None, Optional[int]]:
+    """Discards the cached role decisions of the authentication service.
+
+    Args:
+        - username (Optional[str]): The user whose decisions are discarded. If not given, every
+          decision is discarded.
+
+    Returns:
+        - Tuple[None, Optional[int]]: A tuple of no content and code 204 No Content.
+    """
+    with current_app.app_context():
+        current_app.authservice.invalidate_role_decisions(username)
+        return (None, HTTPStatus.NO_CONTENT.value)
+
+
+def question_cache_stats() -> Tuple[Dict, Optional[int]]:
+    """Gets the counters of the question cache.
+
+    Returns:
+        - Tuple[Dict, Optional[int]]: A tuple with the counters and code 200 OK.
+    """
+    return (QuestionsServices.question_cache_stats(), HTTPStatus.OK.value)
@@ -1,40 +1,62 @@
 """ REST API controllers responsible of handling the stats operations.
 """
-from flask import current_app, session
-from dms2122backend.service.statsservices import StatsServices
 from typing import Tuple, Union, Optional, List, Dict
 from http import HTTPStatus
+from flask import current_app, session, Response
+from dms2122common.data.rest import Cursor, ETag
+from dms2122backend.service.statsservices import StatsServices
+from dms2122backend.presentation.rest.conditional import data_etag, not_modified
 
-def user_stats(username: str)->Tuple[Union[Dict, str], Optional[int]]:
+def user_stats(username: str) -> Union[Tuple[Union[Dict, str], Optional[int], Dict], Response]:
     """Get a user stats.
 
     Args:
         - username (str): A user whose statistics we want to know.
 
     Returns:
-        - Tuple[Union[List, str], Optional[int]]: On success, a tuple with the dictionary of the
-          new question data and a code 200 OK. On error, a description message and code:
+        - Union[Tuple[Union[Dict, str], Optional[int], Dict], Response]: On success, a tuple
+          with the dictionary of the user statistics, a code 200 OK and the headers with the
+          entity tag. If the client copy is current, a 304 NOT MODIFIED response. On error, a
+          description message and code:
             - 400 BAD REQUEST when a mandatory argument is missing.
     """
     with current_app.app_context():
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         try:
-            user_stats: Dict = StatsServices.user_stats( username, current_app.db )
+            stats: Dict = StatsServices.user_stats( username, current_app.db )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
-    return (user_stats, HTTPStatus.OK.value)
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+    return (stats, HTTPStatus.OK.value, ETag.headers(etag))
 
-def questions_stats() -> Tuple[Union[List[Dict], str], Optional[int]]:
+def questions_stats() -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
     with current_app.app_context():
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         try:
             questions_sta: List[Dict]  = StatsServices.questions_stats(current_app.db )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
-    return (questions_sta, HTTPStatus.OK.value)
+            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value, {})
+    return (questions_sta, HTTPStatus.OK.value, ETag.headers(etag))
 
-def users_stats() -> Tuple[Union[List[Dict], str], Optional[int]]:
+def users_stats(limit: Optional[int] = None, cursor: Optional[str] = None
+                ) -> Union[Tuple[Union[List[Dict], str], Optional[int], Dict], Response]:
     with current_app.app_context():
+        etag: str = data_etag()
+        unchanged: Optional[Response] = not_modified(etag)
+        if unchanged is not None:
+            return unchanged
         try:
-            users_stats: List[Dict]  = StatsServices.users_stats(current_app.db )
+            after: Optional[List] = Cursor.decode(cursor, (str,))
+            page, next_key = StatsServices.users_stats(
+                current_app.db, current_app.cfg.get_page_limit(limit),
+                after[0] if after is not None else None
+            )
         except ValueError:
-            return ('A mandatory argument is missing', HTTPStatus.BAD_REQUEST.value)        
-    return (users_stats, HTTPStatus.OK.value)
\ No newline at end of file
+            return ('A mandatory argument is missing or the cursor is malformed',
+                    HTTPStatus.BAD_REQUEST.value, {})
+    return (page, HTTPStatus.OK.value, {**Cursor.headers(next_key), **ETag.headers(etag)})
\ No newline at end of file
@@ -0,0 +1,106 @@
+""" WSGIApp class module.
+"""
+
+import os
+import inspect
+import logging
+from typing import Dict, Optional
+import connexion  # type: ignore
+from connexion.apis.flask_api import FlaskApi  # type: ignore
+from connexion.apps.flask_app import FlaskJSONEncoder  # type: ignore
+from connexion.jsonifier import Jsonifier  # type: ignore
+from flask import Flask, current_app, request
+from flask.logging import default_handler
+import dms2122backend
+from dms2122common.data.rest import Compression, HTTPSession, JSONCodec, TokenVerifier
+from dms2122backend.data.config import BackendConfiguration
+from dms2122backend.data.db import Schema
+from dms2122backend.data.rest import AuthService, RoleDecisionCache
+
+
+class WSGIApp():
+    """ Monostate class creating the WSGI application of the service.
+    """
+
+    @staticmethod
+    def create(cfg: BackendConfiguration) -> Flask:
+        """ Creates the application, initializing the database schema.
+
+        Args:
+            - cfg (BackendConfiguration): The service configuration.
+
+        Returns:
+            - Flask: The WSGI application.
+        """
+        db: Schema = Schema(cfg)
+
+        specification_dir = os.path.dirname(
+            inspect.getfile(dms2122backend)) + '/openapi'
+        app = connexion.FlaskApp(
+            __name__,
+            specification_dir=specification_dir,
+            options={
+                "swagger_ui": True,
+                "serve_spec": True
+            }
+        )
+
+        http_session: HTTPSession = HTTPSession(cfg.get_http_client())
+        auth_service_cfg: Dict = cfg.get_auth_service()
+        # With the secret of the authentication service, the tokens are verified locally
+        token_verifier: Optional[TokenVerifier] = None
+        if auth_service_cfg.get('jws_secret'):
+            token_verifier = TokenVerifier(auth_service_cfg['jws_secret'])
+        auth_service: AuthService = AuthService(
+            auth_service_cfg['host'], auth_service_cfg['port'],
+            apikey_header='X-ApiKey-Auth',
+            apikey_secret=auth_service_cfg['apikey_secret'],
+            http_session=http_session,
+            token_verifier=token_verifier,
+            role_cache=RoleDecisionCache(
+                cfg.get_role_cache_size(), cfg.get_role_cache_ttl(),
+                cfg.get_role_cache_negative_ttl()
+            )
+        )
+
+        app.add_api("spec.yml", strict_validation=True)
+        flask_app = app.app
+        flask_app.json_encoder = FlaskJSONEncoder
+
+        # Serialize the responses compactly, with the fastest JSON library available
+        JSONCodec.configure(cfg.get_json_backend())
+        FlaskApi.jsonifier = Jsonifier(JSONCodec)
+
+        @flask_app.after_request
+        def compress_response(response):
+            return Compression.compress_response(
+                response, request.headers.get('Accept-Encoding'),
+                cfg.get_compression_min_size(), cfg.get_compression_level()
+            )
+
+        with flask_app.app_context():
+            current_app.db = db
+            current_app.cfg = cfg
+            current_app.authservice = auth_service
+            current_app.http = http_session
+
+        root_logger = logging.getLogger()
+        root_logger.addHandler(default_handler)
+
+        # Report the effective storage profile, which may differ from the configured one
+        storage_logger = logging.getLogger('dms2122backend.storage')
+        storage_logger.setLevel(logging.INFO)
+        storage_logger.info('Storage settings: %s', ', '.join(
+            name + '=' + str(value) for name, value in db.storage_settings().items()
+        ))
+
+        return flask_app
+
+    @staticmethod
+    def post_fork(app: Flask) -> None:
+        """ Prepares the application for a new worker process.
+
+        Args:
+            - app (Flask): The application, created by the parent process.
+        """
+        app.db.dispose()  # type: ignore
@@ -4,3 +4,5 @@
 from .questionservices import QuestionsServices
 from .answerservices import AnswersServices
 from .statsservices import StatsServices
+from .dataversionservices import DataVersionsServices
+from .wireformat import WireFormat
@@ -1,11 +1,12 @@
 """ AnswerServices class module.
 """
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.db import Schema 
 from dms2122backend.data.db.results import Answer
 from dms2122backend.logic.answerlogic import AnswerLogic
 from dms2122backend.data.rest import AuthService
+from dms2122backend.service.wireformat import WireFormat
 
 class AnswersServices():
     """ Monostate class that provides high-level services to handle answer-related use cases.
@@ -34,9 +35,7 @@ class AnswersServices():
         try:
             answer = AnswerLogic.create(auth_service, session, username, number, questionId, token_info)
             if answer is not None:
-                out['id'] = answer.id
-                out['username'] = answer.user
-                out['number'] = answer.number
+                out = WireFormat.answer(answer)
 
         except Exception as ex:
             raise ex
@@ -45,98 +44,183 @@ class AnswersServices():
         return out
 
     @staticmethod
-    def list_answers(schema: Schema) -> List[Dict]:
-        """Lists the existing answers.
+    def answer_many(username: str, answers: List[Dict],
+                    schema: Schema) -> List[Tuple[Dict, Optional[Exception]]]:
+        """Answers several questions at once.
+
+        Args:
+            - username (str): The user name string.
+            - answers (List[Dict]): A list of dictionaries with the question `id` and the
+              selection `number` of each answer.
+            - schema (Schema): A database handler where the answers are mapped into.
+
+        Raises:
+            - ValueError: If either the username or the list of answers is empty.
+            - QuestionOrUserNotFoundError: If the answers could not be stored.
+
+        Returns:
+            - List[Tuple[Dict, Optional[Exception]]]: For each answer, in the same order, a
+              tuple with a dictionary with the answer's data and `None` if it was created, or
+              the error that prevented it otherwise.
+        """
+        session: Session = schema.new_session()
+        try:
+            results: List[Optional[Exception]] = AnswerLogic.create_many(
+                session, username,
+                [(answer.get('id', 0), answer.get('number', 0)) for answer in answers]
+            )
+        finally:
+            schema.remove_session()
+        return [
+            (WireFormat.answer_values(username, answer.get('id'), answer.get('number')), error)
+            for answer, error in zip(answers, results)
+        ]
+
+    @staticmethod
+    def list_answers(schema: Schema, limit: Optional[int] = None,
+                     after: Optional[Tuple[str, int]] = None) -> Tuple[List[Dict], Optional[List]]:
+        """Lists a page of the existing answers.
 
         Args:
             - schema (Schema): A database handler where the answers are mapped into.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
+            - after (Optional[Tuple[str, int]]): If given, a pair with a user name and a
+              question id; only the answers sorted after it are listed.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the answers' data.
+            - Tuple[List[Dict], Optional[List]]: A tuple with a list of dictionaries with the
+              answers' data and, if there are more answers, the sorting key (`[user, id]`) of
+              the last one listed.
         """
         out: List[Dict] = []
+        next_key: Optional[List] = None
         session: Session = schema.new_session()
-        answers: List[Answer] = AnswerLogic.list_all(session)
-        for answ in answers:
-            out.append({
-                'id': answ.id,     
-                'number': answ.number,
-                'user': answ.user,
-            })
+        answers: List[Tuple] = AnswerLogic.list_all(
+            session, after, limit + 1 if limit is not None else None
+        )
+        if limit is not None and len(answers) > limit:
+            answers = answers[:limit]
+            next_key = [answers[-1][1], answers[-1][0]]
+        out = WireFormat.answers(answers)
         schema.remove_session()
-        return out
+        return out, next_key
 
     @staticmethod
-    def list_all_for_user(username: str, schema: Schema) -> List[Dict]:
-        """Lists the existing questions.
+    def list_all_for_user(username: str, schema: Schema, limit: Optional[int] = None,
+                          after: Optional[int] = None) -> Tuple[List[Dict], Optional[List]]:
+        """Lists a page of the answers of a user.
 
         Args:
             - schema (Schema): A database handler where the questions are mapped into.
             - username (str): The user name string.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
+            - after (Optional[int]): If given, only the answers to questions with a greater id
+              are listed.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the answers' data.
+            - Tuple[List[Dict], Optional[List]]: A tuple with a list of dictionaries with the
+              answers' data and, if there are more answers, the sorting key (`[id]`) of the
+              last one listed.
         """
         out: List[Dict] = []
+        next_key: Optional[List] = None
         session: Session = schema.new_session()
         try:
-            answers: List[Answer] = AnswerLogic.list_all_for_user(session, username)
-            for answer in answers:
-                out.append({
-                    'id': answer.id,
-                    'username': answer.user,
-                    'number': answer.number
-                })
+            answers: List[Tuple] = AnswerLogic.list_all_for_user(
+                session, username, after, limit + 1 if limit is not None else None
+            )
+            if limit is not None and len(answers) > limit:
+                answers = answers[:limit]
+                next_key = [answers[-1][0]]
+            out = WireFormat.answers(answers)
         except Exception as ex:
             raise ex
         finally:
             schema.remove_session()
-        return out
+        return out, next_key
 
 
 
     @staticmethod
-    def list_all_for_question(questionId: int, schema: Schema) -> List[Dict]:
-        """Lists the existing questions.
+    def list_all_for_question(questionId: int, schema: Schema, limit: Optional[int] = None,
+                              after: Optional[str] = None) -> Tuple[List[Dict], Optional[List]]:
+        """Lists a page of the answers to a question.
 
         Args:
             - schema (Schema): A database handler where the questions are mapped into.
             - questionId (int): Id of the question.
+            - limit (Optional[int]): If given, the maximum number of answers listed.
+            - after (Optional[str]): If given, only the answers of users sorted after this user
+              name are listed.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the answers' data.
+            - Tuple[List[Dict], Optional[List]]: A tuple with a list of dictionaries with the
+              answers' data and, if there are more answers, the sorting key (`[username]`) of
+              the last one listed.
         """
         out: List[Dict] = []
+        next_key: Optional[List] = None
         session: Session = schema.new_session()
         try:
-            answers: List[Answer] = AnswerLogic.list_all_for_question(session, questionId)
-            for answer in answers:
-                out.append({
-                    'id': answer.id,
-                    'username': answer.user,
-                    'number': answer.number
-                })
+            answers: List[Tuple] = AnswerLogic.list_all_for_question(
+                session, questionId, after, limit + 1 if limit is not None else None
+            )
+            if limit is not None and len(answers) > limit:
+                answers = answers[:limit]
+                next_key = [answers[-1][1]]
+            out = WireFormat.answers(answers)
         except Exception as ex:
             raise ex
         finally:
             schema.remove_session()
-        return out
+        return out, next_key
 
 
     @staticmethod
-    def question_has_answers(auth_service: AuthService, token_info: Dict,questionId: int, schema: Schema) -> bool:
-        """Return True or False if a certain question has answers.
+    def stream_answers(schema: Schema, batch_size: int, username: Optional[str] = None,
+                       questionId: Optional[int] = None) -> Iterator[Dict]:
+        """Iterates over the existing answers, optionally of a certain user and/or question.
+
+        The session is kept open until the iteration ends (or the iterator is closed).
 
         Args:
-            - schema (Schema): A database handler where the questions are mapped into.
+            - schema (Schema): A database handler where the answers are mapped into.
+            - batch_size (int): The number of rows fetched from the database at a time.
+            - username (Optional[str]): If given, only the answers of this user are iterated.
+            - questionId (Optional[int]): If given, only the answers to this question are
+              iterated.
+
+        Returns:
+            - Iterator[Dict]: An iterator of dictionaries with the answers' data.
+        """
+        session: Session = schema.new_session()
+        try:
+            for user, id, number in AnswerLogic.stream(session, batch_size, username, questionId):
+                yield WireFormat.answer_values(user, id, number)
+        finally:
+            schema.remove_session()
+
+    @staticmethod
+    def question_has_answers(auth_service: AuthService, token: Optional[str], questionId: int,
+                             schema: Schema) -> bool:
+        """Return True or False if a certain question has answers, if the requestor has the
+        Teacher role.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (Optional[str]): The requestor's user session token.
             - questionId (int): Id of the question.
+            - schema (Schema): A database handler where the questions are mapped into.
+
+        Raises:
+            - ForbiddenOperationError: If the requestor does not have the Teacher role.
 
         Returns:
             - bool: True if question has answers, False if not
         """
         session: Session = schema.new_session()
         try:
-            answer: bool = AnswerLogic.question_has_answers(auth_service,token_info,session, questionId)
+            answer: bool = AnswerLogic.question_has_answers(auth_service, token, session, questionId)
         except Exception as ex:
             raise ex
         finally:
@@ -160,9 +244,7 @@ class AnswersServices():
         try:
             answer: Answer = AnswerLogic.get_answer(session, user, id)
             if answer is not None:
-                out['id'] = answer.id
-                out['username'] = answer.user
-                out['number'] = answer.number
+                out = WireFormat.answer(answer)
         except Exception as ex:
             raise ex
         finally:
@@ -0,0 +1,33 @@
+""" DataVersionsServices class module.
+"""
+from sqlalchemy.orm.session import Session  # type: ignore
+from dms2122backend.data.db import Schema
+from dms2122backend.data.db.resultsets import DataVersions
+from dms2122common.data.rest import ETag
+
+
+class DataVersionsServices():
+    """ Monostate class that provides high-level services to handle the data version stamps.
+    """
+
+    @staticmethod
+    def etag(schema: Schema) -> str:
+        """ Builds the entity tag of the representations derived from questions and answers.
+
+        The tag is made of the `questions`, `answers` and `stats` data version stamps, so it
+        changes on every modification of the questions or answers (and when the statistics are
+        repaired) and costs a single small query.
+
+        Args:
+            - schema (Schema): A database handler where the data versions are mapped into.
+
+        Returns:
+            - str: The quoted entity tag.
+        """
+        session: Session = schema.new_session()
+        try:
+            return ETag.make(*DataVersions.get_many(
+                session, [DataVersions.QUESTIONS, DataVersions.ANSWERS, DataVersions.STATS]
+            ))
+        finally:
+            schema.remove_session()
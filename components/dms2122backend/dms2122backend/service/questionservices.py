@@ -1,11 +1,13 @@
 """ QuestionServices class module.
 """
-from typing import List, Dict, Optional
+from typing import Iterable, Iterator, List, Dict, Optional, Tuple
 from sqlalchemy.orm.session import Session  # type: ignore
 from dms2122backend.data.rest import AuthService
 from dms2122backend.data.db import Schema 
 from dms2122backend.data.db.results import Question
+from dms2122backend.data.file import QuestionFile
 from dms2122backend.logic import QuestionLogic
+from dms2122backend.service.wireformat import WireFormat
 
 class QuestionsServices():
     """ Monostate class that provides high-level services to handle question-related use cases.
@@ -28,15 +30,7 @@ class QuestionsServices():
         try:
             question = QuestionLogic.get_question_by_id(session, id)
             if question is not None:
-                out['id'] = question.id     # type: ignore
-                out['title'] = question.title
-                out['body'] = question.body
-                out['option1'] = question.option1
-                out['option2'] = question.option2
-                out['option3'] = question.option3
-                out['correct_answer'] = question.correct_answer
-                out['punctuation'] = question.punctuation
-                out['penalty'] = question.penalty
+                out = WireFormat.question(question)
         except Exception as ex:
             raise ex
         finally:
@@ -44,35 +38,38 @@ class QuestionsServices():
         return out
 
     @staticmethod
-    def list_questions(schema: Schema) -> List[Dict]:
-        """Lists the existing questions.
+    def list_questions(schema: Schema, limit: Optional[int] = None, after: Optional[int] = None,
+                       fields: Optional[List[str]] = None) -> Tuple[List[Dict], Optional[List]]:
+        """Lists a page of the existing questions.
 
         Args:
             - schema (Schema): A database handler where the questions are mapped into.
+            - limit (Optional[int]): If given, the maximum number of questions listed.
+            - after (Optional[int]): If given, only the questions with a greater id are listed.
+            - fields (Optional[List[str]]): If given, the question fields listed (`id` is always
+              listed, as well as whether each question has been answered).
+
+        Raises:
+            - ValueError: If any field is unknown.
 
         Returns:
-            - List[Dict]: A list of dictionaries with the questions' data.
+            - Tuple[List[Dict], Optional[List]]: A tuple with a list of dictionaries with the
+              questions' data and, if there are more questions, the sorting key (`[id]`) of the
+              last one listed.
         """
         out: List[Dict] = []
+        next_key: Optional[List] = None
+        projection: Tuple[str, ...] = WireFormat.question_fields(fields)
         session: Session = schema.new_session()
-        questions: List[List] = QuestionLogic.list_all(session)
-        for question_entry in questions:
-            question: Question = question_entry[0]
-            answered: int = question_entry[1]
-            out.append({
-                'id': question.id,     # type: ignore
-                'title': question.title,
-                'body': question.body,
-                'option1': question.option1,
-                'option2': question.option2,
-                'option3': question.option3,
-                'correct_answer': question.correct_answer,
-                'punctuation': question.punctuation,
-                'penalty': question.penalty,
-                'answered' : answered
-            })
+        questions: List[Tuple] = QuestionLogic.list_all(
+            session, after, limit + 1 if limit is not None else None, projection
+        )
+        if limit is not None and len(questions) > limit:
+            questions = questions[:limit]
+            next_key = [questions[-1][0]]
+        out = WireFormat.questions(questions, ('answered',), projection)
         schema.remove_session()
-        return out
+        return out, next_key
 
     @staticmethod
     def create_question(auth_service: AuthService, token_info: Dict, title: str,  body: str, option1: str, option2: str, option3: str, 
@@ -105,15 +102,7 @@ class QuestionsServices():
         try:
             new_question: Question = QuestionLogic.create(auth_service, token_info, session, title, body, option1, 
                                         option2, option3, correct_answer, punctuation, penalty)
-            out['id'] = new_question.id     # type: ignore
-            out['title'] = new_question.title
-            out['body'] = new_question.body
-            out['option1'] = new_question.option1
-            out['option2'] = new_question.option2
-            out['option3'] = new_question.option3
-            out['correct_answer'] = new_question.correct_answer
-            out['punctuation'] = new_question.punctuation
-            out['penalty'] = new_question.penalty
+            out = WireFormat.question(new_question)
         except Exception as ex:
             raise ex
         finally:
@@ -146,15 +135,7 @@ class QuestionsServices():
         try:
             question = QuestionLogic.edit(auth_service, token_info, session, id, title, body, option1, option2, 
                             option3, correct_answer, punctuation, penalty)
-            out['id'] = question.id     # type: ignore
-            out['title'] = question.title
-            out['body'] = question.body
-            out['option1'] = question.option1
-            out['option2'] = question.option2
-            out['option3'] = question.option3
-            out['correct_answer'] = question.correct_answer
-            out['punctuation'] = question.punctuation
-            out['penalty'] = question.penalty
+            out = WireFormat.question(question)
         except Exception as ex:
             raise ex
         finally:
@@ -163,32 +144,30 @@ class QuestionsServices():
 
 
     @staticmethod
-    def list_pending_for_user(schema: Schema, user: str) -> List[Dict]:
+    def list_pending_for_user(schema: Schema, user: str,
+                              fields: Optional[List[str]] = None) -> List[Dict]:
         """Lists the pending questions for a user.
 
         Args:
             - schema (Schema): A database handler where the questions are mapped into.
             - user (str): The user name string.
+            - fields (Optional[List[str]]): If given, the question fields listed (`id` is always
+              listed).
+
+        Raises:
+            - ValueError: If the username is missing or any field is unknown.
 
         Returns:
             - List[Dict]: A list of dictionaries with the questions' data.
         """
         out: List[Dict] = []
+        projection: Tuple[str, ...] = WireFormat.question_fields(fields)
         session: Session = schema.new_session()
         try:
-            questions: List[Question] = QuestionLogic.list_pending_for_user(session, user)
-            for question in questions:
-                out.append({
-                    'id': question.id,     # type: ignore
-                    'title': question.title,
-                    'body': question.body,
-                    'option1': question.option1,
-                    'option2': question.option2,
-                    'option3': question.option3,
-                    'correct_answer': question.correct_answer,
-                    'punctuation': question.punctuation,
-                    'penalty': question.penalty
-                })
+            questions: List[Tuple] = QuestionLogic.list_pending_for_user(
+                session, user, projection
+            )
+            out = WireFormat.questions(questions, (), projection)
         except Exception as ex:
             raise ex
         finally:
@@ -196,37 +175,117 @@ class QuestionsServices():
         return out
 
     @staticmethod
-    def list_answered_for_user(schema: Schema, user: str) -> List[Dict]:
+    def list_answered_for_user(schema: Schema, user: str,
+                               fields: Optional[List[str]] = None) -> List[Dict]:
         """Lists the answered questions for a user.
 
         Args:
             - schema (Schema): A database handler where the questions are mapped into.
             - user (str): The user name string.
+            - fields (Optional[List[str]]): If given, the question fields listed (`id` is always
+              listed, as well as the punctuation obtained).
+
+        Raises:
+            - ValueError: If the username is missing or any field is unknown.
 
         Returns:
             - List[Dict]: A list of dictionaries with the questions' data.
         """
         out: List[Dict] = []
+        projection: Tuple[str, ...] = WireFormat.question_fields(fields)
         session: Session = schema.new_session()
         try:
-            questions: List[List] = QuestionLogic.list_answered_for_user(session, user)
-            for list_entry in questions:
-                question: Question = list_entry[0]
-                punctuation: float = list_entry[1] 
-                out.append({
-                    'id': question.id,     # type: ignore
-                    'title': question.title,
-                    'body': question.body,
-                    'option1': question.option1,
-                    'option2': question.option2,
-                    'option3': question.option3,
-                    'correct_answer': question.correct_answer,
-                    'punctuation': question.punctuation,
-                    'penalty': question.penalty,
-                    'answer_result': punctuation
-                })
+            questions: List[Tuple] = QuestionLogic.list_answered_for_user(
+                session, user, projection
+            )
+            out = WireFormat.questions(questions, ('answer_result',), projection)
         except Exception as ex:
             raise ex
         finally:
             schema.remove_session()
         return out
+
+    @staticmethod
+    def import_questions(auth_service: AuthService, token: Optional[str], username: str,
+                         lines: Iterable[str], file_format: str, schema: Schema,
+                         chunk_size: int) -> Dict:
+        """Creates the questions of a question bank file.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (Optional[str]): The requestor's user session token.
+            - username (str): The requestor's user name.
+            - lines (Iterable[str]): The lines of the file.
+            - file_format (str): The file format (one of `QuestionFile.FORMATS`).
+            - schema (Schema): A database handler where the questions are mapped into.
+            - chunk_size (int): The number of questions inserted in each transaction.
+
+        Raises:
+            - ValueError: If the format is not supported.
+            - ForbiddenOperationError: If the token was not issued to the requestor or they do
+              not have the Teacher role.
+
+        Returns:
+            - Dict: A dictionary with the number of questions `created`, and the lists of line
+              numbers of the `duplicated` and `invalid` questions.
+        """
+        session: Session = schema.new_session()
+        try:
+            return QuestionLogic.import_questions(
+                auth_service, token, username, session, QuestionFile.read(lines, file_format),
+                chunk_size
+            )
+        finally:
+            schema.remove_session()
+
+    @staticmethod
+    def export_questions(auth_service: AuthService, token: Optional[str], username: str,
+                         file_format: str, schema: Schema, batch_size: int) -> Iterator[str]:
+        """Writes every question to a question bank file incrementally.
+
+        The requestor's role is checked before the iterator is returned, and the session is
+        kept open until the iteration ends (or the iterator is closed).
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - token (Optional[str]): The requestor's user session token.
+            - username (str): The requestor's user name.
+            - file_format (str): The file format (one of `QuestionFile.FORMATS`).
+            - schema (Schema): A database handler where the questions are mapped into.
+            - batch_size (int): The number of rows fetched from the database (and questions
+              written) at a time.
+
+        Raises:
+            - ValueError: If the format is not supported.
+            - ForbiddenOperationError: If the token was not issued to the requestor or they do
+              not have the Teacher role.
+
+        Returns:
+            - Iterator[str]: An iterator of text chunks that, concatenated, make the file.
+        """
+        session: Session = schema.new_session()
+        try:
+            chunks: Iterator[str] = QuestionFile.write(
+                QuestionLogic.export_questions(auth_service, token, username, session, batch_size),
+                file_format, batch_size
+            )
+        except:
+            schema.remove_session()
+            raise
+        return QuestionsServices.__stream(schema, chunks)
+
+    @staticmethod
+    def question_cache_stats() -> Dict:
+        """Gets the counters of the question cache of this process.
+
+        Returns:
+            - Dict: A dictionary with the counters (see `QuestionCache.stats`).
+        """
+        return QuestionLogic.question_cache_stats()
+
+    @staticmethod
+    def __stream(schema: Schema, chunks: Iterator[str]) -> Iterator[str]:
+        try:
+            yield from chunks
+        finally:
+            schema.remove_session()
@@ -2,7 +2,7 @@
 """
 from dms2122backend.data.db import Schema 
 from sqlalchemy.orm.session import Session  # type: ignore
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from dms2122backend.logic.statslogic import StatsLogic
 
 class StatsServices():
@@ -34,13 +34,20 @@ class StatsServices():
         return out  
 
     @staticmethod
-    def users_stats(schema: Schema)-> List[Dict]:
+    def users_stats(schema: Schema, limit: Optional[int] = None,
+                    after: Optional[str] = None) -> Tuple[List[Dict], Optional[List]]:
         session: Session = schema.new_session()
         out: List[Dict] = []
+        next_key: Optional[List] = None
         try:
-            out = StatsLogic.users_stats(session)
+            out = StatsLogic.users_stats(
+                session, after, limit + 1 if limit is not None else None
+            )
+            if limit is not None and len(out) > limit:
+                out = out[:limit]
+                next_key = [out[-1]['username']]
         except Exception as ex:
             raise ex
         finally:
             schema.remove_session()
-        return out  
\ No newline at end of file
+        return out, next_key  
\ No newline at end of file
@@ -0,0 +1,125 @@
+""" WireFormat class module.
+"""
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+
+class WireFormat():
+    """ Monostate class that converts the question and answer records to the dictionaries sent
+    by the REST API.
+
+    Every representation of a question or answer is built here, so they all have the same keys
+    (the ones of the `QuestionFullModel` and `AnswerFullModel` schemas of the specification).
+    Records are converted attribute by attribute, while the rows of the listings, which are
+    plain tuples, are zipped with the field names.
+    """
+
+    QUESTION_FIELDS: Tuple[str, ...] = (
+        'id', 'title', 'body', 'option1', 'option2', 'option3', 'correct_answer',
+        'punctuation', 'penalty'
+    )
+    ANSWER_FIELDS: Tuple[str, ...] = ('id', 'username', 'number')
+
+    @staticmethod
+    def question(question: Any) -> Dict:
+        """ Converts a question.
+
+        Args:
+            - question (Any): A `Question` record, or any object with the same attributes (e.g.,
+              a `QuestionSnapshot`).
+
+        Returns:
+            - Dict: A dictionary with the question's data.
+        """
+        return {
+            'id': question.id,
+            'title': question.title,
+            'body': question.body,
+            'option1': question.option1,
+            'option2': question.option2,
+            'option3': question.option3,
+            'correct_answer': question.correct_answer,
+            'punctuation': question.punctuation,
+            'penalty': question.penalty
+        }
+
+    @staticmethod
+    def question_fields(fields: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+        """ Normalizes a projection of the question fields.
+
+        Args:
+            - fields (Optional[Iterable[str]]): The requested fields (any of `QUESTION_FIELDS`),
+              or `None` for every field.
+
+        Raises:
+            - ValueError: If any field is unknown.
+
+        Returns:
+            - Tuple[str, ...]: The requested fields, always including `id`, in the order of
+              `QUESTION_FIELDS`.
+        """
+        if fields is None:
+            return WireFormat.QUESTION_FIELDS
+        requested: Set[str] = set(fields)
+        unknown: Set[str] = requested.difference(WireFormat.QUESTION_FIELDS)
+        if unknown:
+            raise ValueError('Unknown question fields: ' + ', '.join(sorted(unknown)))
+        requested.add('id')
+        return tuple(field for field in WireFormat.QUESTION_FIELDS if field in requested)
+
+    @staticmethod
+    def questions(rows: Iterable[Sequence], extra_fields: Tuple[str, ...] = (),
+                  fields: Tuple[str, ...] = QUESTION_FIELDS) -> List[Dict]:
+        """ Converts several question rows.
+
+        Args:
+            - rows (Iterable[Sequence]): The rows, with the values of `fields` followed by the
+              values of the extra fields, in that order (e.g., the rows of the `Questions`
+              listings).
+            - extra_fields (Tuple[str, ...]): The names of the extra fields of the rows.
+            - fields (Tuple[str, ...]): The question fields of the rows (every field by
+              default).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the questions' data.
+        """
+        keys: Tuple[str, ...] = fields + extra_fields
+        return [dict(zip(keys, row)) for row in rows]
+
+    @staticmethod
+    def answer(answer: Any) -> Dict:
+        """ Converts an answer.
+
+        Args:
+            - answer (Any): An `Answer` record.
+
+        Returns:
+            - Dict: A dictionary with the answer's data.
+        """
+        return {'id': answer.id, 'username': answer.user, 'number': answer.number}
+
+    @staticmethod
+    def answers(rows: Iterable[Sequence]) -> List[Dict]:
+        """ Converts several answer rows.
+
+        Args:
+            - rows (Iterable[Sequence]): The rows, with the question id, user name and selected
+              option of each answer, in that order (e.g., the rows of the `Answers` listings).
+
+        Returns:
+            - List[Dict]: A list of dictionaries with the answers' data.
+        """
+        return [dict(zip(WireFormat.ANSWER_FIELDS, row)) for row in rows]
+
+    @staticmethod
+    def answer_values(username: str, id: Optional[int], number: Optional[int]) -> Dict:
+        """ Converts the values of an answer.
+
+        Args:
+            - username (str): The user name string.
+            - id (Optional[int]): The question id.
+            - number (Optional[int]): The selected option.
+
+        Returns:
+            - Dict: A dictionary with the answer's data.
+        """
+        return {'id': id, 'username': username, 'number': number}
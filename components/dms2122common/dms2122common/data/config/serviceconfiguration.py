@@ -1,7 +1,8 @@
 """ ServiceConfiguration class module.
 """
 
-from typing import List, Dict
+from typing import List, Dict, Optional
+from dms2122common.data.rest.httpsession import HTTPSession
 from .configuration import Configuration
 
 
@@ -16,6 +17,18 @@ class ServiceConfiguration(Configuration):
         Configuration.__init__(self)
 
         self.set_authorized_api_keys([])
+        self.set_page_size(100)
+        self.set_max_page_size(1000)
+        self.set_compression_min_size(1024)
+        self.set_compression_level(6)
+        self.set_json_backend('auto')
+        self.set_server('development')
+        self.set_server_workers(0)
+        self.set_server_threads(1)
+        self.set_server_timeout(30)
+        self.set_server_graceful_timeout(30)
+        self.set_server_max_requests(0)
+        self.set_http_client({})
 
     def _set_values(self, values: Dict) -> None:
         """Sets/merges a collection of configuration values.
@@ -31,6 +44,30 @@ class ServiceConfiguration(Configuration):
             self.set_debug_flag(values['debug'])
         if 'authorized_api_keys' in values:
             self.set_authorized_api_keys(values['authorized_api_keys'])
+        if 'page_size' in values:
+            self.set_page_size(values['page_size'])
+        if 'max_page_size' in values:
+            self.set_max_page_size(values['max_page_size'])
+        if 'compression_min_size' in values:
+            self.set_compression_min_size(values['compression_min_size'])
+        if 'compression_level' in values:
+            self.set_compression_level(values['compression_level'])
+        if 'json_backend' in values:
+            self.set_json_backend(values['json_backend'])
+        if 'server' in values:
+            self.set_server(values['server'])
+        if 'server_workers' in values:
+            self.set_server_workers(values['server_workers'])
+        if 'server_threads' in values:
+            self.set_server_threads(values['server_threads'])
+        if 'server_timeout' in values:
+            self.set_server_timeout(values['server_timeout'])
+        if 'server_graceful_timeout' in values:
+            self.set_server_graceful_timeout(values['server_graceful_timeout'])
+        if 'server_max_requests' in values:
+            self.set_server_max_requests(values['server_max_requests'])
+        if 'http_client' in values:
+            self.set_http_client(values['http_client'])
 
     def set_service_host(self, service_host: str) -> None:
         """ Sets the service_host configuration value.
@@ -111,3 +148,304 @@ class ServiceConfiguration(Configuration):
         """
 
         return self._values['authorized_api_keys']
+
+    def set_page_size(self, page_size: int) -> None:
+        """ Sets the page_size configuration value.
+
+        Args:
+            - page_size: An integer with the number of items of a listing page when the client
+              does not request a limit.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        page_size = int(page_size)
+        if page_size < 1:
+            raise ValueError('The page size must be a positive integer.')
+        self._values['page_size'] = page_size
+
+    def get_page_size(self) -> int:
+        """ Gets the page_size configuration value.
+
+        Returns:
+            - int: An integer with the value of page_size.
+        """
+
+        return int(self._values['page_size'])
+
+    def set_max_page_size(self, max_page_size: int) -> None:
+        """ Sets the max_page_size configuration value.
+
+        Args:
+            - max_page_size: An integer with the maximum number of items of a listing page.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        max_page_size = int(max_page_size)
+        if max_page_size < 1:
+            raise ValueError('The maximum page size must be a positive integer.')
+        self._values['max_page_size'] = max_page_size
+
+    def get_max_page_size(self) -> int:
+        """ Gets the max_page_size configuration value.
+
+        Returns:
+            - int: An integer with the value of max_page_size.
+        """
+
+        return int(self._values['max_page_size'])
+
+    def set_compression_min_size(self, compression_min_size: int) -> None:
+        """ Sets the compression_min_size configuration value.
+
+        Args:
+            - compression_min_size: An integer with the minimum size, in bytes, of the response
+              bodies compressed.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        compression_min_size = int(compression_min_size)
+        if compression_min_size < 0:
+            raise ValueError('The compression minimum size cannot be negative.')
+        self._values['compression_min_size'] = compression_min_size
+
+    def get_compression_min_size(self) -> int:
+        """ Gets the compression_min_size configuration value.
+
+        Returns:
+            - int: An integer with the value of compression_min_size.
+        """
+
+        return int(self._values['compression_min_size'])
+
+    def set_compression_level(self, compression_level: int) -> None:
+        """ Sets the compression_level configuration value.
+
+        Args:
+            - compression_level: An integer with the compression level of the responses, from 1
+              (fastest) to 9 (smallest), or 0 to disable the compression.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        compression_level = int(compression_level)
+        if not 0 <= compression_level <= 9:
+            raise ValueError('The compression level must be between 0 and 9.')
+        self._values['compression_level'] = compression_level
+
+    def get_compression_level(self) -> int:
+        """ Gets the compression_level configuration value.
+
+        Returns:
+            - int: An integer with the value of compression_level.
+        """
+
+        return int(self._values['compression_level'])
+
+    def set_json_backend(self, json_backend: str) -> None:
+        """ Sets the json_backend configuration value.
+
+        Args:
+            - json_backend: A string with the library serializing the JSON responses (`orjson`
+              or `json`), or `auto` to use the fastest one installed.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        json_backend = str(json_backend)
+        if json_backend not in ('auto', 'orjson', 'json'):
+            raise ValueError('The JSON backend must be one of auto, orjson or json.')
+        self._values['json_backend'] = json_backend
+
+    def get_json_backend(self) -> str:
+        """ Gets the json_backend configuration value.
+
+        Returns:
+            - str: A string with the value of json_backend.
+        """
+
+        return str(self._values['json_backend'])
+
+    def set_server(self, server: str) -> None:
+        """ Sets the server configuration value.
+
+        Args:
+            - server: A string with the server running the service: `development` (the
+              single-process Werkzeug server) or `production` (a pre-forking gunicorn server).
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server = str(server)
+        if server not in ('development', 'production'):
+            raise ValueError('The server must be one of development or production.')
+        self._values['server'] = server
+
+    def get_server(self) -> str:
+        """ Gets the server configuration value.
+
+        Returns:
+            - str: A string with the value of server.
+        """
+
+        return str(self._values['server'])
+
+    def set_server_workers(self, server_workers: int) -> None:
+        """ Sets the server_workers configuration value.
+
+        Args:
+            - server_workers: An integer with the number of worker processes of the production
+              server, or 0 to use two per CPU plus one.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server_workers = int(server_workers)
+        if server_workers < 0:
+            raise ValueError('The number of server workers cannot be negative.')
+        self._values['server_workers'] = server_workers
+
+    def get_server_workers(self) -> int:
+        """ Gets the server_workers configuration value.
+
+        Returns:
+            - int: An integer with the value of server_workers.
+        """
+
+        return int(self._values['server_workers'])
+
+    def set_server_threads(self, server_threads: int) -> None:
+        """ Sets the server_threads configuration value.
+
+        Args:
+            - server_threads: An integer with the number of threads handling requests in each
+              worker process of the production server.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server_threads = int(server_threads)
+        if server_threads < 1:
+            raise ValueError('The number of server threads must be a positive integer.')
+        self._values['server_threads'] = server_threads
+
+    def get_server_threads(self) -> int:
+        """ Gets the server_threads configuration value.
+
+        Returns:
+            - int: An integer with the value of server_threads.
+        """
+
+        return int(self._values['server_threads'])
+
+    def set_server_timeout(self, server_timeout: int) -> None:
+        """ Sets the server_timeout configuration value.
+
+        Args:
+            - server_timeout: An integer with the seconds a worker process of the production
+              server can be unresponsive before it is killed and replaced.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server_timeout = int(server_timeout)
+        if server_timeout < 1:
+            raise ValueError('The server timeout must be a positive integer.')
+        self._values['server_timeout'] = server_timeout
+
+    def get_server_timeout(self) -> int:
+        """ Gets the server_timeout configuration value.
+
+        Returns:
+            - int: An integer with the value of server_timeout.
+        """
+
+        return int(self._values['server_timeout'])
+
+    def set_server_graceful_timeout(self, server_graceful_timeout: int) -> None:
+        """ Sets the server_graceful_timeout configuration value.
+
+        Args:
+            - server_graceful_timeout: An integer with the seconds the worker processes of the
+              production server have to finish their requests when they are restarted or
+              stopped.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server_graceful_timeout = int(server_graceful_timeout)
+        if server_graceful_timeout < 0:
+            raise ValueError('The server graceful timeout cannot be negative.')
+        self._values['server_graceful_timeout'] = server_graceful_timeout
+
+    def get_server_graceful_timeout(self) -> int:
+        """ Gets the server_graceful_timeout configuration value.
+
+        Returns:
+            - int: An integer with the value of server_graceful_timeout.
+        """
+
+        return int(self._values['server_graceful_timeout'])
+
+    def set_server_max_requests(self, server_max_requests: int) -> None:
+        """ Sets the server_max_requests configuration value.
+
+        Args:
+            - server_max_requests: An integer with the number of requests after which a worker
+              process of the production server is gracefully replaced, or 0 to never replace
+              them.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        server_max_requests = int(server_max_requests)
+        if server_max_requests < 0:
+            raise ValueError('The server maximum requests cannot be negative.')
+        self._values['server_max_requests'] = server_max_requests
+
+    def get_server_max_requests(self) -> int:
+        """ Gets the server_max_requests configuration value.
+
+        Returns:
+            - int: An integer with the value of server_max_requests.
+        """
+
+        return int(self._values['server_max_requests'])
+
+    def set_http_client(self, http_client: Dict) -> None:
+        """ Sets the http_client configuration value.
+
+        Args:
+            - http_client: A dictionary with the pool sizing, timeouts and retries of the
+              clients of other services (see `HTTPSession`). Missing values take their
+              defaults.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        self._values['http_client'] = HTTPSession.validate(http_client or {})
+
+    def get_http_client(self) -> Dict:
+        """ Gets the http_client configuration value.
+
+        Returns:
+            - Dict: A dictionary with the value of http_client.
+        """
+
+        return self._values['http_client']
+
+    def get_page_limit(self, limit: Optional[int]) -> int:
+        """ Gets the number of items of a listing page.
+
+        Args:
+            - limit (Optional[int]): The limit requested by the client, if any.
+
+        Returns:
+            - int: The requested limit (or the page size if none was requested), capped to the
+              maximum page size.
+        """
+        if limit is None:
+            limit = self.get_page_size()
+        return max(1, min(int(limit), self.get_max_page_size()))
@@ -0,0 +1,6 @@
+""" Common database-related classes.
+"""
+
+from .storageprofile import StorageProfile
+from .enginefactory import EngineFactory
+from .migrationrunner import MigrationRunner
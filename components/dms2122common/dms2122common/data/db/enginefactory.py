@@ -0,0 +1,52 @@
+""" EngineFactory class module.
+"""
+
+from typing import Dict
+from sqlalchemy import create_engine, event  # type: ignore
+from sqlalchemy.engine import Engine, make_url  # type: ignore
+from sqlalchemy.pool import QueuePool  # type: ignore
+from .storageprofile import StorageProfile
+
+
+class EngineFactory():
+    """ Monostate class creating the database engines of the services.
+    """
+
+    @staticmethod
+    def new_engine(db_connection_string: str, storage: Dict) -> Engine:
+        """ Creates a database engine.
+
+        SQLite file databases use a pool of persistent connections (instead of opening one per
+        checkout), so the per-connection pragmas, page cache and memory map outlive each
+        request. Every new SQLite connection gets the storage profile pragmas.
+
+        Args:
+            - db_connection_string (str): The string used to connect to the database.
+            - storage (Dict): The storage profile (see `StorageProfile`).
+
+        Returns:
+            - Engine: The database engine.
+        """
+        url = make_url(db_connection_string)
+        pool_args: Dict = {
+            'pool_size': storage['pool_size'],
+            'max_overflow': storage['max_overflow'],
+            'pool_timeout': storage['pool_timeout']
+        }
+        if url.get_backend_name() != 'sqlite':
+            return create_engine(db_connection_string, **pool_args)
+        if url.database in (None, '', ':memory:'):
+            # In-memory databases only live as long as their single connection
+            engine = create_engine(db_connection_string)
+        else:
+            engine = create_engine(
+                db_connection_string, poolclass=QueuePool,
+                connect_args={'check_same_thread': False}, **pool_args
+            )
+
+        # Required for SQLite to enforce FK integrity when supported, along with the profile
+        @event.listens_for(engine, 'connect')
+        def set_sqlite_pragma(dbapi_connection, connection_record):  # pylint: disable=unused-argument
+            StorageProfile.apply(dbapi_connection, storage)
+
+        return engine
@@ -0,0 +1,129 @@
+""" MigrationRunner class module.
+"""
+
+from typing import Callable, List, Tuple
+from sqlalchemy import Index, MetaData, func, inspect, text  # type: ignore
+from sqlalchemy.schema import CreateColumn  # type: ignore
+from sqlalchemy.orm.session import Session  # type: ignore
+
+
+class MigrationRunner():
+    """ Applies the versioned upgrades of a service's database schema.
+
+    The service schema deploys the tables of a new database; any later change to an existing
+    database (e.g., new indexes or columns) is a migration step. Each step is applied once, in
+    its own transaction, and recorded in the schema version table. Steps must be idempotent,
+    so they can be safely applied to databases already holding the change.
+    """
+
+    def __init__(self, steps: List[Tuple[int, str, Callable[[Session, MetaData], None]]],
+                 record: type):
+        """ Constructor method.
+
+        Args:
+            - steps (List[Tuple[int, str, Callable[[Session, MetaData], None]]]): A list of
+              tuples with the version, the description and the function applying each step,
+              sorted by version.
+            - record (type): The mapped class of the schema version records, with `version`
+              and `description` attributes and constructor arguments.
+        """
+        self.__steps: List[Tuple[int, str, Callable[[Session, MetaData], None]]] = steps
+        self.__record: type = record
+
+    def current_version(self, session: Session) -> int:
+        """ Gets the current version of the database schema.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - int: The version of the last applied migration, or `0` if none was applied.
+        """
+        query = session.query(func.max(self.__record.version))  # type: ignore
+        return query.scalar() or 0
+
+    def pending(self, session: Session) -> List[Tuple[int, str]]:
+        """ Lists the migrations not yet applied.
+
+        Args:
+            - session (Session): The session object.
+
+        Returns:
+            - List[Tuple[int, str]]: A list of pairs with the version and description of each
+              pending migration.
+        """
+        version: int = self.current_version(session)
+        return [
+            (step_version, description)
+            for step_version, description, _ in self.__steps
+            if step_version > version
+        ]
+
+    def upgrade(self, session: Session, metadata: MetaData) -> List[Tuple[int, str]]:
+        """ Applies the pending migrations.
+
+        Args:
+            - session (Session): The session object.
+            - metadata (MetaData): The database schema metadata.
+
+        Returns:
+            - List[Tuple[int, str]]: A list of pairs with the version and description of each
+              applied migration.
+        """
+        applied: List[Tuple[int, str]] = []
+        version: int = self.current_version(session)
+        for step_version, description, step in self.__steps:
+            if step_version <= version:
+                continue
+            try:
+                step(session, metadata)
+                session.add(self.__record(step_version, description))
+                session.commit()
+            except:
+                session.rollback()
+                raise
+            applied.append((step_version, description))
+        return applied
+
+    @staticmethod
+    def create_index(session: Session, metadata: MetaData, name: str, table: str,
+                     columns: List[str]) -> None:
+        """ Creates an index unless it already exists.
+
+        Args:
+            - session (Session): The session object.
+            - metadata (MetaData): The database schema metadata.
+            - name (str): The index name.
+            - table (str): The indexed table name.
+            - columns (List[str]): The indexed column names.
+        """
+        connection = session.connection()
+        existing: List[str] = [index['name'] for index in inspect(connection).get_indexes(table)]
+        if name in existing:
+            return
+        table_definition = metadata.tables[table]
+        Index(name, *[table_definition.c[column] for column in columns]).create(connection)
+
+    @staticmethod
+    def add_column(session: Session, metadata: MetaData, table: str, column: str) -> None:
+        """ Adds a column to an existing table unless it already exists.
+
+        The column definition is taken from the metadata, so it must either be nullable or
+        have a server default for the existing rows.
+
+        Args:
+            - session (Session): The session object.
+            - metadata (MetaData): The database schema metadata.
+            - table (str): The table name.
+            - column (str): The new column name.
+        """
+        connection = session.connection()
+        existing: List[str] = [
+            column_info['name'] for column_info in inspect(connection).get_columns(table)
+        ]
+        if column in existing:
+            return
+        definition = CreateColumn(metadata.tables[table].c[column]).compile(
+            dialect=connection.dialect
+        )
+        connection.execute(text('ALTER TABLE ' + table + ' ADD COLUMN ' + str(definition)))
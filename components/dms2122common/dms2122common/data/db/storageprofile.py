@@ -0,0 +1,110 @@
+""" StorageProfile class module.
+"""
+
+from typing import Any, Dict
+
+
+class StorageProfile():
+    """ Monostate class handling the SQLite storage profile of the services' databases.
+
+    A profile is a dictionary with the SQLite pragmas applied to every new connection
+    (`journal_mode`, `synchronous`, `busy_timeout` in milliseconds, `cache_size` in pages, or
+    in KiB if negative, and `mmap_size` in bytes) and the sizing of the engine connection pool
+    (`pool_size`, `max_overflow` and `pool_timeout` in seconds).
+    """
+
+    JOURNAL_MODES = ('delete', 'truncate', 'persist', 'memory', 'wal', 'off')
+    SYNCHRONOUS_LEVELS = ('off', 'normal', 'full', 'extra')
+    PRAGMAS = ('journal_mode', 'synchronous', 'busy_timeout', 'cache_size', 'mmap_size')
+    DEFAULTS: Dict[str, Any] = {
+        'journal_mode': 'wal',
+        'synchronous': 'normal',
+        'busy_timeout': 5000,
+        'cache_size': -16000,
+        'mmap_size': 67108864,
+        'pool_size': 5,
+        'max_overflow': 10,
+        'pool_timeout': 30
+    }
+
+    @staticmethod
+    def validate(profile: Dict) -> Dict:
+        """ Validates a (possibly partial) storage profile.
+
+        Args:
+            - profile (Dict): A dictionary with the profile values. Missing values take the
+              ones in `DEFAULTS`.
+
+        Raises:
+            - ValueError: If any value is unknown or out of range.
+
+        Returns:
+            - Dict: A complete and normalized profile dictionary.
+        """
+        unknown = set(profile) - set(StorageProfile.DEFAULTS)
+        if unknown:
+            raise ValueError('Unknown storage profile setting(s): ' + ', '.join(sorted(unknown)))
+        values: Dict = dict(StorageProfile.DEFAULTS)
+        values.update(profile)
+        values['journal_mode'] = str(values['journal_mode']).lower()
+        if values['journal_mode'] not in StorageProfile.JOURNAL_MODES:
+            raise ValueError('The journal mode must be one of: '
+                             + ', '.join(StorageProfile.JOURNAL_MODES))
+        values['synchronous'] = str(values['synchronous']).lower()
+        if values['synchronous'] not in StorageProfile.SYNCHRONOUS_LEVELS:
+            raise ValueError('The synchronous level must be one of: '
+                             + ', '.join(StorageProfile.SYNCHRONOUS_LEVELS))
+        for name in ('busy_timeout', 'cache_size', 'mmap_size', 'pool_size', 'max_overflow',
+                     'pool_timeout'):
+            values[name] = int(values[name])
+        for name in ('busy_timeout', 'mmap_size', 'max_overflow', 'pool_timeout'):
+            if values[name] < 0:
+                raise ValueError('The storage setting ' + name + ' cannot be negative.')
+        if values['pool_size'] < 1:
+            raise ValueError('The pool size must be a positive integer.')
+        return values
+
+    @staticmethod
+    def apply(dbapi_connection, profile: Dict) -> None:
+        """ Sets the profile pragmas on a new SQLite connection.
+
+        Foreign keys enforcement is also enabled.
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+            - profile (Dict): A validated profile dictionary.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            cursor.execute('PRAGMA foreign_keys = ON;')
+            for pragma in StorageProfile.PRAGMAS:
+                cursor.execute('PRAGMA ' + pragma + ' = ' + str(profile[pragma]) + ';')
+        finally:
+            cursor.close()
+
+    @staticmethod
+    def report(dbapi_connection) -> Dict:
+        """ Reads the effective pragma values of a SQLite connection.
+
+        The effective values may differ from the requested ones (e.g., in-memory databases
+        cannot use the `wal` journal mode).
+
+        Args:
+            - dbapi_connection: The connection to the database API.
+
+        Returns:
+            - Dict: A dictionary with the value of each of the `PRAGMAS`.
+        """
+        cursor = dbapi_connection.cursor()
+        try:
+            values: Dict = {}
+            for pragma in StorageProfile.PRAGMAS:
+                cursor.execute('PRAGMA ' + pragma + ';')
+                row = cursor.fetchone()
+                values[pragma] = row[0] if row is not None else None
+            if isinstance(values['synchronous'], int) \
+                    and 0 <= values['synchronous'] < len(StorageProfile.SYNCHRONOUS_LEVELS):
+                values['synchronous'] = StorageProfile.SYNCHRONOUS_LEVELS[values['synchronous']]
+            return values
+        finally:
+            cursor.close()
@@ -2,3 +2,10 @@
 """
 
 from .responsedata import ResponseData
+from .cursor import Cursor
+from .jsoncodec import JSONCodec
+from .jsonstream import JSONStream
+from .etag import ETag
+from .compression import Compression
+from .httpsession import HTTPSession
+from .tokenverifier import TokenVerifier
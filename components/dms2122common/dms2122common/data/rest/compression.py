@@ -0,0 +1,201 @@
+""" Compression class module.
+"""
+
+import zlib
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+try:
+    import brotli  # type: ignore
+except ImportError:
+    brotli = None
+
+
+class Compression():
+    """ Monostate class handling the negotiated compression of the HTTP responses.
+
+    `gzip` is always available; `zstd` and `br` are also offered when the `zstandard` and
+    `brotli` packages are installed. When a client accepts several of them with the same
+    preference, they are chosen in the order of `CODINGS`.
+    """
+
+    CODINGS: Tuple[str, ...] = tuple(
+        coding for coding, available in (
+            ('zstd', zstandard is not None), ('br', brotli is not None), ('gzip', True)
+        ) if available
+    )
+
+    COMPRESSIBLE_TYPES: Tuple[str, ...] = (
+        'application/json', 'application/x-ndjson', 'application/javascript',
+        'application/yaml', 'application/xml'
+    )
+
+    @staticmethod
+    def negotiate(accept_encoding: Optional[str]) -> Optional[str]:
+        """ Chooses the content coding of a response.
+
+        Args:
+            - accept_encoding (Optional[str]): The value of the `Accept-Encoding` request
+              header, if any.
+
+        Returns:
+            - Optional[str]: The chosen coding (one of `CODINGS`), or `None` if the client does
+              not accept any of them.
+        """
+        if not accept_encoding:
+            return None
+        weights: Dict[str, float] = {}
+        for item in accept_encoding.split(','):
+            parts: List[str] = item.strip().split(';')
+            coding: str = parts[0].strip().lower()
+            weight: float = 1.0
+            for parameter in parts[1:]:
+                name, _, value = parameter.strip().partition('=')
+                if name.strip() == 'q':
+                    try:
+                        weight = float(value)
+                    except ValueError:
+                        weight = 0.0
+            weights[coding] = weight
+        best: Optional[str] = None
+        best_weight: float = 0.0
+        for coding in Compression.CODINGS:
+            weight = weights.get(coding, weights.get('*', 0.0))
+            if weight > best_weight:
+                best, best_weight = coding, weight
+        return best
+
+    @staticmethod
+    def compressible(mimetype: Optional[str]) -> bool:
+        """ Determines whether a media type is worth compressing.
+
+        Args:
+            - mimetype (Optional[str]): The media type, without parameters.
+
+        Returns:
+            - bool: `True` for textual media types.
+        """
+        if not mimetype:
+            return False
+        return mimetype.startswith('text/') or mimetype.endswith('+json') \
+            or mimetype in Compression.COMPRESSIBLE_TYPES
+
+    @staticmethod
+    def compress(data: bytes, coding: str, level: int) -> bytes:
+        """ Compresses a whole body.
+
+        Args:
+            - data (bytes): The body.
+            - coding (str): The content coding (one of `CODINGS`).
+            - level (int): The compression level, from 1 (fastest) to 9 (smallest).
+
+        Returns:
+            - bytes: The compressed body.
+        """
+        return b''.join(Compression.compress_stream([data], coding, level))
+
+    @staticmethod
+    def compress_stream(chunks: Iterable[bytes], coding: str, level: int) -> Iterator[bytes]:
+        """ Compresses a body incrementally.
+
+        Each chunk is flushed as soon as it is compressed, so the receiver can decode the
+        body while it is being produced.
+
+        Args:
+            - chunks (Iterable[bytes]): The chunks of the body.
+            - coding (str): The content coding (one of `CODINGS`).
+            - level (int): The compression level, from 1 (fastest) to 9 (smallest).
+
+        Raises:
+            - ValueError: If the coding is not available.
+
+        Returns:
+            - Iterator[bytes]: An iterator of the chunks of the compressed body.
+        """
+        if coding not in Compression.CODINGS:
+            raise ValueError('Unsupported content coding: ' + str(coding))
+        return Compression.__compress_stream(chunks, coding, level)
+
+    @staticmethod
+    def compress_response(response, accept_encoding: Optional[str], min_size: int,
+                          level: int):
+        """ Compresses a response if the client accepts it and it is worth it.
+
+        Intended to be used as an `after_request` handler. Streamed responses are compressed
+        incrementally regardless of their size. Compressed responses get the `Vary` header, and
+        their strong entity tag (if any) is made weak, as the bytes sent differ from the
+        uncompressed representation.
+
+        Args:
+            - response (werkzeug.wrappers.Response): The response.
+            - accept_encoding (Optional[str]): The value of the `Accept-Encoding` request
+              header, if any.
+            - min_size (int): The minimum size, in bytes, of the (not streamed) bodies to
+              compress.
+            - level (int): The compression level, from 1 (fastest) to 9 (smallest); `0`
+              disables the compression.
+
+        Returns:
+            - werkzeug.wrappers.Response: The same response, compressed or not.
+        """
+        if level <= 0 or response.direct_passthrough or 'Content-Encoding' in response.headers:
+            return response
+        if not 200 <= response.status_code < 300 or response.status_code == 204:
+            return response
+        if not Compression.compressible(response.mimetype):
+            return response
+        response.vary.add('Accept-Encoding')
+        coding: Optional[str] = Compression.negotiate(accept_encoding)
+        if coding is None:
+            return response
+        if response.is_streamed:
+            response.response = Compression.compress_stream(
+                response.response, coding, level
+            )
+            response.headers.pop('Content-Length', None)
+        else:
+            data: bytes = response.get_data()
+            if len(data) < min_size:
+                return response
+            response.set_data(Compression.compress(data, coding, level))
+        response.headers['Content-Encoding'] = coding
+        etag: Optional[str] = response.headers.get('ETag')
+        if etag and not etag.startswith('W/'):
+            response.headers['ETag'] = 'W/' + etag
+        return response
+
+    @staticmethod
+    def __compress_stream(chunks: Iterable[bytes], coding: str, level: int) -> Iterator[bytes]:
+        try:
+            if coding == 'zstd':
+                zstd_compressor = zstandard.ZstdCompressor(level=level).compressobj()
+                for chunk in chunks:
+                    yield zstd_compressor.compress(Compression.__bytes(chunk)) \
+                        + zstd_compressor.flush(zstandard.COMPRESSOBJ_FLUSH_BLOCK)
+                yield zstd_compressor.flush()
+            elif coding == 'br':
+                br_compressor = brotli.Compressor(quality=min(level, 11))
+                for chunk in chunks:
+                    yield br_compressor.process(Compression.__bytes(chunk)) \
+                        + br_compressor.flush()
+                yield br_compressor.finish()
+            else:
+                gzip_compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+                for chunk in chunks:
+                    compressed: bytes = gzip_compressor.compress(Compression.__bytes(chunk)) \
+                        + gzip_compressor.flush(zlib.Z_SYNC_FLUSH)
+                    if compressed:
+                        yield compressed
+                yield gzip_compressor.flush()
+        finally:
+            # Releases the resources held by the compressed body (e.g., database sessions)
+            close = getattr(chunks, 'close', None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def __bytes(chunk) -> bytes:
+        return chunk.encode('utf-8') if isinstance(chunk, str) else chunk
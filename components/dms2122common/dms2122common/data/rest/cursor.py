@@ -0,0 +1,78 @@
+""" Cursor class module.
+"""
+
+import base64
+import binascii
+import json
+from typing import Dict, List, Optional, Tuple
+
+
+class Cursor():
+    """ Monostate class handling the opaque cursors of the paginated (keyset) listings.
+
+    A cursor encodes the sorting key of the last item of a page; the next page is made of the
+    items sorted after it. Cursors are sent by the services in the `HEADER` response header and
+    sent back by the clients in the `cursor` query parameter.
+    """
+
+    HEADER: str = 'X-Next-Cursor'
+
+    @staticmethod
+    def encode(key: List) -> str:
+        """ Encodes a sorting key into an opaque cursor.
+
+        Args:
+            - key (List): A list with the (JSON-serializable) values of the sorting key.
+
+        Returns:
+            - str: The cursor string.
+        """
+        payload: bytes = json.dumps(key, separators=(',', ':')).encode('utf-8')
+        return base64.urlsafe_b64encode(payload).decode('ascii').rstrip('=')
+
+    @staticmethod
+    def decode(cursor: Optional[str], types: Tuple[type, ...]) -> Optional[List]:
+        """ Decodes an opaque cursor into a sorting key.
+
+        Args:
+            - cursor (Optional[str]): The cursor string, if any.
+            - types (Tuple[type, ...]): The types of the values of the expected sorting key
+              (`int` or `str`), in order.
+
+        Raises:
+            - ValueError: If the cursor is malformed.
+
+        Returns:
+            - Optional[List]: A list with the values of the sorting key, or `None` if no cursor
+              was given.
+        """
+        if not cursor:
+            return None
+        try:
+            padding: str = '=' * (-len(cursor) % 4)
+            key = json.loads(base64.urlsafe_b64decode(cursor + padding).decode('utf-8'))
+        except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as ex:
+            raise ValueError('Malformed cursor.') from ex
+        if not isinstance(key, list) or len(key) != len(types):
+            raise ValueError('Malformed cursor.')
+        for value, value_type in zip(key, types):
+            # Booleans are integers too, but never a sorting key
+            if isinstance(value, bool) or not isinstance(value, value_type):
+                raise ValueError('Malformed cursor.')
+        return key
+
+    @staticmethod
+    def headers(key: Optional[List]) -> Dict[str, str]:
+        """ Builds the response headers of a listing page.
+
+        Args:
+            - key (Optional[List]): The sorting key of the last item of the page, or `None` if
+              it is the last page.
+
+        Returns:
+            - Dict[str, str]: A dictionary with the `HEADER` header holding the cursor of the
+              next page, or an empty dictionary if there are no more pages.
+        """
+        if key is None:
+            return {}
+        return {Cursor.HEADER: Cursor.encode(key)}
@@ -0,0 +1,72 @@
+""" ETag class module.
+"""
+
+from typing import Dict, Optional
+
+
+class ETag():
+    """ Monostate class handling the entity tags of the conditional requests.
+
+    The services send the entity tag of a representation in the `HEADER` response header.
+    Clients holding a copy send its tag back in the `CONDITION_HEADER` request header, and
+    the services answer `304 Not Modified` (with no body) if it is still current.
+    """
+
+    HEADER: str = 'ETag'
+    CONDITION_HEADER: str = 'If-None-Match'
+
+    @staticmethod
+    def make(*versions) -> str:
+        """ Builds a strong entity tag out of some version values.
+
+        Args:
+            - versions: The values identifying the version of the representation.
+
+        Returns:
+            - str: The quoted entity tag.
+        """
+        return '"' + '-'.join(str(version) for version in versions) + '"'
+
+    @staticmethod
+    def matches(condition: Optional[str], etag: str) -> bool:
+        """ Evaluates an `If-None-Match` condition against the current entity tag.
+
+        Weak comparison is used, as corresponds to `If-None-Match`.
+
+        Args:
+            - condition (Optional[str]): The value of the condition header, if any.
+            - etag (str): The current entity tag.
+
+        Returns:
+            - bool: `True` if the client copy is current (so a `304` may be sent).
+        """
+        if not condition:
+            return False
+        if condition.strip() == '*':
+            return True
+        current: str = ETag.__opaque(etag)
+        return any(
+            ETag.__opaque(candidate) == current for candidate in condition.split(',')
+        )
+
+    @staticmethod
+    def headers(etag: Optional[str]) -> Dict[str, str]:
+        """ Builds the response headers announcing an entity tag.
+
+        Args:
+            - etag (Optional[str]): The entity tag, if any.
+
+        Returns:
+            - Dict[str, str]: A dictionary with the entity tag header and a `Cache-Control`
+              header requiring revalidation, or an empty dictionary if there is no tag.
+        """
+        if etag is None:
+            return {}
+        return {ETag.HEADER: etag, 'Cache-Control': 'no-cache'}
+
+    @staticmethod
+    def __opaque(etag: str) -> str:
+        etag = etag.strip()
+        if etag.startswith('W/'):
+            etag = etag[2:]
+        return etag
@@ -0,0 +1,211 @@
+""" HTTPSession class module.
+"""
+
+import os
+import threading
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, List, Optional
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry  # type: ignore
+
+
+class HTTPSession():
+    """ Pooled HTTP client shared by the REST clients of a service.
+
+    Connections are kept alive and reused by later requests to the same host, up to
+    `pool_size` idle connections per host. Every request has a connection timeout and a read
+    timeout (`connect_timeout` and `read_timeout`, in seconds) unless it sets its own. Failed
+    connections are retried up to `retries` times, waiting `backoff_factor` seconds and then
+    exponentially longer between attempts; requests that may have reached the server are only
+    retried when idempotent (not `POST` requests), and so are `502`, `503` and `504` responses.
+
+    Cookies are never stored, as the session is shared by the requests of every user. The
+    connections of a parent process are not reused by its forked children.
+    """
+
+    DEFAULTS: Dict[str, Any] = {
+        'pool_size': 10,
+        'connect_timeout': 3.05,
+        'read_timeout': 30,
+        'retries': 2,
+        'backoff_factor': 0.1
+    }
+
+    RETRY_STATUSES = (502, 503, 504)
+
+    def __init__(self, settings: Optional[Dict] = None):
+        """ Constructor method.
+
+        Args:
+            - settings (Optional[Dict]): A dictionary with the client settings (see `DEFAULTS`).
+              Missing values take their defaults.
+
+        Raises:
+            - ValueError: If any setting is unknown or out of range.
+        """
+        self.__settings: Dict = HTTPSession.validate(settings or {})
+        self.__lock = threading.Lock()
+        self.__pid: int = os.getpid()
+        self.__session: requests.Session = self.__new_session()
+        self.__requests: int = 0
+        self.__retries: int = 0
+        self.__errors: int = 0
+
+    @staticmethod
+    def validate(settings: Dict) -> Dict:
+        """ Validates a (possibly partial) set of client settings.
+
+        Args:
+            - settings (Dict): A dictionary with the settings. Missing values take the ones in
+              `DEFAULTS`.
+
+        Raises:
+            - ValueError: If any value is unknown or out of range.
+
+        Returns:
+            - Dict: A complete and normalized settings dictionary.
+        """
+        unknown = set(settings) - set(HTTPSession.DEFAULTS)
+        if unknown:
+            raise ValueError('Unknown HTTP client setting(s): ' + ', '.join(sorted(unknown)))
+        values: Dict = dict(HTTPSession.DEFAULTS)
+        values.update(settings)
+        for name in ('pool_size', 'retries'):
+            values[name] = int(values[name])
+        for name in ('connect_timeout', 'read_timeout', 'backoff_factor'):
+            values[name] = float(values[name])
+        if values['pool_size'] < 1:
+            raise ValueError('The HTTP client pool size must be a positive integer.')
+        if values['connect_timeout'] <= 0 or values['read_timeout'] <= 0:
+            raise ValueError('The HTTP client timeouts must be positive.')
+        if values['retries'] < 0 or values['backoff_factor'] < 0:
+            raise ValueError('The HTTP client retries and backoff factor cannot be negative.')
+        return values
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """ Sends a request.
+
+        Args:
+            - method (str): The HTTP method.
+            - url (str): The URL.
+            - kwargs: Any other argument of `requests.request` (e.g., `params`, `headers`,
+              `json` or `timeout`).
+
+        Raises:
+            - requests.RequestException: If the request fails after the allowed retries.
+
+        Returns:
+            - requests.Response: The response, whose content is already read (so its
+              connection is back in the pool).
+        """
+        kwargs.setdefault(
+            'timeout', (self.__settings['connect_timeout'], self.__settings['read_timeout'])
+        )
+        session: requests.Session = self.__current_session()
+        try:
+            response: requests.Response = session.request(method, url, **kwargs)
+        except requests.RequestException:
+            with self.__lock:
+                self.__requests += 1
+                self.__errors += 1
+            raise
+        retries = getattr(response.raw, 'retries', None)
+        with self.__lock:
+            self.__requests += 1
+            if retries is not None:
+                self.__retries += len(retries.history)
+        return response
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """ Sends a GET request (see `request`).
+        """
+        return self.request('GET', url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        """ Sends a POST request (see `request`).
+        """
+        return self.request('POST', url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> requests.Response:
+        """ Sends a PUT request (see `request`).
+        """
+        return self.request('PUT', url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> requests.Response:
+        """ Sends a DELETE request (see `request`).
+        """
+        return self.request('DELETE', url, **kwargs)
+
+    def stats(self) -> Dict:
+        """ Gets the usage statistics of the session, useful to size its pool.
+
+        Returns:
+            - Dict: A dictionary with the settings, the number of `requests` sent, the
+              `retries` made and the `errors` raised, and a list of `pools` (one per host) with
+              the `connections` opened, the `requests` sent and the `idle` connections kept by
+              each one.
+        """
+        pools: List[Dict] = []
+        with self.__lock:
+            statistics: Dict = {
+                'settings': dict(self.__settings),
+                'requests': self.__requests,
+                'retries': self.__retries,
+                'errors': self.__errors,
+                'pools': pools
+            }
+            if self.__pid != os.getpid():
+                return statistics
+            for adapter in self.__session.adapters.values():
+                manager = getattr(adapter, 'poolmanager', None)
+                if manager is None:
+                    continue
+                for key in list(manager.pools.keys()):
+                    pool = manager.pools.get(key)
+                    if pool is None or pool.pool is None:
+                        continue
+                    pools.append({
+                        'host': str(pool.host) + ':' + str(pool.port),
+                        'connections': pool.num_connections,
+                        'requests': pool.num_requests,
+                        'idle': sum(1 for connection in list(pool.pool.queue)
+                                    if connection is not None)
+                    })
+        return statistics
+
+    def close(self) -> None:
+        """ Closes the pooled connections.
+        """
+        with self.__lock:
+            self.__session.close()
+
+    def __current_session(self) -> requests.Session:
+        pid: int = os.getpid()
+        if self.__pid == pid:
+            return self.__session
+        with self.__lock:
+            if self.__pid != pid:
+                # The connections inherited from the parent process are left untouched
+                self.__session = self.__new_session()
+                self.__pid = pid
+                self.__requests = self.__retries = self.__errors = 0
+            return self.__session
+
+    def __new_session(self) -> requests.Session:
+        retry: Retry = Retry(
+            total=self.__settings['retries'],
+            backoff_factor=self.__settings['backoff_factor'],
+            status_forcelist=HTTPSession.RETRY_STATUSES,
+            allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+            raise_on_status=False
+        )
+        session: requests.Session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        for prefix in ('http://', 'https://'):
+            session.mount(prefix, HTTPAdapter(
+                pool_connections=self.__settings['pool_size'],
+                pool_maxsize=self.__settings['pool_size'],
+                max_retries=retry
+            ))
+        return session
@@ -0,0 +1,126 @@
+""" JSONCodec class module.
+"""
+
+import datetime
+import decimal
+import json
+import uuid
+from typing import Any, Tuple
+
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+
+class JSONCodec():
+    """ Monostate class serializing and deserializing the JSON documents of the services.
+
+    The documents are serialized compactly by the fastest available backend: `orjson` when it
+    is installed, or the standard `json` module otherwise. Both produce the same documents for
+    the values handled by the services (UTF-8 text is not escaped, dates and times are written
+    in ISO 8601 format, UUIDs as strings and decimals as floats).
+
+    It has the interface expected by the connexion `Jsonifier`, so it can replace the default
+    serializer of the connexion apps.
+    """
+
+    BACKENDS: Tuple[str, ...] = tuple(
+        backend for backend, available in (('orjson', orjson is not None), ('json', True))
+        if available
+    )
+
+    __backend: str = BACKENDS[0]
+
+    @staticmethod
+    def configure(backend: str = 'auto') -> None:
+        """ Chooses the serialization backend.
+
+        Args:
+            - backend (str): One of `BACKENDS`, or `auto` to use the fastest one.
+
+        Raises:
+            - ValueError: If the backend is not available.
+        """
+        if backend == 'auto':
+            backend = JSONCodec.BACKENDS[0]
+        if backend not in JSONCodec.BACKENDS:
+            raise ValueError('Unsupported JSON backend: ' + str(backend))
+        JSONCodec.__backend = backend
+
+    @staticmethod
+    def backend() -> str:
+        """ Gets the serialization backend in use.
+
+        Returns:
+            - str: The backend name (one of `BACKENDS`).
+        """
+        return JSONCodec.__backend
+
+    @staticmethod
+    def dumps(data: Any, **_kwargs) -> str:
+        """ Serializes a JSON document.
+
+        Args:
+            - data (Any): The (JSON-serializable) value.
+            - _kwargs: Formatting arguments of `json.dumps`, passed by the connexion
+              `Jsonifier`; ignored, as the documents are always compact.
+
+        Raises:
+            - TypeError: If the value cannot be serialized.
+
+        Returns:
+            - str: The JSON document.
+        """
+        return JSONCodec.dumpb(data).decode('utf-8')
+
+    @staticmethod
+    def dumpb(data: Any) -> bytes:
+        """ Serializes a JSON document as UTF-8 encoded bytes.
+
+        Args:
+            - data (Any): The (JSON-serializable) value.
+
+        Raises:
+            - TypeError: If the value cannot be serialized.
+
+        Returns:
+            - bytes: The JSON document.
+        """
+        if JSONCodec.__backend == 'orjson':
+            return orjson.dumps(  # pylint: disable=no-member
+                data, default=JSONCodec.__default,
+                option=orjson.OPT_NON_STR_KEYS  # pylint: disable=no-member
+            )
+        return json.dumps(
+            data, default=JSONCodec.__default, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+
+    @staticmethod
+    def loads(data: Any) -> Any:
+        """ Deserializes a JSON document.
+
+        Args:
+            - data (Any): The JSON document, as text or bytes.
+
+        Raises:
+            - ValueError: If the document is malformed.
+
+        Returns:
+            - Any: The deserialized value.
+        """
+        if JSONCodec.__backend == 'orjson':
+            return orjson.loads(data)  # pylint: disable=no-member
+        return json.loads(data)
+
+    @staticmethod
+    def __default(value: Any) -> Any:
+        if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+            return value.isoformat()
+        if isinstance(value, uuid.UUID):
+            return str(value)
+        if isinstance(value, decimal.Decimal):
+            return float(value)
+        if isinstance(value, (set, frozenset, tuple)):
+            return list(value)
+        raise TypeError('Object of type ' + type(value).__name__ + ' is not JSON serializable')
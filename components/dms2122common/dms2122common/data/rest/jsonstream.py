@@ -0,0 +1,38 @@
+""" JSONStream class module.
+"""
+
+from typing import Dict, Iterable, Iterator, List
+from dms2122common.data.rest.jsoncodec import JSONCodec
+
+
+class JSONStream():
+    """ Monostate class that serializes JSON documents incrementally.
+
+    The documents are produced as an iterator of text chunks, so they can be written to a
+    (streamed) response while the items are still being read, without holding them all in
+    memory. The items are serialized with `JSONCodec`.
+    """
+
+    @staticmethod
+    def array(items: Iterable[Dict], chunk_size: int = 1000) -> Iterator[str]:
+        """ Serializes a JSON array.
+
+        Args:
+            - items (Iterable[Dict]): The (JSON-serializable) items of the array.
+            - chunk_size (int): The number of items serialized in each chunk.
+
+        Returns:
+            - Iterator[str]: An iterator of text chunks that, concatenated, make the JSON array.
+        """
+        yield '['
+        separator: str = ''
+        chunk: List[str] = []
+        for item in items:
+            chunk.append(JSONCodec.dumps(item))
+            if len(chunk) >= chunk_size:
+                yield separator + ','.join(chunk)
+                separator = ','
+                chunk = []
+        if len(chunk) > 0:
+            yield separator + ','.join(chunk)
+        yield ']'
@@ -0,0 +1,46 @@
+""" TokenVerifier class module.
+"""
+
+from typing import Dict, Optional
+from itsdangerous import BadData, TimedJSONWebSignatureSerializer
+
+
+class TokenVerifier():
+    """ Verifies the user session tokens issued by the authentication service without
+    contacting it.
+
+    The tokens are JWS signed with the secret shared with the authentication service (its
+    `jws_secret`), so a token is valid if its signature matches and it has not expired yet,
+    exactly as when the authentication service verifies it.
+    """
+
+    def __init__(self, secret: str):
+        """ Constructor method.
+
+        Args:
+            - secret (str): The secret the tokens are signed with.
+        """
+        self.__jws: TimedJSONWebSignatureSerializer = TimedJSONWebSignatureSerializer(secret)
+
+    def verify(self, token: Optional[str]) -> Optional[Dict]:
+        """ Verifies a token.
+
+        Args:
+            - token (Optional[str]): The user session token.
+
+        Returns:
+            - Optional[Dict]: The claims of the token (with the user name in the `user` key and
+              the expiration time, in seconds since the epoch, in the `exp` key), or `None` if
+              it is missing, malformed, forged or expired.
+        """
+        if not token:
+            return None
+        try:
+            claims, header = self.__jws.loads(token.encode('ascii'), return_header=True)
+        except (BadData, UnicodeError):
+            return None
+        if not isinstance(claims, dict) or 'user' not in claims:
+            return None
+        claims = dict(claims)
+        claims['exp'] = header['exp']
+        return claims
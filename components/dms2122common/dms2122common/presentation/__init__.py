@@ -0,0 +1,4 @@
+""" Common presentation layer modules to be used by the different services.
+"""
+
+from .wsgiserver import WSGIServer
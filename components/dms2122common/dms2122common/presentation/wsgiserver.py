@@ -0,0 +1,124 @@
+""" WSGIServer class module.
+"""
+
+import os
+from typing import Any, Callable, Dict, Optional
+from dms2122common.data.config import ServiceConfiguration
+
+try:
+    from gunicorn.app.base import BaseApplication  # type: ignore
+except ImportError:
+    BaseApplication = None  # type: ignore
+
+
+class WSGIServer():
+    """ Monostate class running the WSGI application of a service.
+
+    The `development` server is the single-process Werkzeug server. The `production` server is
+    a pre-forking gunicorn server (the `gunicorn` package must be installed): the application
+    is created once by the master process, and then shared by `server_workers` worker
+    processes, each serving `server_threads` requests at a time. The master process replaces
+    the workers that die or hang, and restarts them gracefully (i.e., letting them finish
+    their requests) on `SIGHUP` or after `server_max_requests` requests.
+    """
+
+    @staticmethod
+    def run(app_factory: Callable[[], Any], cfg: ServiceConfiguration,
+            post_fork: Optional[Callable[[Any], None]] = None,
+            use_reloader: bool = False) -> None:
+        """ Creates the application and serves it until the server is stopped.
+
+        Args:
+            - app_factory (Callable[[], Any]): A function creating the Flask application.
+            - cfg (ServiceConfiguration): The service configuration.
+            - post_fork (Optional[Callable[[Any], None]]): A function receiving the application
+              in each new worker process of the production server, to reset the state that
+              cannot be shared with the master process (e.g., database connections).
+            - use_reloader (bool): Whether the development server restarts when the code
+              changes.
+
+        Raises:
+            - RuntimeError: If the production server is not installed.
+        """
+        if cfg.get_server() != 'production':
+            app_factory().run(
+                host=cfg.get_service_host(),
+                port=cfg.get_service_port(),
+                debug=cfg.get_debug_flag(),
+                use_reloader=use_reloader
+            )
+            return
+        if BaseApplication is None:
+            raise RuntimeError('The production server requires the `gunicorn` package.')
+        WSGIServer.__new_server(app_factory, WSGIServer.options(cfg), post_fork).run()
+
+    @staticmethod
+    def options(cfg: ServiceConfiguration) -> Dict:
+        """ Gets the settings of the production server.
+
+        Args:
+            - cfg (ServiceConfiguration): The service configuration.
+
+        Returns:
+            - Dict: A dictionary with the gunicorn settings.
+        """
+        workers: int = cfg.get_server_workers() or (os.cpu_count() or 1) * 2 + 1
+        max_requests: int = cfg.get_server_max_requests()
+        return {
+            'bind': cfg.get_service_host() + ':' + str(cfg.get_service_port()),
+            'workers': workers,
+            'threads': cfg.get_server_threads(),
+            'timeout': cfg.get_server_timeout(),
+            'graceful_timeout': cfg.get_server_graceful_timeout(),
+            'max_requests': max_requests,
+            # Spread the restarts, so the workers are not all replaced at once
+            'max_requests_jitter': max_requests // 10,
+            'preload_app': True,
+            'loglevel': 'debug' if cfg.get_debug_flag() else 'info'
+        }
+
+    @staticmethod
+    def __new_server(app_factory: Callable[[], Any], options: Dict,
+                     post_fork: Optional[Callable[[Any], None]]):
+        """ Creates the production server.
+
+        Args:
+            - app_factory (Callable[[], Any]): A function creating the Flask application.
+            - options (Dict): A dictionary with the gunicorn settings.
+            - post_fork (Optional[Callable[[Any], None]]): A function receiving the application
+              in each new worker process.
+
+        Returns:
+            - BaseApplication: The gunicorn application serving the Flask application.
+        """
+        class Server(BaseApplication):  # pylint: disable=abstract-method
+            """ Gunicorn application serving the Flask application with the given settings.
+            """
+
+            def __init__(self):
+                """ Constructor method.
+
+                Initializes the server without creating the application yet.
+                """
+                self.__app: Any = None
+                super().__init__()
+
+            def load_config(self):
+                """ Loads the gunicorn settings, including the worker initialization hook.
+                """
+                for name, value in options.items():
+                    self.cfg.set(name, value)
+                if post_fork is not None:
+                    self.cfg.set('post_fork', lambda server, worker: post_fork(self.load()))
+
+            def load(self):
+                """ Gets the application, creating it on the first call.
+
+                Returns:
+                    - Any: The Flask application.
+                """
+                if self.__app is None:
+                    self.__app = app_factory()
+                return self.__app
+
+        return Server()
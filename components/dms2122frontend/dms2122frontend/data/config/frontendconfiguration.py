@@ -33,6 +33,7 @@ class FrontendConfiguration(ServiceConfiguration):
             'port': 4000,
             'apikey_secret': 'This should be the frontend API key'
         })
+        self.set_token_refresh_margin(600)
         self.set_backend_service({
             'host': '127.0.0.1',
             'port': 5000,
@@ -53,6 +54,8 @@ class FrontendConfiguration(ServiceConfiguration):
             self.set_auth_service(values['auth_service'])
         if 'backend_service' in values:
             self.set_backend_service(values['backend_service'])
+        if 'token_refresh_margin' in values:
+            self.set_token_refresh_margin(values['token_refresh_margin'])
 
     def set_app_secret_key(self, app_secret_key: str) -> None:
         """ Sets the app_secret_key configuration value.
@@ -113,3 +116,27 @@ class FrontendConfiguration(ServiceConfiguration):
         """
 
         return self._values['backend_service']
+
+    def set_token_refresh_margin(self, token_refresh_margin: int) -> None:
+        """ Sets the token_refresh_margin configuration value.
+
+        Args:
+            - token_refresh_margin: An integer with the seconds before their expiration when
+              the user session tokens verified locally are refreshed.
+
+        Raises:
+            - ValueError: If validation is not passed.
+        """
+        token_refresh_margin = int(token_refresh_margin)
+        if token_refresh_margin < 0:
+            raise ValueError('The token refresh margin cannot be negative.')
+        self._values['token_refresh_margin'] = token_refresh_margin
+
+    def get_token_refresh_margin(self) -> int:
+        """ Gets the token_refresh_margin configuration value.
+
+        Returns:
+            - int: An integer with the value of token_refresh_margin.
+        """
+
+        return int(self._values['token_refresh_margin'])
@@ -1,10 +1,11 @@
 """ AuthService class module.
 """
 
-from typing import List, Optional, Union
+import time
+from typing import Dict, List, Optional, Union
 import requests
 from dms2122common.data import Role
-from dms2122common.data.rest import ResponseData
+from dms2122common.data.rest import Cursor, HTTPSession, ResponseData, TokenVerifier
 
 
 class AuthService():
@@ -15,7 +16,10 @@ class AuthService():
                  host: str, port: int,
                  api_base_path: str = '/api/v1',
                  apikey_header: str = 'X-ApiKey-Auth',
-                 apikey_secret: str = ''
+                 apikey_secret: str = '',
+                 http_session: Optional[HTTPSession] = None,
+                 token_verifier: Optional[TokenVerifier] = None,
+                 refresh_margin: int = 600
                  ):
         """ Constructor method.
 
@@ -27,12 +31,21 @@ class AuthService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - http_session (Optional[HTTPSession]): The pooled HTTP client used to send the
+              requests, which may be shared with other clients (a new one by default).
+            - token_verifier (Optional[TokenVerifier]): The verifier of the user session tokens,
+              if they can be verified locally (without requesting it to the service).
+            - refresh_margin (int): The seconds before their expiration when the tokens
+              verified locally are refreshed.
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__http: HTTPSession = http_session or HTTPSession()
+        self.__token_verifier: Optional[TokenVerifier] = token_verifier
+        self.__refresh_margin: int = refresh_margin
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -42,6 +55,58 @@ class AuthService():
         """
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
+    def __text_content(self, response: requests.Response) -> str:
+        """ Gets the text content of a response.
+
+        Args:
+            - response (requests.Response): The response.
+
+        Returns:
+            - str: The text, decoded from a JSON string if the response is JSON (as when the
+              operation has several responses).
+        """
+        if 'json' in response.headers.get('Content-Type', ''):
+            return str(response.json())
+        return response.content.decode('ascii')
+
+    def __get_pages(self, token: Optional[str], path: str,
+                    params: Optional[Dict] = None) -> ResponseData:
+        """ Requests every page of a paginated listing.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - path (str): The path of the listing.
+            - params (Optional[Dict]): The query parameters of every page, if any.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list with the items of every page.
+              Otherwise, the contents will be an empty list.
+        """
+        response_data: ResponseData = ResponseData()
+        items: List = []
+        params = dict(params) if params else {}
+        while True:
+            response: requests.Response = self.__http.get(
+                self.__base_url() + path,
+                params=params,
+                headers={
+                    'Authorization': f'Bearer {token}',
+                    self.__apikey_header: self.__apikey_secret
+                }
+            )
+            response_data.set_successful(response.ok)
+            if not response_data.is_successful():
+                response_data.add_message(response.content.decode('ascii'))
+                response_data.set_content([])
+                return response_data
+            items.extend(response.json())
+            cursor: Optional[str] = response.headers.get(Cursor.HEADER)
+            if not cursor:
+                break
+            params['cursor'] = cursor
+        response_data.set_content(items)
+        return response_data
+
     def login(self, username: str, password: str) -> ResponseData:
         """ Performs a login request to the authentication service.
 
@@ -52,7 +117,7 @@ class AuthService():
         Returns:
             - ResponseData: If successful, the contents hold a string with the user session token.
         """
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__http.post(
             self.__base_url() + '/auth',
             auth=(username, password),
             headers={
@@ -70,19 +135,33 @@ class AuthService():
     def auth(self, token: Optional[str]) -> ResponseData:
         """ Performs an authentication request to the authentication service.
 
+        With a token verifier, the token is verified locally instead, and the request is only
+        sent to refresh it when it expires in less than the refresh margin.
+
         Args:
             - token (Optional[str]): The user session token to validate.
 
         Returns:
-            - ResponseData: If successful, the contents hold a string with a new user session token.
+            - ResponseData: If successful, the contents hold a string with a valid user session
+              token (a new one if it was refreshed, or the same one otherwise).
               Otherwise, the session is rejected (e.g., timed out, was invalidated, was missing)
         """
         response_data: ResponseData = ResponseData()
         if not token:
             response_data.set_successful(False)
             return response_data
-
-        response: requests.Response = requests.post(
+        if self.__token_verifier is not None:
+            claims: Optional[Dict] = self.__token_verifier.verify(token)
+            if claims is None:
+                response_data.set_successful(False)
+                response_data.add_message('Session expired')
+                return response_data
+            if claims['exp'] - time.time() > self.__refresh_margin:
+                response_data.set_successful(True)
+                response_data.set_content(token)
+                return response_data
+
+        response: requests.Response = self.__http.post(
             self.__base_url() + '/auth',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -96,31 +175,41 @@ class AuthService():
             response_data.add_message('Session expired')
         return response_data
 
-    def list_users(self, token: Optional[str]) -> ResponseData:
+    def verify_token(self, token: Optional[str]) -> Optional[Dict]:
+        """ Verifies a user session token locally.
+
+        Args:
+            - token (Optional[str]): The user session token.
+
+        Returns:
+            - Optional[Dict]: The claims of the token (see `TokenVerifier`) or `None` if it is
+              not valid or there is no token verifier.
+        """
+        if self.__token_verifier is None:
+            return None
+        return self.__token_verifier.verify(token)
+
+    def list_users(self, token: Optional[str], roles: bool = False,
+                   prefix: Optional[str] = None) -> ResponseData:
         """ Requests a list of registered users.
 
         Args:
             token (Optional[str]): The user session token.
+            roles (bool): Whether the roles of each user are requested too.
+            prefix (Optional[str]): If given, only the users whose name starts with it are
+              requested.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of user data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a list of user data dictionaries
+              (with the list of `roles` names of each user, if requested). Otherwise, the
+              contents will be an empty list.
         """
-        response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/users',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
-        response_data.set_successful(response.ok)
-        if response_data.is_successful():
-            response_data.set_content(response.json())
-        else:
-            response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
-        return response_data
+        params: Dict = {}
+        if roles:
+            params['roles'] = 'true'
+        if prefix:
+            params['prefix'] = prefix
+        return self.__get_pages(token, '/users', params)
 
     def create_user(self, token: Optional[str], username: str, password: str) -> ResponseData:
         """ Requests a user creation.
@@ -134,7 +223,7 @@ class AuthService():
             - ResponseData: If successful, the contents hold the new user's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__http.post(
             self.__base_url() + '/user/new',
             json={
                 'username': username,
@@ -164,7 +253,7 @@ class AuthService():
               empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__http.get(
             self.__base_url() + f'/user/{username}/roles',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -190,12 +279,14 @@ class AuthService():
             - role (Union[Role, str]): The role to be granted.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: Useful to know whether the operation succeeded and its messages. If
+              the role was granted to oneself, the contents hold a string with a new user session
+              token replacing the given one, which is no longer valid.
         """
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__http.post(
             self.__base_url() + f'/user/{username}/role/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -205,6 +296,8 @@ class AuthService():
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
             response_data.add_message(response.content.decode('ascii'))
+        elif response.content:
+            response_data.set_content(self.__text_content(response))
         return response_data
 
     def revoke_user_role(self,
@@ -218,12 +311,14 @@ class AuthService():
             - role (Union[Role, str]): The role to be revoked.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: Useful to know whether the operation succeeded and its messages. If
+              the role was revoked from oneself, the contents hold a string with a new user session
+              token replacing the given one, which is no longer valid.
         """
         if isinstance(role, Role):
             role = role.name
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.delete(
+        response: requests.Response = self.__http.delete(
             self.__base_url() + f'/user/{username}/role/{role}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -233,35 +328,45 @@ class AuthService():
         response_data.set_successful(response.ok)
         if not response_data.is_successful():
             response_data.add_message(response.content.decode('ascii'))
+        elif response.content:
+            response_data.set_content(self.__text_content(response))
         return response_data
 
     def update_user_roles(self,
                           token: Optional[str], username: str, new_roles: List
                           ) -> ResponseData:
-        """ Requests to update several roles on a user at once.
+        """ Requests to set the roles of a user at once.
 
-        This is an utility method. If at least one of them fails, all of them are considered failed,
-        though some of the changes may have taken effect. The messages should describe the failure
-        reasons.
+        The given roles are granted and the rest revoked, all of them in a single transaction
+        (so either every change takes effect or none does).
 
         Args:
             - token (Optional[str]): The user session token.
             - username (str): The user to have their roles updated.
-            - new_roles (List): A list of roles to update. If present in the list, will be granted;
-              otherwise, they will be revoked.
+            - new_roles (List): A list of role names to be granted. Roles not present will be
+              revoked.
 
         Returns:
-            - ResponseData: Useful to know whether the operation succeeded and its messages.
+            - ResponseData: If successful, the contents hold a dictionary with the resulting list
+              of role names (key `roles`) and, if the roles of the requestor were updated, a new
+              user session token replacing the given one, which is no longer valid (key `token`;
+              `None` otherwise).
         """
-        aggregated_response: ResponseData = ResponseData()
-        aggregated_response.set_successful(True)
-        for role in Role:
-            response: ResponseData
-            if role.name in new_roles:
-                response = self.grant_user_role(token, username, role)
-            else:
-                response = self.revoke_user_role(token, username, role)
-            aggregated_response.add_messages(response.get_messages())
-            aggregated_response.set_successful(
-                aggregated_response.is_successful() & response.is_successful())
-        return aggregated_response
+        response_data: ResponseData = ResponseData()
+        response: requests.Response = self.__http.put(
+            self.__base_url() + f'/user/{username}/roles',
+            json=[role.name if isinstance(role, Role) else role for role in new_roles],
+            headers={
+                'Authorization': f'Bearer {token}',
+                self.__apikey_header: self.__apikey_secret
+            }
+        )
+        response_data.set_successful(response.ok)
+        if response_data.is_successful():
+            response_data.set_content({
+                'roles': response.json(),
+                'token': response.headers.get('X-Session-Token')
+            })
+        else:
+            response_data.add_message(self.__text_content(response))
+        return response_data
@@ -1,10 +1,15 @@
 """ BackendService class module.
 """
 
-from typing import Optional
+import json
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
 import requests
 from dms2122common.data import Role
-from dms2122common.data.rest import ResponseData
+from dms2122common.data.rest import Cursor, ETag, HTTPSession, ResponseData
 
 
 class BackendService():
@@ -15,7 +20,9 @@ class BackendService():
         host: str, port: int,
         api_base_path: str = '/api/v1',
         apikey_header: str = 'X-ApiKey-Backend',
-        apikey_secret: str = ''
+        apikey_secret: str = '',
+        validated_size: int = 256,
+        http_session: Optional[HTTPSession] = None
         ):
         """ Constructor method.
 
@@ -27,12 +34,20 @@ class BackendService():
             - api_base_path (str): The base path that is prepended to every request's path.
             - apikey_header (str): Name of the header with the API key that identifies this client.
             - apikey_secret (str): The API key that identifies this client.
+            - http_session (Optional[HTTPSession]): The pooled HTTP client used to send the
+              requests, which may be shared with other clients (a new one by default).
+            - validated_size (int): The maximum number of responses kept to be revalidated with
+              conditional requests (`0` disables them).
         """
         self.__host: str = host
         self.__port: int = port
         self.__api_base_path: str = api_base_path
         self.__apikey_header: str = apikey_header
         self.__apikey_secret: str = apikey_secret
+        self.__http: HTTPSession = http_session or HTTPSession()
+        self.__validated_size: int = validated_size
+        self.__validated: 'OrderedDict[str, Tuple[str, bytes, Optional[str]]]' = OrderedDict()
+        self.__validated_lock = threading.Lock()
 
     def __base_url(self) -> str:
         """ Constructs the base URL for the requests.
@@ -42,81 +57,159 @@ class BackendService():
         """
         return f'http://{self.__host}:{self.__port}{self.__api_base_path}'
 
-    def list_questions(self, token: Optional[str]) -> ResponseData:
+    def __get(self, token: Optional[str], path: str,
+              params: Optional[Dict] = None) -> Tuple[requests.Response, Any, Optional[str]]:
+        """ Requests a JSON resource, revalidating the last copy received, if any.
+
+        Responses with an entity tag are kept (up to `validated_size`, least recently used
+        first out) along with their next page cursor, and their tag is sent in the
+        `If-None-Match` header of the next request to the same URL. If the backend answers
+        `304 Not Modified`, the kept copy is used.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - path (str): The path of the resource.
+            - params (Optional[Dict]): The query parameters, if any.
+
+        Returns:
+            - Tuple[requests.Response, Any, Optional[str]]: The response, its decoded JSON
+              content if successful (or `None` otherwise) and the cursor of the next page, if
+              any.
+        """
+        url: str = self.__base_url() + path
+        key: str = url + '?' + urlencode(sorted(params.items())) if params else url
+        headers: Dict = {
+            'Authorization': f'Bearer {token}',
+            self.__apikey_header: self.__apikey_secret
+        }
+        with self.__validated_lock:
+            kept: Optional[Tuple[str, bytes, Optional[str]]] = self.__validated.get(key)
+        if kept is not None:
+            headers[ETag.CONDITION_HEADER] = kept[0]
+        response: requests.Response = self.__http.get(url, params=params, headers=headers)
+        if response.status_code == HTTPStatus.NOT_MODIFIED.value and kept is not None:
+            with self.__validated_lock:
+                if key in self.__validated:
+                    self.__validated.move_to_end(key)
+            return (response, json.loads(kept[1]), kept[2])
+        if not response.ok:
+            return (response, None, None)
+        cursor: Optional[str] = response.headers.get(Cursor.HEADER)
+        etag: Optional[str] = response.headers.get(ETag.HEADER)
+        if etag and self.__validated_size > 0:
+            with self.__validated_lock:
+                self.__validated[key] = (etag, response.content, cursor)
+                self.__validated.move_to_end(key)
+                if len(self.__validated) > self.__validated_size:
+                    self.__validated.popitem(last=False)
+        return (response, response.json(), cursor)
+
+    def __get_pages(self, token: Optional[str], path: str,
+                    params: Optional[Dict] = None) -> ResponseData:
+        """ Requests every page of a paginated listing.
+
+        Args:
+            - token (Optional[str]): The user session token.
+            - path (str): The path of the listing.
+            - params (Optional[Dict]): The query parameters of every page, if any.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list with the items of every page.
+              Otherwise, the contents will be an empty list.
+        """
+        response_data: ResponseData = ResponseData()
+        items: List = []
+        params = dict(params) if params else {}
+        while True:
+            response, content, cursor = self.__get(token, path, params)
+            response_data.set_successful(response.ok)
+            if not response_data.is_successful():
+                response_data.add_message(response.content.decode('ascii'))
+                response_data.set_content([])
+                return response_data
+            items.extend(content)
+            if not cursor:
+                break
+            params['cursor'] = cursor
+        response_data.set_content(items)
+        return response_data
+
+    @staticmethod
+    def __fields_params(fields: Optional[List[str]]) -> Optional[Dict]:
+        """ Builds the query parameters of a question fields projection.
+
+        Args:
+            - fields (Optional[List[str]]): The requested question fields, if any.
+
+        Returns:
+            - Optional[Dict]: The query parameters, or `None` to request every field.
+        """
+        if not fields:
+            return None
+        return {'fields': ','.join(fields)}
+
+    def list_questions(self, token: Optional[str],
+                       fields: Optional[List[str]] = None) -> ResponseData:
         """ Requests a list of created questions.
 
         Args:
             token (Optional[str]): The user session token.
+            fields (Optional[List[str]]): If given, the question fields requested (along with
+              `id` and `answered`); only these are read and sent by the backend.
 
         Returns:
             - ResponseData: If successful, the contents hold a list of question data dictionaries.
               Otherwise, the contents will be an empty list.
         """
-        response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + '/questions',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
-        response_data.set_successful(response.ok)
-        if response_data.is_successful():
-            response_data.set_content(response.json())
-        else:
-            response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
-        return response_data
+        return self.__get_pages(token, '/questions', BackendService.__fields_params(fields))
 
-    def list_pending_for_user(self, token: Optional[str], username: str) -> ResponseData:
+    def list_pending_for_user(self, token: Optional[str], username: str,
+                              fields: Optional[List[str]] = None) -> ResponseData:
         """ Requests a list of pending questions for a user.
 
         Args:
             - token (Optional[str]): The user session token.
             - username (str): the user's name
+            - fields (Optional[List[str]]): If given, the question fields requested (along with
+              `id`); only these are read and sent by the backend.
 
         Returns:
             - ResponseData: If successful, the contents hold a list of question data dictionaries.
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/questions/{username}/pending',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response, content, _ = self.__get(
+            token, f'/questions/{username}/pending', BackendService.__fields_params(fields)
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
         return response_data
 
-    def list_answered_for_user(self, token: Optional[str], username: str) -> ResponseData:
+    def list_answered_for_user(self, token: Optional[str], username: str,
+                               fields: Optional[List[str]] = None) -> ResponseData:
         """ Requests a list of answered questions for a user.
 
         Args:
             - token (Optional[str]): The user session token.
             - username (str): the user's name
+            - fields (Optional[List[str]]): If given, the question fields requested (along with
+              `id` and `answer_result`); only these are read and sent by the backend.
 
         Returns:
             - ResponseData: If successful, the contents hold a list of question data dictionaries.
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/questions/{username}/answered',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
+        response, content, _ = self.__get(
+            token, f'/questions/{username}/answered', BackendService.__fields_params(fields)
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -141,7 +234,7 @@ class BackendService():
             - ResponseData: If successful, the contents hold the new question's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__http.post(
             self.__base_url() + '/question/new',
             json={
                 'title': title,
@@ -176,7 +269,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__http.get(
             self.__base_url() + f'/question/{id}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -197,15 +290,15 @@ class BackendService():
 
         Args:
             - token (Optional[str]): The user session token.
-            - username (str): The name of the queried user.
+            - id (int): The question id.
 
         Returns:
-            - ResponseData: If successful, the contents hold a value of true. Otherwise an
-              empty list.
+            - ResponseData: Successful if the question has answers, with a content of `True`.
+              Otherwise, the content is `False` if it has none, or an empty list on error.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/question/{id}/answers/',
+        response: requests.Response = self.__http.get(
+            self.__base_url() + f'/question/{id}/answers',
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -213,7 +306,10 @@ class BackendService():
         )
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(True)
+        elif response.status_code == HTTPStatus.NOT_FOUND.value:
+            # A question without answers is not an error
+            response_data.set_content(False)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -232,7 +328,7 @@ class BackendService():
         """
 
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.post(
+        response: requests.Response = self.__http.post(
             self.__base_url() + f'/question/{id}/answer/{username}',
             json={
                 'username': username,
@@ -251,19 +347,24 @@ class BackendService():
             response_data.add_message(response.content.decode('ascii'))
         return response_data
 
-    def list_all_for_question(self, token: Optional[str], id: int) -> ResponseData:
-        """ Requests a list of answers for a certain question.
+    def answer_questions(self, token: Optional[str], username: str,
+                         answers: List[Tuple[int, int]]) -> ResponseData:
+        """ Requests answering several questions at once.
 
         Args:
-            token (Optional[str]): The user session token.
+            - token (Optional[str]): The user session token.
+            - username (str): The user answering the questions.
+            - answers (List[Tuple[int, int]]): The question id and the selected option of each
+              answer.
 
         Returns:
-            - ResponseData: If successful, the contents hold a list of question data dictionaries.
-              Otherwise, the contents will be an empty list.
+            - ResponseData: If successful, the contents hold a list with the data and result
+              (`status` and, on error, `message`) of each answer.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{id}',
+        response: requests.Response = self.__http.post(
+            self.__base_url() + f'/questions/{username}/answers',
+            json=[{'id': id, 'number': number} for id, number in answers],
             headers={
                 'Authorization': f'Bearer {token}',
                 self.__apikey_header: self.__apikey_secret
@@ -277,6 +378,18 @@ class BackendService():
             response_data.set_content([])
         return response_data
 
+    def list_all_for_question(self, token: Optional[str], id: int) -> ResponseData:
+        """ Requests a list of answers for a certain question.
+
+        Args:
+            token (Optional[str]): The user session token.
+
+        Returns:
+            - ResponseData: If successful, the contents hold a list of question data dictionaries.
+              Otherwise, the contents will be an empty list.
+        """
+        return self.__get_pages(token, f'/answers/{id}')
+
     def list_all_for_user(self, token: Optional[str], username: str) -> ResponseData:
         """ Requests a list of answers for a certain user.
 
@@ -288,21 +401,7 @@ class BackendService():
             - ResponseData: If successful, the contents hold a list of question data dictionaries.
               Otherwise, the contents will be an empty list.
         """
-        response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/answers/{username}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
-        response_data.set_successful(response.ok)
-        if response_data.is_successful():
-            response_data.set_content(response.json())
-        else:
-            response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
-        return response_data
+        return self.__get_pages(token, f'/answers/{username}')
 
     def edit_question(self, token: Optional[str], id: int, title: str,  body: str, option1: str, option2: str, option3: str,
              correct_answer: int, punctuation: float, penalty: float) -> ResponseData:
@@ -323,7 +422,7 @@ class BackendService():
             - ResponseData: If successful, the contents hold the new question's data.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.put(
+        response: requests.Response = self.__http.put(
             self.__base_url() + f'/question/{id}',
             json={
                 'id': id,
@@ -359,7 +458,7 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
+        response: requests.Response = self.__http.get(
             self.__base_url() + f'/question/{id}/answer/{username}',
             headers={
                 'Authorization': f'Bearer {token}',
@@ -387,16 +486,10 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/stats/{username}',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
+        response, content, _ = self.__get(token, f'/stats/{username}')
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -414,16 +507,10 @@ class BackendService():
               Otherwise, the contents will be an empty list.
         """
         response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/stats/questions',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
+        response, content, _ = self.__get(token, '/stats/questions')
         response_data.set_successful(response.ok)
         if response_data.is_successful():
-            response_data.set_content(response.json())
+            response_data.set_content(content)
         else:
             response_data.add_message(response.content.decode('ascii'))
             response_data.set_content([])
@@ -439,18 +526,4 @@ class BackendService():
             - ResponseData: If successful, the contents hold a list of stat data dictionaries.
               Otherwise, the contents will be an empty list.
         """
-        response_data: ResponseData = ResponseData()
-        response: requests.Response = requests.get(
-            self.__base_url() + f'/stats/users',
-            headers={
-                'Authorization': f'Bearer {token}',
-                self.__apikey_header: self.__apikey_secret
-            }
-        )
-        response_data.set_successful(response.ok)
-        if response_data.is_successful():
-            response_data.set_content(response.json())
-        else:
-            response_data.add_message(response.content.decode('ascii'))
-            response_data.set_content([])
-        return response_data
\ No newline at end of file
+        return self.__get_pages(token, '/stats/users')
\ No newline at end of file
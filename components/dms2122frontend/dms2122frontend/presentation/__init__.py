@@ -0,0 +1,4 @@
+""" Frontend presentation-layer classes.
+"""
+
+from .wsgiapp import WSGIApp
@@ -2,9 +2,10 @@
 """
 
 from typing import Text, Union
-from flask import redirect, url_for, session, render_template, request, flash
+from flask import redirect, url_for, session, render_template, request, flash, jsonify
 from werkzeug.wrappers import Response
 from dms2122common.data import Role
+from dms2122common.data.rest import HTTPSession
 from dms2122frontend.data.rest import AuthService
 from .webauth import WebAuth
 from .webuser import WebUser
@@ -45,8 +46,10 @@ class AdminEndpoints():
         if Role.Admin.name not in session['roles']:
             return redirect(url_for('get_home'))
         name = session['user']
+        prefix: str = str(request.args.get('prefix', default=''))
         return render_template('admin/users.html', name=name, roles=session['roles'],
-                               users=WebUser.list_users(auth_service)
+                               users=WebUser.list_users(auth_service, True, prefix or None),
+                               prefix=prefix
                                )
 
     @staticmethod
@@ -140,8 +143,26 @@ class AdminEndpoints():
                                                 request.form['username'],
                                                 request.form.getlist('roles')
                                                 )
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
         redirect_to = request.form['redirect_to']
         if not redirect_to:
             redirect_to = url_for('get_admin_users')
         return redirect(redirect_to)
+
+    @staticmethod
+    def get_admin_http_client(auth_service: AuthService,
+                              http_session: HTTPSession) -> Union[Response, Text]:
+        """ Handles the GET requests to the endpoint with the statistics of the client of the
+        other services (to size its pool).
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - http_session (HTTPSession): The client of the other services.
+
+        Returns:
+            - Union[Response,Text]: The generated response to the request.
+        """
+        if not WebAuth.test_token(auth_service):
+            return redirect(url_for('get_login'))
+        if Role.Admin.name not in session['roles']:
+            return redirect(url_for('get_home'))
+        return jsonify(http_session.stats())
@@ -46,7 +46,7 @@ class SessionEndpoints():
 
         session['user'] = request.form['user']
         session['token'] = response.get_content()
-        session['roles'] = WebUser.get_roles(auth_service, session['user'])
+        session['roles'] = WebUser.get_session_roles(auth_service)
         return redirect(url_for('get_home'))
 
     @staticmethod
@@ -1,7 +1,7 @@
 """ StudentEndpoints class module.
 """
 
-from typing import Text, Union
+from typing import List, Text, Tuple, Union
 from flask import redirect, url_for, session, render_template, request, flash
 from werkzeug.wrappers import Response
 from dms2122common.data import Role
@@ -132,6 +132,37 @@ class StudentEndpoints():
                             questions=WebQuestion.list_pending_for_user(backend_service,name),
                             redirect_to = '/student/questions')
 
+    @staticmethod
+    def post_student_questions_pending(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
+        """ Handles the POST requests to the student's pending questions endpoint.
+
+        Every question with a selected option (`option_<id>` fields) is answered at once.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+            - backend_service (BackendService): The backend service.
+
+        Returns:
+            - Union[Response,Text]: The generated response to the request.
+        """
+        if not WebAuth.test_token(auth_service):
+            return redirect(url_for('get_login'))
+        if Role.Student.name not in session['roles']:
+            return redirect(url_for('get_home'))
+
+        numbers = {'option1': 1, 'option2': 2, 'option3': 3}
+        answers: List[Tuple[int, int]] = []
+        for field, selected in request.form.items():
+            question_id: str = field[len('option_'):]
+            # Fields without a numeric question id are not sent by the form, so they are ignored
+            if field.startswith('option_') and question_id.isdecimal() and selected in numbers:
+                answers.append((int(question_id), numbers[selected]))
+        if not answers:
+            flash('No option was selected', 'error')
+        else:
+            WebAnswer.answer_questions(backend_service, str(session['user']), answers)
+        return redirect(url_for('get_student_questions_pending'))
+
     @staticmethod
     def get_student_questions_pending_answer(auth_service: AuthService, backend_service: BackendService) -> Union[Response, Text]:
         """ Handles the GET requests to the question answering endpoint.
@@ -1,8 +1,8 @@
 """ WebAnswer class module.
 """
 
-from typing import Dict, List, Optional
-from flask import session
+from typing import Dict, List, Optional, Tuple
+from flask import session, flash
 from dms2122common.data.rest import ResponseData
 from dms2122frontend.data.rest.backendservice import BackendService
 from .webutils import WebUtils
@@ -29,6 +29,32 @@ class WebAnswer():
         WebUtils.flash_response_messages(response)
         return response.get_content()
 
+    @staticmethod
+    def answer_questions(backend_service: BackendService, username: str,
+                         answers: List[Tuple[int, int]]) -> List[Dict]:
+        """ Answers several questions at once in the backend service.
+
+        The answers that could not be stored are reported as flashed error messages.
+
+        Args:
+            - backend_service (BackendService): The backend service.
+            - username (str): Students' username
+            - answers (List[Tuple[int, int]]): The question id and the selected option of each
+              answer.
+
+        Returns:
+            - List[Dict]: A list with the data and result of each answer (empty on error).
+        """
+        response: ResponseData = backend_service.answer_questions(
+            session.get('token'), username, answers
+        )
+        WebUtils.flash_response_messages(response)
+        results: List[Dict] = list(response.get_content() or [])
+        for result in results:
+            if result.get('message'):
+                flash(f"Question {result['id']}: {result['message']}", 'error')
+        return results
+
     @staticmethod
     def list_all_for_question(backend_service: BackendService, id: int) -> Optional[List]:
         """ Gets the list of users from the backend service.
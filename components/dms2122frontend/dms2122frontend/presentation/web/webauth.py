@@ -1,9 +1,11 @@
 """ WebAuth class module.
 """
 
+from typing import List, Optional
 from flask import session
 from dms2122common.data.rest import ResponseData
 from dms2122frontend.data.rest import AuthService
+from .webuser import WebUser
 from .webutils import WebUtils
 
 class WebAuth():
@@ -13,7 +15,8 @@ class WebAuth():
     def test_token(auth_service: AuthService) -> bool:
         """ Tests whether the session token is valid or not against the authentication service.
 
-        If the token is valid, the session token is updated/refreshed.
+        If the token is valid and the service refreshed it, the session token is updated, along
+        with the session roles if the new token claims them.
 
         Args:
             - auth_service (AuthService): The authentication service.
@@ -26,5 +29,10 @@ class WebAuth():
         if not response.is_successful():
             return False
 
-        session['token'] = response.get_content()
+        # Rewriting the session (and thus its cookie) only when needed
+        if response.get_content() != session.get('token'):
+            session['token'] = response.get_content()
+            roles: Optional[List] = WebUser.get_claimed_roles(auth_service)
+            if roles is not None:
+                session['roles'] = roles
         return True
@@ -10,7 +10,14 @@ from .webutils import WebUtils
 
 class WebQuestion():
     """ Monostate class responsible of the question operation utilities.
+
+    The listings only request the question fields shown by their templates.
     """
+
+    CATALOGUE_FIELDS: List[str] = ['title']
+    PENDING_FIELDS: List[str] = ['title', 'body', 'option1', 'option2', 'option3']
+    ANSWERED_FIELDS: List[str] = ['title']
+
     @staticmethod
     def list_questions(backend_service: BackendService) -> List:
         """ Gets the list of questions from the backend service.
@@ -21,7 +28,9 @@ class WebQuestion():
         Returns:
             - List: A list of question data dictionaries (the list may be empty)
         """
-        response: ResponseData = backend_service.list_questions(session.get('token'))
+        response: ResponseData = backend_service.list_questions(
+            session.get('token'), WebQuestion.CATALOGUE_FIELDS
+        )
         WebUtils.flash_response_messages(response)
         if response.get_content() is not None and isinstance(response.get_content(), list):
             return list(response.get_content())
@@ -38,7 +47,9 @@ class WebQuestion():
         Returns:
             - List: A list of question data dictionaries (the list may be empty)
         """
-        response: ResponseData = backend_service.list_pending_for_user(session.get('token'), username)
+        response: ResponseData = backend_service.list_pending_for_user(
+            session.get('token'), username, WebQuestion.PENDING_FIELDS
+        )
         WebUtils.flash_response_messages(response)
         if response.get_content() is not None and isinstance(response.get_content(), list):
             return list(response.get_content())
@@ -55,7 +66,9 @@ class WebQuestion():
         Returns:
             - List: A list of question data dictionaries (the list may be empty)
         """
-        response: ResponseData = backend_service.list_answered_for_user(session.get('token'), username)
+        response: ResponseData = backend_service.list_answered_for_user(
+            session.get('token'), username, WebQuestion.ANSWERED_FIELDS
+        )
         WebUtils.flash_response_messages(response)
         if response.get_content() is not None and isinstance(response.get_content(), list):
             return list(response.get_content())
@@ -12,16 +12,20 @@ class WebUser():
     """ Monostate class responsible of the user operation utilities.
     """
     @staticmethod
-    def list_users(auth_service: AuthService) -> List:
+    def list_users(auth_service: AuthService, roles: bool = False,
+                   prefix: Optional[str] = None) -> List:
         """ Gets the list of users from the authentication service.
 
         Args:
             - auth_service (AuthService): The authentication service.
+            - roles (bool): Whether the roles of each user are included (in the `roles` key).
+            - prefix (Optional[str]): If given, only the users whose name starts with it are
+              listed.
 
         Returns:
             - List: A list of user data dictionaries (the list may be empty)
         """
-        response: ResponseData = auth_service.list_users(session.get('token'))
+        response: ResponseData = auth_service.list_users(session.get('token'), roles, prefix)
         WebUtils.flash_response_messages(response)
         if response.get_content() is not None and isinstance(response.get_content(), list):
             return list(response.get_content())
@@ -63,10 +67,48 @@ class WebUser():
             return list(response.get_content())
         return []
 
+    @staticmethod
+    def get_claimed_roles(auth_service: AuthService) -> Optional[List]:
+        """ Gets the list of roles claimed by the session token.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+
+        Returns:
+            - Optional[List]: A list of role names, or `None` if the token cannot be verified
+              locally or does not claim the session user's roles.
+        """
+        claims: Optional[Dict] = auth_service.verify_token(session.get('token'))
+        if claims is None or claims['user'] != session.get('user') \
+                or not isinstance(claims.get('roles'), list):
+            return None
+        return list(claims['roles'])
+
+    @staticmethod
+    def get_session_roles(auth_service: AuthService) -> List:
+        """ Gets the list of roles granted to the session user.
+
+        The roles claimed by the session token are used when available; otherwise, they are
+        requested to the authentication service.
+
+        Args:
+            - auth_service (AuthService): The authentication service.
+
+        Returns:
+            - List: A list of role names on success. On error, the list will be empty.
+        """
+        roles: Optional[List] = WebUser.get_claimed_roles(auth_service)
+        if roles is not None:
+            return roles
+        return WebUser.get_roles(auth_service, session['user'])
+
     @staticmethod
     def update_user_roles(auth_service: AuthService, username: str, roles: List) -> bool:
         """ Updates the user roles in the authentication service.
 
+        If the session user's roles were updated, the session roles are updated too, and the
+        session token is replaced by the one reissued by the authentication service.
+
         Args:
             - auth_service (AuthService): The authentication service.
             - username (str): The user with the roles updated.
@@ -79,4 +121,10 @@ class WebUser():
         response: ResponseData = auth_service.update_user_roles(
             session.get('token'), username, roles)
         WebUtils.flash_response_messages(response)
-        return response.is_successful()
+        if not response.is_successful():
+            return False
+        if response.get_content()['token']:
+            session['token'] = response.get_content()['token']
+        if username == session.get('user'):
+            session['roles'] = response.get_content()['roles']
+        return True
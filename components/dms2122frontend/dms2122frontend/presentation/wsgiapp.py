@@ -0,0 +1,180 @@
+""" WSGIApp class module.
+"""
+
+import inspect
+import os
+from typing import Dict, Optional
+from flask import Flask
+import dms2122frontend
+from dms2122common.data.rest import HTTPSession, TokenVerifier
+from dms2122frontend.data.config import FrontendConfiguration
+from dms2122frontend.data.rest import AuthService
+from dms2122frontend.data.rest.backendservice import BackendService
+from dms2122frontend.presentation.web import \
+    AdminEndpoints, CommonEndpoints, SessionEndpoints, StudentEndpoints, TeacherEndpoints
+
+
+class WSGIApp():
+    """ Monostate class creating the WSGI application of the service.
+    """
+
+    @staticmethod
+    def create(cfg: FrontendConfiguration) -> Flask:
+        """ Creates the application.
+
+        Args:
+            - cfg (FrontendConfiguration): The service configuration.
+
+        Returns:
+            - Flask: The WSGI application.
+        """
+        # Both clients share the pool of connections
+        http_session: HTTPSession = HTTPSession(cfg.get_http_client())
+        auth_service_cfg: Dict = cfg.get_auth_service()
+        # With the secret of the authentication service, the tokens are verified locally
+        token_verifier: Optional[TokenVerifier] = None
+        if auth_service_cfg.get('jws_secret'):
+            token_verifier = TokenVerifier(auth_service_cfg['jws_secret'])
+        auth_service: AuthService = AuthService(
+            auth_service_cfg['host'], auth_service_cfg['port'],
+            apikey_header='X-ApiKey-Auth',
+            apikey_secret=auth_service_cfg['apikey_secret'],
+            http_session=http_session,
+            token_verifier=token_verifier,
+            refresh_margin=cfg.get_token_refresh_margin()
+        )
+        backend_service_cfg: Dict = cfg.get_backend_service()
+        backend_service: BackendService = BackendService(
+            backend_service_cfg['host'], backend_service_cfg['port'],
+            apikey_header='X-ApiKey-Backend',
+            apikey_secret=backend_service_cfg['apikey_secret'],
+            http_session=http_session
+        )
+
+        app = Flask(
+            __name__,
+            static_folder=os.path.dirname(
+                inspect.getfile(dms2122frontend)) + '/static',
+            template_folder=os.path.dirname(
+                inspect.getfile(dms2122frontend)) + '/templates'
+        )
+        app.secret_key = bytes(cfg.get_app_secret_key(), 'ascii')
+
+        @app.route("/login", methods=['GET'])
+        def get_login():
+            return SessionEndpoints.get_login(auth_service)
+
+        @app.route("/login", methods=['POST'])
+        def post_login():
+            return SessionEndpoints.post_login(auth_service)
+
+        @app.route("/logout", methods=['GET'])
+        def get_logout():
+            return SessionEndpoints.get_logout()
+
+        @app.route("/home", methods=['GET'])
+        def get_home():
+            return CommonEndpoints.get_home(auth_service)
+
+        @app.route("/student", methods=['GET'])
+        def get_student():
+            return StudentEndpoints.get_student(auth_service)
+
+        @app.route("/student/questions", methods=['GET'])
+        def get_student_questions():
+            return StudentEndpoints.get_student_questions(auth_service)
+
+        @app.route("/student/questions/answered", methods=['GET'])
+        def get_student_questions_answers():
+            return StudentEndpoints.get_student_questions_answered(auth_service, backend_service)
+
+        @app.route("/student/questions/answered/view", methods=['GET'])
+        def get_student_questions_answers_view():
+            return StudentEndpoints.get_student_questions_answered_view(auth_service, backend_service)
+
+        @app.route("/student/questions/pending", methods=['GET'])
+        def get_student_questions_pending():
+            return StudentEndpoints.get_student_questions_pending(auth_service, backend_service)
+
+        @app.route("/student/questions/pending", methods=['POST'])
+        def post_student_questions_pending():
+            return StudentEndpoints.post_student_questions_pending(auth_service, backend_service)
+
+        @app.route("/student/questions/pending/answer", methods=['GET'])
+        def get_student_questions_pending_answer():
+            return StudentEndpoints.get_student_questions_pending_answer(auth_service, backend_service)
+
+        @app.route("/student/questions/pending/answer", methods=['POST'])
+        def post_student_questions_pending_answer():
+            return StudentEndpoints.post_student_questions_pending_answer(auth_service, backend_service)
+
+        @app.route("/student/progress", methods=['GET'])
+        def get_student_progress():
+            return StudentEndpoints.get_student_progress(auth_service, backend_service)
+
+
+        @app.route("/teacher", methods=['GET'])
+        def get_teacher():
+            return TeacherEndpoints.get_teacher(auth_service)
+
+        @app.route("/teacher/questions", methods=['GET'])
+        def get_teacher_questions():
+            return TeacherEndpoints.get_teacher_questions(auth_service, backend_service)
+
+        @app.route("/teacher/questions/new", methods=['GET'])
+        def get_teacher_questions_new():
+            return TeacherEndpoints.get_teacher_questions_new(auth_service, backend_service)
+
+        @app.route("/teacher/questions/new", methods=['POST'])
+        def post_teacher_questions_new():
+            return TeacherEndpoints.post_teacher_questions_new(auth_service,backend_service)
+
+        @app.route("/teacher/questions/edit", methods=['GET'])
+        def get_teacher_questions_edit():
+            return TeacherEndpoints.get_teacher_questions_edit(auth_service,backend_service)
+
+        @app.route("/teacher/questions/edit", methods=['POST'])
+        def post_teacher_questions_edit():
+            return TeacherEndpoints.post_teacher_questions_edit(auth_service,backend_service)
+
+        @app.route("/teacher/questions/preview", methods=['GET'])
+        def get_teacher_questions_preview():
+            return TeacherEndpoints.get_teacher_questions_preview(auth_service,backend_service)
+
+        @app.route("/teacher/questions/stats", methods=['GET'])
+        def get_teacher_questions_stats():
+            return TeacherEndpoints.get_teacher_questions_stats(auth_service,backend_service)
+
+        @app.route("/teacher/students", methods=['GET'])
+        def get_teacher_students():
+            return TeacherEndpoints.get_teacher_students(auth_service, backend_service)
+
+        @app.route("/admin", methods=['GET'])
+        def get_admin():
+            return AdminEndpoints.get_admin(auth_service)
+
+        @app.route("/admin/users", methods=['GET'])
+        def get_admin_users():
+            return AdminEndpoints.get_admin_users(auth_service)
+
+        @app.route("/admin/users/new", methods=['GET'])
+        def get_admin_users_new():
+            return AdminEndpoints.get_admin_users_new(auth_service)
+
+        @app.route("/admin/users/new", methods=['POST'])
+        def post_admin_users_new():
+            return AdminEndpoints.post_admin_users_new(auth_service)
+
+        @app.route("/admin/users/edit", methods=['GET'])
+        def get_admin_users_edit():
+            return AdminEndpoints.get_admin_users_edit(auth_service)
+
+        @app.route("/admin/users/edit", methods=['POST'])
+        def post_admin_users_edit():
+            return AdminEndpoints.post_admin_users_edit(auth_service)
+
+        @app.route("/admin/http-client", methods=['GET'])
+        def get_admin_http_client():
+            return AdminEndpoints.get_admin_http_client(auth_service, http_session)
+
+        return app
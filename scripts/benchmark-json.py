@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+""" Benchmarks the serialization of the question listings of the backend.
+
+Compares the previous path (dictionaries built field by field from `Question` records and
+serialized by the default connexion jsonifier, i.e., `flask.json` with indentation) with the
+current one (`WireFormat` on the plain rows of the listings and `JSONCodec`, with each of the
+available backends).
+
+Usage: scripts/benchmark-json.py [N_QUESTIONS] [REPEATS]
+"""
+
+import sys
+import timeit
+from typing import Callable, Dict, List, Tuple
+import flask
+from connexion.apps.flask_app import FlaskJSONEncoder
+from connexion.jsonifier import Jsonifier
+from dms2122common.data.rest import JSONCodec
+from dms2122backend.data.db.results import Question
+from dms2122backend.service import WireFormat
+
+
+def build_rows(n_questions: int) -> List[Tuple[Question, bool]]:
+    rows: List[Tuple[Question, bool]] = []
+    for number in range(1, n_questions + 1):
+        question = Question(
+            'Question ' + str(number), 'Body of the question number ' + str(number) + '?',
+            'First option', 'Second option', 'Third option', number % 3 + 1, 1.0, 0.25
+        )
+        question.id = number  # type: ignore
+        rows.append((question, number % 2 == 0))
+    return rows
+
+
+def legacy(rows: List[Tuple[Question, bool]], jsonifier: Jsonifier) -> str:
+    out: List[Dict] = []
+    for question, answered in rows:
+        out.append({
+            'id': question.id,  # type: ignore
+            'title': question.title,
+            'body': question.body,
+            'option1': question.option1,
+            'option2': question.option2,
+            'option3': question.option3,
+            'correct_answer': question.correct_answer,
+            'punctuation': question.punctuation,
+            'penalty': question.penalty,
+            'answered': answered
+        })
+    return jsonifier.dumps(out)
+
+
+def current(rows: List[Tuple], jsonifier: Jsonifier) -> str:
+    return jsonifier.dumps(WireFormat.questions(rows, ('answered',)))
+
+
+def measure(function: Callable[[], str], repeats: int) -> Tuple[float, int]:
+    size: int = len(function())
+    return min(timeit.repeat(function, number=1, repeat=repeats)), size
+
+
+if __name__ == '__main__':
+    n_questions: int = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    repeats: int = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    rows = build_rows(n_questions)
+    # The listings now read plain rows instead of records
+    plain_rows: List[Tuple] = [
+        tuple(getattr(question, field) for field in WireFormat.QUESTION_FIELDS) + (answered,)
+        for question, answered in rows
+    ]
+
+    app = flask.Flask(__name__)
+    app.json_encoder = FlaskJSONEncoder
+    with app.app_context():
+        results: List[Tuple[str, float, int]] = []
+        seconds, size = measure(lambda: legacy(rows, Jsonifier(flask.json, indent=2)), repeats)
+        results.append(('flask.json (previous)', seconds, size))
+        for backend in JSONCodec.BACKENDS[::-1]:
+            JSONCodec.configure(backend)
+            seconds, size = measure(lambda: current(plain_rows, Jsonifier(JSONCodec)), repeats)
+            results.append(('JSONCodec ' + backend, seconds, size))
+
+    print(f'{n_questions} questions, best of {repeats} runs')
+    baseline: float = results[0][1]
+    for name, seconds, size in results:
+        print(f'{name:24} {seconds * 1000:9.1f} ms {size / 1024:10.0f} KiB '
+              f'{baseline / seconds:6.1f}x')